@@ -5,13 +5,40 @@ containers (``Result``, ``Maybe``, ``IO``) together with the pipeline
 and iterable helpers. They are measured by CodSpeed in CI.
 """
 
-from returns.io import IO
-from returns.iterables import Fold
+import timeit
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from functools import partial
+from inspect import Parameter, signature
+from typing import TypeVar
+
+import anyio
+import pytest
+
+from returns.bulkhead import Bulkhead
+from returns.cache import LFU, LRU, TTL
+from returns.context import (
+    RequiresContextFutureResult,
+    RequiresContextResult,
+    memoized_scope,
+)
+from returns.curry import curry
+from returns.future import (
+    Future,
+    FutureResult,
+    InMemoryBatch,
+    future_batch,
+    future_cache,
+)
+from returns.io import IO, IOFailure, IOResult, IOSuccess
+from returns.iterables import Fold, parallel_traverse
 from returns.maybe import Maybe, Nothing, Some
-from returns.pipeline import flow
-from returns.pointfree import bind, map_
+from returns.pipeline import compile_pipe, flow, pipe
+from returns.pointfree import bind, bind_awaitable, map_
 from returns.result import Failure, Result, Success, safe
 
+_AwaitedType = TypeVar('_AwaitedType')
+
 
 def _increment(value: int) -> int:
     return value + 1
@@ -71,6 +98,46 @@ def test_maybe_do_notation(benchmark) -> None:
     assert benchmark(run) == Some(3)
 
 
+def test_result_do_notation_failure(benchmark) -> None:
+    """Halt ``.do`` notation on a failed ``Result`` with exception payload."""
+    error = ValueError('boom')
+
+    def run() -> Result[int, ValueError]:
+        return Result.do(
+            first + second for first in Success(1) for second in Failure(error)
+        )
+
+    assert benchmark(run) == Failure(error)
+
+
+def test_maybe_do_notation_nothing(benchmark) -> None:
+    """Halt ``.do`` notation on ``Nothing``."""
+
+    def run() -> Maybe[int]:
+        return Maybe.do(
+            first + second for first in Some(1) for second in Nothing
+        )
+
+    assert benchmark(run) == Nothing
+
+
+def test_ioresult_do_notation(benchmark) -> None:
+    """Compose successful and failed ``IOResult`` through ``.do`` notation."""
+
+    def run() -> tuple[IOResult[int, str], IOResult[int, str]]:
+        success = IOResult.do(
+            first + second for first in IOSuccess(1) for second in IOSuccess(2)
+        )
+        failure = IOResult.do(
+            first + second
+            for first in IOSuccess(1)
+            for second in IOFailure('a')
+        )
+        return success, failure
+
+    assert benchmark(run) == (IOSuccess(3), IOFailure('a'))
+
+
 def test_result_failure_lash(benchmark) -> None:
     """Recover from a failure using ``.lash`` and ``.value_or``."""
     value = 42
@@ -145,6 +212,97 @@ def test_flow_pipeline(benchmark) -> None:
     assert benchmark(run) == Success(4)
 
 
+_PIPELINE_STEPS = (
+    map_(_increment),
+    map_(_increment),
+    bind(_as_success),
+    map_(_increment),
+    map_(_increment),
+    map_(_increment),
+    bind(_as_success),
+    map_(_increment),
+    map_(_increment),
+    map_(_increment),
+)
+
+
+@pytest.mark.parametrize('pipeline_factory', [pipe, compile_pipe])
+def test_pipe_pipeline(benchmark, pipeline_factory) -> None:
+    """A reused 10-step pipeline: plain ``pipe`` against ``compile_pipe``."""
+    pipeline = pipeline_factory(*_PIPELINE_STEPS)
+
+    def run() -> Result[int, str]:
+        return pipeline(Success(0))
+
+    assert benchmark(run) == Success(10)
+
+
+def _two_args(first: int, second: int) -> tuple[int, ...]:
+    return (first, second)
+
+
+def _four_args(
+    first: int,
+    second: int,
+    third: int,
+    fourth: int,
+) -> tuple[int, ...]:
+    return (first, second, third, fourth)
+
+
+def _eight_args(  # noqa: WPS211
+    first: int,
+    second: int,
+    third: int,
+    fourth: int,
+    fifth: int,
+    sixth: int,
+    seventh: int,
+    eighth: int,
+) -> tuple[int, ...]:
+    return (first, second, third, fourth, fifth, sixth, seventh, eighth)  # noqa: WPS227
+
+
+def _with_kwargs(function: Callable[..., object]) -> Callable[..., object]:
+    """Adds ``**kwargs`` to the signature, so ``inspect`` is used to bind."""
+    original = signature(function)
+    wrapped = partial(function)
+    wrapped.__signature__ = original.replace(  # type: ignore[attr-defined]
+        parameters=[
+            *original.parameters.values(),
+            Parameter('kwargs', Parameter.VAR_KEYWORD),
+        ],
+    )
+    return wrapped
+
+
+@pytest.mark.parametrize(
+    'function',
+    [_two_args, _four_args, _eight_args],
+)
+@pytest.mark.parametrize('binding', ['plan', 'signature'])
+def test_curry_calls(benchmark, function, binding: str) -> None:
+    """
+    Call a curried function with all args and with one arg at a time.
+
+    Functions with ``**kwargs`` are bound with ``inspect.Signature``,
+    just like all curried functions were before.
+    """
+    curried = curry(
+        _with_kwargs(function) if binding == 'signature' else function,
+    )
+    arity = len(signature(function).parameters)
+
+    def run() -> tuple[object, object]:
+        step = curried
+        for number in range(arity):
+            step = step(number)
+        return curried(*range(arity)), step
+
+    expected = tuple(range(arity))
+    assert benchmark(run) == (expected, expected)
+
+
 def test_fold_collect_results(benchmark) -> None:
     """Fold an iterable of ``Result`` values into a single container."""
     items = [Success(index) for index in range(100)]
@@ -153,3 +311,318 @@ def test_fold_collect_results(benchmark) -> None:
         return Fold.collect(items, Success(()))
 
     assert benchmark(run) == Success(tuple(range(100)))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000, 100_000])
+def test_fold_collect_scaling(benchmark, size: int) -> None:
+    """Collecting ``n`` values must be linear in ``n``, not quadratic."""
+    items = [Success(index) for index in range(size)]
+
+    def run() -> Result[tuple[int, ...], str]:
+        return Fold.collect(items, Success(()))
+
+    assert benchmark(run) == Success(tuple(range(size)))
+
+
+@pytest.mark.parametrize(
+    ('length', 'max_ratio'),
+    [
+        # Linear growth gives a ratio close to 10, quadratic one close to 100:
+        (10_000, 30),
+    ],
+)
+def test_fold_collect_grows_linearly(length: int, max_ratio: int) -> None:
+    """Ten times more values must take far less than 100 times longer."""
+
+    def best_time(items: list[Result[int, str]]) -> float:
+        return min(
+            timeit.repeat(
+                lambda: Fold.collect(items, Success(())),
+                number=1,
+                repeat=5,
+            ),
+        )
+
+    small = best_time([Success(index) for index in range(length)])
+    large = best_time([Success(index) for index in range(length * 10)])
+    assert large / small < max_ratio
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000, 100_000])
+def test_fold_collect_all_scaling(benchmark, size: int) -> None:
+    """Skipping failed values does not change the linear cost."""
+    items = [
+        Success(index) if index % 2 else Failure(index) for index in range(size)
+    ]
+
+    def run() -> Result[tuple[int, ...], str]:
+        return Fold.collect_all(items, Success(()))
+
+    assert benchmark(run) == Success(tuple(range(1, size, 2)))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000, 100_000])
+def test_fold_traverse_scaling(benchmark, size: int) -> None:
+    """Map and collect in one pass without intermediate containers list."""
+    items = range(size)
+
+    def run() -> Result[tuple[int, ...], str]:
+        return Fold.traverse(items, Success, Success(()))
+
+    assert benchmark(run) == Success(tuple(items))
+
+
+def _await(awaitable: Awaitable[_AwaitedType]) -> _AwaitedType:
+    """Awaits without an event loop, chains below never suspend."""
+    generator = awaitable.__await__()
+    try:
+        generator.send(None)
+    except StopIteration as exc:
+        return exc.value  # type: ignore[no-any-return]
+    raise RuntimeError('Awaitable has suspended')
+
+
+async def _async_identity(value: int) -> int:  # noqa: RUF029
+    return value
+
+
+def _as_future(value: int) -> Future[int]:
+    return Future.from_value(value + 1)
+
+
+def _as_future_success(value: int) -> FutureResult[int, str]:
+    return FutureResult.from_value(value + 1)
+
+
+def _future_chain(steps: int) -> Future[int]:
+    container = Future(_async_identity(0))
+    for _ in range(steps // 2):
+        container = container.map(_increment).bind(_as_future)
+    return container
+
+
+def _future_result_chain(steps: int) -> FutureResult[int, str]:
+    container: FutureResult[int, str] = FutureResult.from_future(
+        Future(_async_identity(0)),
+    )
+    for _ in range(steps // 2):
+        container = container.map(_increment).bind(_as_future_success)
+    return container
+
+
+def _traced_peak(function: Callable[[], object]) -> int:
+    """Returns the peak memory allocated while ``function`` runs."""
+    tracemalloc.start()
+    try:  # noqa: WPS501
+        function()
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.parametrize('steps', [10, 100, 1_000])
+def test_future_chain_await(benchmark, steps: int) -> None:
+    """Await a chain of ``Future.map`` and ``.bind`` steps."""
+    assert benchmark(lambda: _await(_future_chain(steps))) == IO(steps)
+
+
+@pytest.mark.parametrize('steps', [10, 100, 1_000])
+def test_future_result_chain_await(benchmark, steps: int) -> None:
+    """Await a chain of ``FutureResult.map`` and ``.bind`` steps."""
+    assert benchmark(
+        lambda: _await(_future_result_chain(steps)),
+    ) == IOSuccess(steps)
+
+
+@pytest.mark.parametrize('chain', [_future_chain, _future_result_chain])
+@pytest.mark.parametrize('length', [100, 1_000])
+def test_chain_await_memory(
+    chain: Callable[[int], Awaitable[object]],
+    length: int,
+) -> None:
+    """
+    Awaiting a chain takes less memory than the chain itself.
+
+    Nested coroutines keep a frame for each step while awaiting,
+    so their peak was about twice as big as the created chain.
+    """
+    containers: list[Awaitable[object]] = []
+    built = _traced_peak(lambda: containers.append(chain(length)))
+    assert _traced_peak(partial(_await, containers[0])) < built
+
+
+def test_future_result_resolved(benchmark) -> None:
+    """Already resolved ``FutureResult`` values, like cache hits."""
+
+    def run() -> IOResult[int, str]:
+        container: FutureResult[int, str] = FutureResult.from_value(0)
+        for _ in range(100):
+            container = container.bind(_as_future_success)
+        return _await(container)
+
+    assert benchmark(run) == IOSuccess(100)
+
+
+@pytest.mark.parametrize('length', [100, 1_000])
+def test_fold_collect_concurrently(benchmark, length: int) -> None:
+    """Collect pending ``FutureResult`` values with bounded concurrency."""
+
+    def run() -> IOResult[tuple[int, ...], str]:
+        items = [
+            FutureResult.from_future(Future(_async_identity(index)))
+            for index in range(length)
+        ]
+        collected: FutureResult[tuple[int, ...], str] = (
+            Fold.collect_concurrently(items, FutureResult.from_value(()), 100)
+        )
+        return anyio.run(collected.awaitable)
+
+    assert benchmark(run) == IOSuccess(tuple(range(length)))
+
+
+def test_future_cache_hits(benchmark) -> None:
+    """Await cached ``FutureResult`` values for the same arguments."""
+    cached = future_cache()(_as_future_success)
+
+    async def run() -> list[IOResult[int, str]]:
+        # Cached computations run in their own tasks, so we need a loop:
+        return [
+            await cached(index % 10)  # noqa: WPS476
+            for index in range(100)
+        ]
+
+    assert benchmark(anyio.run, run)[-1] == IOSuccess(10)
+
+
+def test_future_batch_collect(benchmark) -> None:
+    """Collect ``FutureResult`` values of keys loaded in a single batch."""
+    users = InMemoryBatch(dict.fromkeys(range(100), 'user'))
+    fetch = future_batch(str)(users)
+
+    def run() -> IOResult[tuple[str, ...], str]:
+        collected: FutureResult[tuple[str, ...], str] = Fold.collect(
+            [fetch(index) for index in range(100)],
+            FutureResult.from_value(()),
+        )
+        return anyio.run(collected.awaitable)
+
+    assert benchmark(run) == IOSuccess(('user',) * 100)
+
+
+@pytest.mark.parametrize('limited', [False, True])
+def test_bind_awaitable_limiter(benchmark, limited: bool) -> None:  # noqa: FBT001
+    """Await ``bind_awaitable`` steps with and without a bulkhead."""
+    step = bind_awaitable(_async_identity)
+    if limited:
+        step = bind_awaitable(_async_identity, limiter=Bulkhead(10))
+
+    async def factory() -> list[IOResult[int, str]]:
+        return [
+            await step(FutureResult.from_value(index))  # noqa: WPS476
+            for index in range(100)
+        ]
+
+    assert benchmark(anyio.run, factory) == [
+        IOSuccess(index) for index in range(100)
+    ]
+
+
+@pytest.mark.parametrize('policy', [None, LRU, LFU, partial(TTL, 60)])
+def test_safe_cache_hits(benchmark, policy) -> None:
+    """Call ``@safe`` parser with repeated inputs, with and without cache."""
+    parse = safe(int)
+    if policy is not None:
+        parse = safe(cache=policy())(int)
+    inputs = [str(index % 100) for index in range(1_000)]
+
+    def run() -> list[Result[int, Exception]]:
+        return [parse(number) for number in inputs]
+
+    expected = [Success(int(number)) for number in inputs]
+    assert benchmark(run) == expected
+
+
+@pytest.mark.parametrize('chunksize', [1, 100])
+def test_parallel_traverse_chunks(benchmark, chunksize: int) -> None:
+    """Traverse items in a thread pool with different chunk sizes."""
+    items = [str(index) for index in range(1_000)]
+
+    def run() -> list[Result[int, Exception]]:
+        return list(
+            parallel_traverse(
+                int,
+                items,
+                executor='thread',
+                chunksize=chunksize,
+            )
+        )
+
+    assert len(benchmark(run)) == len(items)
+
+
+@pytest.mark.parametrize('steps', [10, 100, 1_000])
+def test_requires_context_result_chain_call(benchmark, steps: int) -> None:
+    """Calling a prepared ``RequiresContextResult`` chain with new deps."""
+    container: RequiresContextResult[int, str, int] = (
+        RequiresContextResult.ask()
+    )
+    for index in range(steps):
+        if index % 2:
+            container = container.map(_increment)
+        else:
+            container = container.bind_result(_as_success)
+
+    assert benchmark(container, 0) == Success(steps)
+
+
+def _with_shared(
+    shared: RequiresContextResult[int, str, int],
+    number: int,
+) -> RequiresContextResult[int, str, int]:
+    return shared.map(number.__add__)
+
+
+def test_requires_context_result_memoize(benchmark) -> None:
+    """Several branches of a program that use one memoized container."""
+    shared: RequiresContextResult[int, str, int] = RequiresContextResult(
+        _as_success,
+    ).memoize()
+    container = shared
+    steps = 10
+    for _ in range(steps):
+        container = container.bind(partial(_with_shared, shared))
+
+    assert benchmark(_in_memoized_scope, container, 0) == Success(steps + 1)
+
+
+def _in_memoized_scope(
+    container: RequiresContextResult[int, str, int],
+    deps: int,
+) -> Result[int, str]:
+    with memoized_scope():
+        return container(deps)
+
+
+@pytest.mark.parametrize('count', [10, 30])
+@pytest.mark.parametrize('compiled', [False, True])
+def test_requires_context_future_result_call(
+    benchmark,
+    count: int,
+    compiled: bool,  # noqa: FBT001
+) -> None:
+    """Calling a prepared ``RequiresContextFutureResult`` with new deps."""
+    program: RequiresContextFutureResult[int, str, int] = (
+        RequiresContextFutureResult.ask()
+    )
+    for index in range(count):
+        if index % 2:
+            program = program.map(_increment)
+        else:
+            program = program.bind_result(_as_success)
+
+    if compiled:
+        run = program.compile()
+        assert benchmark(lambda: _await(run(0))) == Success(count)
+    else:
+        assert benchmark(lambda: _await(program(0))) == IOSuccess(count)
@@ -0,0 +1,17 @@
+from collections.abc import Hashable
+from typing import Any, Final
+
+#: Separates positional and keyword arguments in cache keys.
+_kwargs_mark: Final = object()
+
+
+def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """
+    Creates cache key from function's arguments.
+
+    Keyword arguments are part of the key in the passed order,
+    the same way ``functools.lru_cache`` does it.
+    """
+    if not kwargs:
+        return args
+    return (*args, _kwargs_mark, *kwargs.items())
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any, Self, TypeAlias, final
+
+from returns.future import FutureResult
+from returns.result import Result
+
+#: Single operation of a chain, receives the previous value and ``deps``.
+_Step: TypeAlias = Callable[[Any, Any], Any]
+
+#: Async chains also mark steps that return awaitables.
+_AsyncStep: TypeAlias = tuple[_Step, bool]
+
+
+class _Linked(ABC):
+    """
+    Immutable list of steps after a source function of ``deps``.
+
+    Each new step creates a new instance that shares
+    all previous steps with its parent.
+    All steps are collected into a flat tuple once, on the first call.
+    """
+
+    __slots__ = ('_parent', '_source', '_step', '_steps')
+
+    def __init__(
+        self,
+        source: Callable[[Any], Any],
+        parent: _Linked | None,
+        step: Any,
+    ) -> None:
+        self._source = source
+        self._parent = parent
+        self._step = step
+        self._steps: tuple[Any, ...] | None = None
+
+    @abstractmethod
+    def __call__(self, deps: Any) -> Any:
+        """Chains are functions of ``deps``."""
+
+    def __repr__(self) -> str:
+        """Shows the source function and the number of steps."""
+        name = type(self).__name__
+        return f'<{name}: {self._source!r} with {len(self._flatten())} steps>'
+
+    @classmethod
+    def extend(cls, inner_value: Callable[[Any], Any], step: Any) -> Self:
+        """
+        Adds a new step after the passed function of ``deps``.
+
+        When the function is a chain itself, the new chain continues it,
+        otherwise the function becomes a source of a new chain.
+        """
+        if isinstance(inner_value, cls):
+            return cls(
+                inner_value._source,  # noqa: SLF001
+                inner_value,
+                step,
+            )
+        return cls(inner_value, None, step)
+
+    def _flatten(self) -> tuple[Any, ...]:
+        if self._steps is not None:
+            return self._steps
+
+        reversed_steps = []
+        prefix: tuple[Any, ...] = ()
+        chain: _Linked | None = self
+        while chain is not None:
+            if chain._steps is not None:  # noqa: SLF001
+                prefix = chain._steps  # noqa: SLF001
+                break
+            reversed_steps.append(chain._step)  # noqa: SLF001
+            chain = chain._parent  # noqa: SLF001
+
+        reversed_steps.reverse()
+        self._steps = (*prefix, *reversed_steps)
+        self._parent = None  # we don't need parents after flattening
+        return self._steps
+
+
+@final
+class Chain(_Linked):
+    """
+    Function of ``deps`` that calls its source and then runs all its steps.
+
+    Context containers do not wrap each other into new closures:
+    they record their operations as steps of a flat chain instead.
+    Steps are executed in a loop, so the stack depth
+    does not depend on the length of a chain.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, deps: Any) -> Any:
+        """Runs the source function and all steps with the same ``deps``."""
+        inner_value = self._source(deps)
+        for step in self._flatten():
+            inner_value = step(inner_value, deps)
+        return inner_value
+
+
+@final
+class AsyncChain(_Linked):
+    """
+    Function of ``deps`` that returns ``FutureResult`` with all steps.
+
+    The source function returns ``FutureResult``,
+    then all steps work with raw ``Result`` values in a single awaitable,
+    without any intermediate containers.
+    Steps that return awaitables are awaited right away.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, deps: Any) -> FutureResult[Any, Any]:
+        """Calls the source function and returns a lazy container."""
+        return FutureResult(self.evaluate(deps))
+
+    def evaluate(self, deps: Any) -> Awaitable[Result[Any, Any]]:
+        """Calls the source function and returns a raw awaitable."""
+        return _Evaluation(
+            self._source(deps)._inner_value,  # noqa: SLF001
+            self._flatten(),
+            deps,
+        )
+
+
+def then(inner_value: Callable[[Any], Any], step: _Step) -> Chain:
+    """Adds a new step to a sync chain."""
+    return Chain.extend(inner_value, step)
+
+
+def then_async(
+    inner_value: Callable[[Any], Any],
+    step: _Step,
+    *,
+    awaits: bool = False,
+) -> AsyncChain:
+    """Adds a new step to an async chain, it might return an awaitable."""
+    return AsyncChain.extend(inner_value, (step, awaits))
+
+
+def run(container: Any, deps: Any) -> Awaitable[Result[Any, Any]]:
+    """
+    Returns an awaitable with the final ``Result`` of a container.
+
+    Async chains are evaluated directly, without intermediate containers.
+    """
+    function = container._inner_value  # noqa: SLF001
+    if isinstance(function, AsyncChain):
+        return function.evaluate(deps)
+    return function(deps)._inner_value  # type: ignore[no-any-return]  # noqa: SLF001
+
+
+def prepare(
+    function: Callable[[Any], FutureResult[Any, Any]],
+) -> Callable[[Any], Awaitable[Result[Any, Any]]]:
+    """
+    Returns a function of ``deps`` that creates a raw awaitable.
+
+    All steps of async chains are collected right away.
+    """
+    if isinstance(function, AsyncChain):
+        function._flatten()  # noqa: SLF001
+        return function.evaluate
+    return lambda deps: function(deps)._inner_value  # noqa: SLF001
+
+
+@final
+class _Evaluation:
+    """
+    Awaits the first ``Result`` and runs async chain steps over it.
+
+    We use an object instead of a coroutine,
+    so evaluations that are never awaited don't produce warnings.
+    """
+
+    __slots__ = ('_deps', '_first', '_steps')
+
+    def __init__(
+        self,
+        first: Awaitable[Result[Any, Any]],
+        steps: tuple[_AsyncStep, ...],
+        deps: Any,
+    ) -> None:
+        self._first = first
+        self._steps = steps
+        self._deps = deps
+
+    def __await__(  # noqa: WPS611
+        self,
+    ) -> Generator[Any, Any, Result[Any, Any]]:
+        inner_value = yield from self._first.__await__()
+        for step, awaits in self._steps:
+            inner_value = step(inner_value, self._deps)
+            if awaits:
+                inner_value = yield from inner_value.__await__()
+        return inner_value
@@ -0,0 +1,63 @@
+from collections.abc import Callable, Generator, Iterator
+from contextvars import ContextVar
+from typing import Any, Final, Never, TypeVar
+
+from returns.primitives.exceptions import UnwrapFailedError
+
+_ValueType = TypeVar('_ValueType')
+_ContainerType = TypeVar('_ContainerType')
+
+#: Is set while :func:`run_do` executes a do-expression.
+_running: Final[ContextVar[bool]] = ContextVar(
+    'returns_do_notation',
+    default=False,
+)
+
+
+class _HaltedError(UnwrapFailedError):
+    """
+    Ends a do-expression on a failed container.
+
+    Unlike ``.unwrap()`` it does not format or chain anything,
+    and it is still caught as ``UnwrapFailedError`` by user code.
+    """
+
+    __slots__ = ()
+
+
+def halt(container: Any) -> Iterator[Never]:
+    """
+    Iterates over a failed container in a do-expression.
+
+    When :func:`run_do` executes the expression,
+    we raise a cheap private exception that ends the whole expression,
+    including nested loops and generators inside it.
+    Otherwise, it raises ``UnwrapFailedError`` as ``.unwrap()`` does.
+    """
+    if _running.get():
+        raise _HaltedError(container)
+    yield container.unwrap()
+
+
+def run_do(
+    expr: Generator[_ValueType, None, None],
+    from_value: Callable[[_ValueType], _ContainerType],
+    from_halted: Callable[[Any], _ContainerType],
+) -> _ContainerType:
+    """
+    Runs a do-expression and returns its result or the failed container.
+
+    Failed containers are not unwrapped by :func:`halt`,
+    so a failed do-expression does not build and chain exceptions.
+    The state is reset after each expression,
+    so it never leaks into other expressions.
+    """
+    token = _running.set(True)
+    try:
+        inner_value = next(expr)
+    except UnwrapFailedError as exc:
+        # Expression itself can still call `.unwrap()` on a failed container:
+        return from_halted(exc.halted_container)
+    finally:
+        _running.reset(token)
+    return from_value(inner_value)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+from functools import partial
+from typing import TYPE_CHECKING, Any, final
+
+from returns._internal.futures._lazy import Lazy
+from returns.primitives.reawaitable import ReAwaitable
+from returns.result import Failure, Result, Success
+
+if TYPE_CHECKING:
+    from returns.future import FutureResult
+
+#: Function that loads many keys at once.
+_BatchFunction = Callable[[list[Any]], 'FutureResult[Mapping[Any, Any], Any]']
+
+
+@final
+class Batcher:
+    """
+    Collects requested keys into batches.
+
+    Keys are registered when containers are created,
+    so all keys requested before the first ``await`` share one batch.
+    """
+
+    __slots__ = ('_batch', '_function', '_max_size', '_on_missing', '_window')
+
+    def __init__(
+        self,
+        function: _BatchFunction,
+        on_missing: Callable[[Any], Any],
+        max_size: int | None,
+        window: float,
+    ) -> None:
+        self._function = function
+        self._on_missing = on_missing
+        self._max_size = max_size
+        self._window = window
+        self._batch: _Batch | None = None
+
+    def load(self, key: Hashable) -> ReAwaitable[Result[Any, Any]]:
+        """Adds a key to the open batch or to a new one."""
+        batch = self._batch
+        if batch is None or batch.closed:
+            batch = _Batch(self._function, self._max_size, self._window)
+            self._batch = batch
+        return batch.add(key, self._on_missing)
+
+
+@final
+class _Batch:
+    """
+    Single call of a batch function, shared by all its keys.
+
+    It is open until the first caller awaits it and the window is over,
+    or until it has ``max_size`` keys.
+    The same keys share the same result.
+    The call runs in its own task, cancelled callers do not affect it.
+    """
+
+    __slots__ = (
+        '_function',
+        '_keys',
+        '_max_size',
+        '_outcome',
+        '_wake',
+        '_window',
+        'closed',
+    )
+
+    def __init__(
+        self,
+        function: _BatchFunction,
+        max_size: int | None,
+        window: float,
+    ) -> None:
+        self._function = function
+        self._max_size = max_size
+        self._window = window
+        self._keys: dict[Hashable, ReAwaitable[Result[Any, Any]]] = {}
+        self._outcome = ReAwaitable(Lazy(self._dispatch), shared=True)
+        self._wake: Any = None
+        self.closed = False
+
+    def add(
+        self,
+        key: Hashable,
+        on_missing: Callable[[Any], Any],
+    ) -> ReAwaitable[Result[Any, Any]]:
+        """Returns the result of a key from this batch."""
+        picked = self._keys.get(key)
+        if picked is not None:
+            return picked
+
+        picked = self._outcome.map(partial(_pick, key, on_missing))
+        self._keys[key] = picked
+        if len(self._keys) == self._max_size:
+            self.closed = True
+            if self._wake is not None:
+                self._wake.set()
+        return picked
+
+    async def _dispatch(self) -> Result[Mapping[Any, Any], Any]:
+        if not self.closed:
+            await self._wait()
+            self.closed = True
+        return await self._function(list(self._keys))._inner_value  # noqa: SLF001
+
+    async def _wait(self) -> None:
+        """Gives other callers a chance to add their keys."""
+        import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+        if not self._window:
+            await anyio.sleep(0)
+            return
+
+        self._wake = anyio.Event()
+        with anyio.move_on_after(self._window):
+            await self._wake.wait()
+
+
+def _pick(
+    key: Hashable,
+    on_missing: Callable[[Any], Any],
+    outcome: Result[Mapping[Any, Any], Any],
+) -> Result[Any, Any]:
+    """Takes a single key from the result of a batch."""
+    if not isinstance(outcome, Success):
+        return outcome
+    try:
+        inner_value = outcome.unwrap()[key]
+    except KeyError:
+        return Failure(on_missing(key))
+    return Success(inner_value)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any, final
+
+from returns._internal.futures._lazy import Lazy
+from returns.primitives.reawaitable import ReAwaitable
+from returns.result import Result, Success
+
+
+@final
+class _Entry:
+    """Cached computation, it never expires while it is running."""
+
+    __slots__ = ('expires', 'inner_value')
+
+    def __init__(self) -> None:
+        self.expires = math.inf
+        self.inner_value: ReAwaitable[Result[Any, Any]]
+
+
+@final
+class SingleFlight:
+    """
+    LRU cache of running and finished computations by key.
+
+    Computations are stored as ``ReAwaitable`` instances,
+    so all callers of the same key await a single computation.
+    Coroutines are created only when computations are awaited,
+    so evicted and never awaited entries don't produce warnings.
+    It runs in its own task, cancelled callers do not affect it.
+    When it is finished, we set its expiration time:
+    ``Success`` lives for ``ttl`` seconds, ``Failure`` for ``failure_ttl``.
+    Raised exceptions and cancellation are never cached.
+    """
+
+    __slots__ = ('_entries', '_failure_ttl', '_maxsize', '_ttl')
+
+    def __init__(
+        self,
+        maxsize: int | None,
+        ttl: float | None,
+        failure_ttl: float,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = math.inf if ttl is None else ttl
+        self._failure_ttl = failure_ttl
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+    def get(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Result[Any, Any]]],
+    ) -> ReAwaitable[Result[Any, Any]]:
+        """Returns cached computation or starts a new one lazily."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry.inner_value
+
+        entry = _Entry()
+        entry.inner_value = ReAwaitable(
+            Lazy(partial(self._settle, key, entry, compute)),
+            shared=True,
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return entry.inner_value
+
+    async def _settle(
+        self,
+        key: Hashable,
+        entry: _Entry,
+        compute: Callable[[], Awaitable[Result[Any, Any]]],
+    ) -> Result[Any, Any]:
+        try:
+            outcome = await compute()
+        except BaseException:
+            # Callers that come after us should run it again:
+            if self._entries.get(key) is entry:
+                self._entries.pop(key)
+            raise
+        ttl = self._ttl if isinstance(outcome, Success) else self._failure_ttl
+        entry.expires = time.monotonic() + ttl
+        return outcome
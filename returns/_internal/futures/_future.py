@@ -7,57 +7,44 @@ from returns.primitives.hkt import Kind1, dekind
 if TYPE_CHECKING:
     from returns.future import Future
 
-_ValueType_co = TypeVar('_ValueType_co', covariant=True)
+_ValueType = TypeVar('_ValueType')
 _NewValueType = TypeVar('_NewValueType')
 
-
-async def async_map(
-    function: Callable[[_ValueType_co], _NewValueType],
-    inner_value: Awaitable[_ValueType_co],
-) -> _NewValueType:
-    """Async maps a function over a value."""
-    return function(await inner_value)
+# All functions here are steps of ``ReAwaitable`` chains:
+# they are called with an already awaited value.
 
 
 async def async_apply(
-    container: 'Future[Callable[[_ValueType_co], _NewValueType]]',
-    inner_value: Awaitable[_ValueType_co],
+    container: 'Future[Callable[[_ValueType], _NewValueType]]',
+    inner_value: _ValueType,
 ) -> _NewValueType:
     """Async applies a container with function over a value."""
-    return (await container)._inner_value(await inner_value)  # noqa: SLF001
-
-
-async def async_bind(
-    function: Callable[[_ValueType_co], Kind1['Future', _NewValueType]],
-    inner_value: Awaitable[_ValueType_co],
-) -> _NewValueType:
-    """Async binds a container over a value."""
-    return (await dekind(function(await inner_value)))._inner_value  # noqa: SLF001
+    return (await container._inner_value)(inner_value)  # noqa: SLF001
 
 
-async def async_bind_awaitable(
-    function: Callable[[_ValueType_co], Awaitable[_NewValueType]],
-    inner_value: Awaitable[_ValueType_co],
-) -> _NewValueType:
-    """Async binds a coroutine over a value."""
-    return await function(await inner_value)
+def bind(
+    function: Callable[[_ValueType], Kind1['Future', _NewValueType]],
+    inner_value: _ValueType,
+) -> Awaitable[_NewValueType]:
+    """Binds a container over a value."""
+    return dekind(function(inner_value))._inner_value  # noqa: SLF001
 
 
 async def async_bind_async(
     function: Callable[
-        [_ValueType_co],
+        [_ValueType],
         Awaitable[Kind1['Future', _NewValueType]],
     ],
-    inner_value: Awaitable[_ValueType_co],
+    inner_value: _ValueType,
 ) -> _NewValueType:
     """Async binds a coroutine with container over a value."""
-    inner_io = dekind(await function(await inner_value))._inner_value  # noqa: SLF001
+    inner_io = dekind(await function(inner_value))._inner_value  # noqa: SLF001
     return await inner_io
 
 
-async def async_bind_io(
-    function: Callable[[_ValueType_co], IO[_NewValueType]],
-    inner_value: Awaitable[_ValueType_co],
+def bind_io(
+    function: Callable[[_ValueType], IO[_NewValueType]],
+    inner_value: _ValueType,
 ) -> _NewValueType:
-    """Async binds a container over a value."""
-    return function(await inner_value)._inner_value  # noqa: SLF001
+    """Binds a container over a value."""
+    return function(inner_value)._inner_value  # noqa: SLF001
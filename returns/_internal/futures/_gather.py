@@ -0,0 +1,166 @@
+import sys
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, final
+
+from returns.context import RequiresContextFutureResult
+from returns.future import Future, FutureResult
+from returns.result import Success
+
+
+def collect(
+    iterable: Iterable[Any],
+    acc: Any,
+    limit: int,
+    *,
+    skip_failures: bool,
+) -> Any | None:
+    """
+    Collects ``Future``, ``FutureResult``, and their reader concurrently.
+
+    Returns ``None`` for all other types, they must be collected one by one.
+    """
+    if limit < 1:
+        raise ValueError(f'Concurrency limit must be positive, got: {limit}')
+
+    if isinstance(acc, RequiresContextFutureResult):
+        containers = tuple(iterable)
+        return RequiresContextFutureResult(
+            lambda deps: FutureResult(
+                _gather_results(
+                    (container(deps) for container in containers),
+                    acc(deps),
+                    limit,
+                    skip_failures,
+                )
+            ),
+        )
+    if isinstance(acc, FutureResult):
+        return FutureResult(
+            _gather_results(iterable, acc, limit, skip_failures),
+        )
+    if isinstance(acc, Future):
+        return Future(_gather_values(iterable, acc, limit))
+    return None
+
+
+def _inner_value(container: Any) -> Any:
+    return container._inner_value  # noqa: SLF001
+
+
+async def _gather_values(
+    iterable: Iterable[Any],
+    acc: Any,
+    limit: int,
+) -> tuple[Any, ...]:
+    collected = await _inner_value(acc)
+    gathered = await _Gathering(limit, stop=None).run(
+        map(_inner_value, iterable),
+    )
+    return (*collected, *gathered)
+
+
+async def _gather_results(
+    iterable: Iterable[Any],
+    acc: Any,
+    limit: int,
+    skip_failures: bool,  # noqa: FBT001
+) -> Any:
+    collected = await _inner_value(acc)
+    if not isinstance(collected, Success):
+        return collected
+
+    outcomes = await _Gathering(
+        limit,
+        stop=None if skip_failures else _is_not_success,
+    ).run(map(_inner_value, iterable))
+
+    collected_values = list(_inner_value(collected))
+    for outcome in outcomes:
+        if isinstance(outcome, Success):
+            collected_values.append(_inner_value(outcome))
+        elif not skip_failures:
+            return outcome
+    return Success(tuple(collected_values))
+
+
+def _is_not_success(outcome: object) -> bool:
+    return not isinstance(outcome, Success)
+
+
+@final
+class _Gathering:
+    """
+    Awaits up to ``limit`` awaitables at the same time.
+
+    Outcomes are stored in the order of awaitables.
+    When ``stop`` returns ``True`` for an outcome,
+    no new awaitables are started and all running awaitables
+    that go after the stopped one are cancelled.
+    """
+
+    __slots__ = (
+        '_error',
+        '_limiter',
+        '_outcomes',
+        '_scopes',
+        '_stop',
+        '_stopped_at',
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        stop: Callable[[Any], bool] | None,
+    ) -> None:
+        import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+        self._limiter = anyio.Semaphore(limit)
+        self._stop = stop
+        self._stopped_at = sys.maxsize
+        self._outcomes: list[Any] = []
+        self._scopes: dict[int, Any] = {}
+        self._error: Exception | None = None
+
+    async def run(self, awaitables: Iterable[Awaitable[Any]]) -> list[Any]:
+        """Runs all awaitables and returns their outcomes."""
+        import anyio  # noqa: PLC0415
+
+        async with anyio.create_task_group() as task_group:
+            await self._limiter.acquire()
+            for index, awaitable in enumerate(awaitables):
+                self._outcomes.append(None)
+                # Scope is registered before the task starts,
+                # so it is cancelled even if we stop before it runs:
+                self._scopes[index] = anyio.CancelScope()
+                task_group.start_soon(self._await, index, awaitable)  # type: ignore[unused-awaitable]
+                # We wait for a free slot before taking the next item:
+                await self._limiter.acquire()  # noqa: WPS476
+                if index >= self._stopped_at:
+                    break
+
+        if self._error is not None:
+            raise self._error
+        return self._outcomes
+
+    async def _await(self, index: int, awaitable: Awaitable[Any]) -> None:
+        try:
+            with self._scopes[index]:
+                self._outcomes[index] = await awaitable
+                self._check(index)
+        except Exception as exc:
+            # Unexpected errors cancel everything and are raised as is:
+            self._error = exc
+            self._stop_after(-1)
+        finally:
+            self._scopes.pop(index)
+            self._limiter.release()
+
+    def _check(self, index: int) -> None:
+        if self._stop is not None and self._stop(self._outcomes[index]):
+            self._stop_after(index)
+
+    def _stop_after(self, index: int) -> None:
+        self._stopped_at = min(self._stopped_at, index)
+        for running, scope in self._scopes.items():
+            if running > self._stopped_at:
+                scope.cancel()
@@ -0,0 +1,19 @@
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any, final
+
+
+@final
+class Lazy:
+    """
+    Creates a coroutine only when it is awaited.
+
+    This way computations that are never awaited don't produce warnings.
+    """
+
+    __slots__ = ('_function',)
+
+    def __init__(self, function: Callable[[], Awaitable[Any]]) -> None:
+        self._function = function
+
+    def __await__(self) -> Generator[Any, Any, Any]:  # noqa: WPS611
+        return self._function().__await__()
@@ -0,0 +1,63 @@
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from returns.result import Success
+
+if TYPE_CHECKING:
+    from returns.bulkhead import Bulkhead
+
+
+def limit_async(
+    function: Callable[[Any], Awaitable[Any]],
+    limiter: 'Bulkhead[Any]',
+    container_type: Any,
+) -> Callable[[Any], Awaitable[Any]]:
+    """
+    Limits a function that is passed to ``.bind_async``.
+
+    Returned containers that can be awaited are awaited in the same slot,
+    because that's where their work is done.
+    """
+    _check_rejections(limiter, container_type)
+
+    async def factory(inner_value: Any) -> Any:
+        outcome = await limiter.run(lambda: _settled(function(inner_value)))
+        if isinstance(outcome, Success):
+            return outcome.unwrap()
+        return container_type.from_failure(outcome.failure())
+
+    return factory
+
+
+def limit_awaitable(
+    function: Callable[[Any], Awaitable[Any]],
+    limiter: 'Bulkhead[Any]',
+    container_type: Any,
+) -> Callable[[Any], Awaitable[Any]]:
+    """Limits a function that is passed to ``.bind_awaitable``."""
+    _check_rejections(limiter, container_type)
+
+    async def factory(inner_value: Any) -> Any:
+        outcome = await limiter.run(lambda: function(inner_value))
+        if isinstance(outcome, Success):
+            return container_type.from_value(outcome.unwrap())
+        return container_type.from_failure(outcome.failure())
+
+    return factory
+
+
+def _check_rejections(limiter: 'Bulkhead[Any]', container_type: Any) -> None:
+    """Containers without failures can only use bulkheads that never reject."""
+    rejects = limiter._on_reject is not None  # noqa: SLF001
+    if rejects and not hasattr(container_type, 'from_failure'):
+        raise TypeError(
+            f'{container_type.__name__} cannot return rejected calls, '
+            'use Bulkhead without on_reject',
+        )
+
+
+async def _settled(awaitable: Awaitable[Any]) -> Any:
+    container = await awaitable
+    if isinstance(container, Awaitable):
+        await container
+    return container
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, final
+
+from returns.result import Failure, Result, Success
+
+if TYPE_CHECKING:
+    from returns.future import FutureResult
+
+_OutcomeType = TypeVar('_OutcomeType')
+_ValueType = TypeVar('_ValueType')
+_ErrorType = TypeVar('_ErrorType')
+
+
+async def race(
+    containers: Sequence[FutureResult[_ValueType, _ErrorType]],
+) -> Result[_ValueType, _ErrorType]:
+    """Returns the first finished outcome."""
+    racing: _Race[Result[_ValueType, _ErrorType]] = _Race(_always)
+    await racing.run(partial(_inner_value, containers), len(containers))
+    return racing.winner[0]
+
+
+async def first_success(
+    containers: Sequence[FutureResult[_ValueType, _ErrorType]],
+) -> Result[_ValueType, tuple[_ErrorType, ...]]:
+    """Returns the first successful outcome or all failures in order."""
+    racing: _Race[Result[_ValueType, _ErrorType]] = _Race(_is_success)
+    await racing.run(partial(_inner_value, containers), len(containers))
+    if racing.winner:
+        return Success(racing.winner[0].unwrap())
+    return Failure(
+        tuple(
+            racing.outcomes[index].failure() for index in range(len(containers))
+        )
+    )
+
+
+async def hedge(
+    factory: Callable[[], FutureResult[_ValueType, _ErrorType]],
+    after: float,
+    max_attempts: int,
+) -> Result[_ValueType, _ErrorType]:
+    """Returns the first successful attempt or the failure of the last one."""
+    racing: _Race[Result[_ValueType, _ErrorType]] = _Race(_is_success)
+    await racing.run(partial(_attempt, factory), max_attempts, after)
+    if racing.winner:
+        return racing.winner[0]
+    return racing.outcomes[max(racing.outcomes)]
+
+
+def _always(outcome: object) -> bool:
+    return True
+
+
+def _is_success(outcome: object) -> bool:
+    return isinstance(outcome, Success)
+
+
+def _inner_value(
+    containers: Sequence[FutureResult[_ValueType, _ErrorType]],
+    index: int,
+) -> Awaitable[Result[_ValueType, _ErrorType]]:
+    # Containers can be awaited by others, so losers are not cancelled:
+    return containers[index]._inner_value.detached()  # noqa: SLF001
+
+
+def _attempt(
+    factory: Callable[[], FutureResult[_ValueType, _ErrorType]],
+    index: int,
+) -> Awaitable[Result[_ValueType, _ErrorType]]:
+    return factory()._inner_value  # noqa: SLF001
+
+
+@final
+class _Race(Generic[_OutcomeType]):
+    """
+    Runs attempts concurrently until one of them has an accepted outcome.
+
+    When an outcome is accepted, we stop awaiting all other running attempts
+    and no new attempts are started.
+    Attempts are created lazily by ``factory``,
+    so attempts that are never started do not create any coroutines.
+    """
+
+    __slots__ = ('_accept', '_error', '_failed', '_scope', 'outcomes', 'winner')
+
+    def __init__(self, accept: Callable[[_OutcomeType], bool]) -> None:
+        self._accept = accept
+        self._error: Exception | None = None
+        self._failed: Any = None
+        self._scope: Any = None
+        #: Finished outcomes by attempt index.
+        self.outcomes: dict[int, _OutcomeType] = {}
+        #: Accepted outcome, if any.
+        self.winner: list[_OutcomeType] = []
+
+    async def run(
+        self,
+        factory: Callable[[int], Awaitable[_OutcomeType]],
+        attempts: int,
+        delay: float | None = None,
+    ) -> None:
+        """
+        Starts ``attempts`` attempts and waits for them.
+
+        All attempts are started at once when ``delay`` is ``None``.
+        Otherwise, the next attempt is started after ``delay`` seconds
+        or as soon as the last started attempt is not accepted.
+        """
+        import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+        async with anyio.create_task_group() as task_group:
+            self._scope = task_group.cancel_scope
+            for index in range(attempts):
+                self._failed = anyio.Event()
+                task_group.start_soon(self._attempt, factory, index)  # type: ignore[unused-awaitable]
+                if delay is not None and index < attempts - 1:
+                    await self._wait(delay)  # noqa: WPS476
+
+        if self._error is not None:
+            raise self._error
+
+    async def _wait(self, delay: float) -> None:
+        """Waits for ``delay`` seconds or until the last attempt fails."""
+        import anyio  # noqa: PLC0415
+
+        with anyio.move_on_after(delay):
+            await self._failed.wait()
+
+    async def _attempt(
+        self,
+        factory: Callable[[int], Awaitable[_OutcomeType]],
+        index: int,
+    ) -> None:
+        failed = self._failed
+        try:
+            outcome = await factory(index)
+        except Exception as exc:
+            # Unexpected errors cancel everything and are raised as is:
+            self._error = exc
+            self._scope.cancel()
+            return
+
+        self.outcomes[index] = outcome
+        if self._accept(outcome) and not self.winner:
+            self.winner.append(outcome)
+            self._scope.cancel()
+        else:
+            failed.set()
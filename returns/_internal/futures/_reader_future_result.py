@@ -3,17 +3,62 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, TypeVar
 
+from returns._internal.chain import run
 from returns.primitives.hkt import Kind3, dekind
+from returns.primitives.reawaitable import ReAwaitable
 from returns.result import Result, Success
 
 if TYPE_CHECKING:
-    from returns.context import RequiresContextFutureResult
+    from returns.context import (
+        RequiresContext,
+        RequiresContextFutureResult,
+        RequiresContextIOResult,
+        RequiresContextResult,
+    )
 
 _ValueType_co = TypeVar('_ValueType_co', covariant=True)
 _NewValueType = TypeVar('_NewValueType')
 _ErrorType_co = TypeVar('_ErrorType_co', covariant=True)
+_NewErrorType = TypeVar('_NewErrorType')
 _EnvType = TypeVar('_EnvType')
 
+# All functions here are steps of ``AsyncChain``:
+# they are called with an already awaited ``Result`` and ``deps``.
+# Functions that return awaitables are awaited right away.
+
+
+async def async_apply(
+    container: Kind3[
+        RequiresContextFutureResult,
+        Callable[[_ValueType_co], _NewValueType],
+        _ErrorType_co,
+        _EnvType,
+    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
+    deps: _EnvType,
+) -> Result[_NewValueType, _ErrorType_co]:
+    """Async maps a function from a container over a value."""
+    return inner_value.apply(await run(container, deps))
+
+
+def bind(
+    function: Callable[
+        [_ValueType_co],
+        Kind3[
+            RequiresContextFutureResult,
+            _NewValueType,
+            _ErrorType_co,
+            _EnvType,
+        ],
+    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
+    deps: _EnvType,
+) -> Awaitable[Result[_NewValueType, _ErrorType_co]]:
+    """Binds a container over a value."""
+    if isinstance(inner_value, Success):
+        return run(dekind(function(inner_value.unwrap())), deps)
+    return ReAwaitable.from_value(inner_value)  # type: ignore[arg-type]
+
 
 async def async_bind_async(
     function: Callable[
@@ -27,21 +72,78 @@ async def async_bind_async(
             ],
         ],
     ],
-    container: RequiresContextFutureResult[
-        _ValueType_co, _ErrorType_co, _EnvType
-    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
     deps: _EnvType,
 ) -> Result[_NewValueType, _ErrorType_co]:
     """Async binds a coroutine with container over a value."""
-    inner_value = await container(deps)._inner_value  # noqa: SLF001
     if isinstance(inner_value, Success):
-        return await dekind(  # noqa: SLF001
-            await function(inner_value.unwrap()),
-        )(deps)._inner_value
+        container = dekind(await function(inner_value.unwrap()))
+        return await run(container, deps)
     return inner_value  # type: ignore[return-value]
 
 
-async def async_compose_result(
+def bind_context(
+    function: Callable[
+        [_ValueType_co],
+        RequiresContext[_NewValueType, _EnvType],
+    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
+    deps: _EnvType,
+) -> Result[_NewValueType, _ErrorType_co]:
+    """Binds a container returning ``RequiresContext`` over a value."""
+    if isinstance(inner_value, Success):
+        return Success(function(inner_value.unwrap())(deps))
+    return inner_value  # type: ignore[return-value]
+
+
+def bind_context_result(
+    function: Callable[
+        [_ValueType_co],
+        RequiresContextResult[_NewValueType, _ErrorType_co, _EnvType],
+    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
+    deps: _EnvType,
+) -> Result[_NewValueType, _ErrorType_co]:
+    """Binds a container returning ``RequiresContextResult`` over a value."""
+    if isinstance(inner_value, Success):
+        return function(inner_value.unwrap())(deps)
+    return inner_value  # type: ignore[return-value]
+
+
+def bind_context_ioresult(
+    function: Callable[
+        [_ValueType_co],
+        RequiresContextIOResult[_NewValueType, _ErrorType_co, _EnvType],
+    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
+    deps: _EnvType,
+) -> Result[_NewValueType, _ErrorType_co]:
+    """Binds a container returning ``RequiresContextIOResult`` over a value."""
+    if isinstance(inner_value, Success):
+        return function(inner_value.unwrap())(deps)._inner_value  # noqa: SLF001
+    return inner_value  # type: ignore[return-value]
+
+
+def lash(
+    function: Callable[
+        [_ErrorType_co],
+        Kind3[
+            RequiresContextFutureResult,
+            _ValueType_co,
+            _NewErrorType,
+            _EnvType,
+        ],
+    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
+    deps: _EnvType,
+) -> Awaitable[Result[_ValueType_co, _NewErrorType]]:
+    """Lashes a function returning a container over a value."""
+    if isinstance(inner_value, Success):
+        return ReAwaitable.from_value(inner_value)
+    return run(dekind(function(inner_value.failure())), deps)
+
+
+def compose_result(
     function: Callable[
         [Result[_ValueType_co, _ErrorType_co]],
         Kind3[
@@ -51,11 +153,8 @@ async def async_compose_result(
             _EnvType,
         ],
     ],
-    container: RequiresContextFutureResult[
-        _ValueType_co, _ErrorType_co, _EnvType
-    ],
+    inner_value: Result[_ValueType_co, _ErrorType_co],
     deps: _EnvType,
-) -> Result[_NewValueType, _ErrorType_co]:
-    """Async composes ``Result`` based function."""
-    new_container = dekind(function((await container(deps))._inner_value))  # noqa: SLF001
-    return (await new_container(deps))._inner_value  # noqa: SLF001
+) -> Awaitable[Result[_NewValueType, _ErrorType_co]]:
+    """Composes ``Result`` based function."""
+    return run(dekind(function(inner_value)), deps)
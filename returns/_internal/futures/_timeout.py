@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Final, TypeVar
+
+from returns.result import Failure, Result
+
+if TYPE_CHECKING:
+    from returns.future import Deadline
+    from returns.primitives.reawaitable import ReAwaitable
+
+_ValueType = TypeVar('_ValueType')
+_ErrorType = TypeVar('_ErrorType')
+_NewErrorType = TypeVar('_NewErrorType')
+
+#: :func:`time.monotonic` value when the closest timeout is over.
+#: Computations of timeouts run in their own tasks,
+#: they do not see our cancel scopes, but they inherit this variable.
+_deadline: Final[ContextVar[float]] = ContextVar(
+    'returns_deadline',
+    default=math.inf,
+)
+
+
+async def timeout(
+    inner_value: ReAwaitable[Result[_ValueType, _ErrorType]],
+    seconds: float | Deadline,
+    on_timeout: Callable[[], _NewErrorType],
+) -> Result[_ValueType, _ErrorType | _NewErrorType]:
+    """
+    Awaits ``inner_value`` in a cancel scope with a time budget.
+
+    The budget of a ``Deadline`` is computed when we start awaiting,
+    so we only get the time that remains.
+    The computation runs in its own task, so it is not cancelled
+    when time runs out and can still be awaited later.
+    """
+    import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+    if not isinstance(seconds, (int, float)):
+        seconds = seconds.remaining()
+    when = time.monotonic() + seconds
+    token = _deadline.set(min(_deadline.get(), when))
+    try:  # noqa: WPS501
+        with anyio.move_on_after(seconds):
+            return await inner_value.detached()
+    finally:
+        _deadline.reset(token)
+    return Failure(on_timeout())
+
+
+def deadline() -> float:
+    """Returns the closest deadline of running timeouts or ``math.inf``."""
+    return _deadline.get()
@@ -0,0 +1,90 @@
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Final, final
+
+#: Memoized results of the current scope.
+#: Keys are memoized functions with ``id`` of ``deps``,
+#: values also hold ``deps`` to keep ids unique.
+_scope: Final[ContextVar[dict[tuple[Any, int], tuple[Any, Any]] | None]] = (
+    ContextVar('returns_memoize_scope', default=None)
+)
+
+
+@contextmanager
+def memoized_scope() -> Generator[None, None, None]:
+    """
+    Shares results of memoized containers inside this scope.
+
+    Containers created with ``.memoize()`` run once per ``deps`` object
+    inside of a scope, results are dropped when the scope is closed.
+    Outside of any scope they run on each call, as regular containers.
+    Nested scopes reuse the outer one.
+
+    It uses :class:`contextvars.ContextVar` under the hood,
+    so tasks started inside of the scope share it as well.
+
+    .. code:: python
+
+      >>> from returns.context import RequiresContext, memoized_scope
+
+      >>> calls = []
+      >>> def load(deps: int) -> int:
+      ...     calls.append(deps)
+      ...     return deps * 10
+
+      >>> config = RequiresContext(load).memoize()
+      >>> program = config.bind(
+      ...     lambda first: config.map(lambda second: first + second),
+      ... )
+
+      >>> with memoized_scope():
+      ...     assert program(1) == 20
+      >>> assert calls == [1]
+
+      >>> assert program(1) == 20
+      >>> assert calls == [1, 1, 1]
+
+    """
+    scope = _scope.get()
+    token = _scope.set({} if scope is None else scope)
+    try:  # noqa: WPS501
+        yield
+    finally:
+        _scope.reset(token)
+
+
+@final
+class Memoized:
+    """
+    Function of ``deps`` that runs once per ``deps`` in a scope.
+
+    Results are stored in the current :func:`memoized_scope`,
+    so they are shared by all branches of a program
+    and dropped when the scope is closed.
+    Raised exceptions are not stored.
+    """
+
+    __slots__ = ('_function',)
+
+    def __init__(self, function: Callable[[Any], Any]) -> None:
+        self._function = function
+
+    def __call__(self, deps: Any) -> Any:
+        """Returns the result for these ``deps`` or computes it."""
+        scope = _scope.get()
+        if scope is None:
+            return self._function(deps)
+
+        key = (self, id(deps))
+        cached = scope.get(key)
+        if cached is not None:
+            return cached[1]
+
+        inner_value = self._function(deps)
+        scope[key] = (deps, inner_value)
+        return inner_value
+
+    def __repr__(self) -> str:
+        """Shows the memoized function."""
+        return f'<Memoized: {self._function!r}>'
@@ -0,0 +1,146 @@
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures import Future as ConcurrentFuture
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, final
+
+from returns.result import Failure, ResultE, Success
+
+if TYPE_CHECKING:
+    from returns.future import Offload
+
+_FirstType = TypeVar('_FirstType')
+_UpdatedType = TypeVar('_UpdatedType')
+
+#: Submitted chunks and their sizes, in the submission order.
+_Pending: TypeAlias = dict[ConcurrentFuture[list[ResultE[Any]]], int]
+
+
+def chunked(
+    iterable: Iterable[_FirstType],
+    chunksize: int,
+) -> Iterator[list[_FirstType]]:
+    """Lazily splits an iterable into lists of ``chunksize`` items."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def traverse_chunk(
+    function: Callable[[_FirstType], _UpdatedType],
+    chunk: list[_FirstType],
+) -> list[ResultE[_UpdatedType]]:
+    """Runs in workers, must be importable for process pools."""
+    outcomes: list[ResultE[_UpdatedType]] = []
+    for argument in chunk:
+        try:
+            outcomes.append(Success(function(argument)))
+        except Exception as exc:
+            outcomes.append(Failure(exc))
+    return outcomes
+
+
+@final
+class ParallelTraverse:
+    """Submits chunks to an executor and yields their outcomes."""
+
+    __slots__ = ('_buffersize', '_executor', '_function')
+
+    def __init__(
+        self,
+        executor: 'Offload',
+        function: Callable[[Any], Any],
+        buffersize: int | None,
+    ) -> None:
+        self._executor = executor
+        self._function = function
+        self._buffersize = buffersize
+
+    def ordered(
+        self,
+        chunks: Iterator[list[Any]],
+    ) -> Generator[ResultE[Any], None, None]:
+        """Yields outcomes in the order of the iterable."""
+        pending: _Pending = {}
+        with self._pool() as pool, _cancelling(pending):
+            for chunk in chunks:
+                self._submit(pool, chunk, pending)
+                if self._full(pending):
+                    yield from _outcomes(pending, next(iter(pending)))
+            while pending:
+                yield from _outcomes(pending, next(iter(pending)))
+
+    def unordered(
+        self,
+        chunks: Iterator[list[Any]],
+    ) -> Generator[ResultE[Any], None, None]:
+        """Yields outcomes of chunks as soon as they are finished."""
+        pending: _Pending = {}
+        with self._pool() as pool, _cancelling(pending):
+            for chunk in chunks:
+                self._submit(pool, chunk, pending)
+                if self._full(pending):
+                    yield from _finished(pending)
+            while pending:
+                yield from _finished(pending)
+
+    def _pool(self) -> AbstractContextManager[Executor]:
+        if self._executor == 'thread':
+            return ThreadPoolExecutor()
+        if self._executor == 'process':
+            return ProcessPoolExecutor()
+        return nullcontext(self._executor)
+
+    def _submit(
+        self,
+        pool: Executor,
+        chunk: list[Any],
+        pending: _Pending,
+    ) -> None:
+        try:
+            future = pool.submit(traverse_chunk, self._function, chunk)
+        except BrokenExecutor as exc:
+            # Workers have crashed before, new chunks are lost as well:
+            future = ConcurrentFuture()
+            future.set_exception(exc)
+        pending[future] = len(chunk)
+
+    def _full(self, pending: _Pending) -> bool:
+        return self._buffersize is not None and len(pending) >= self._buffersize
+
+
+@contextmanager
+def _cancelling(pending: _Pending) -> Generator[None, None, None]:
+    """Cancels pending chunks when the iteration is stopped early."""
+    try:
+        yield
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+
+
+def _finished(pending: _Pending) -> Iterator[ResultE[Any]]:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        yield from _outcomes(pending, future)
+
+
+def _outcomes(
+    pending: _Pending,
+    future: ConcurrentFuture[list[ResultE[Any]]],
+) -> list[ResultE[Any]]:
+    size = pending.pop(future)
+    try:
+        return future.result()
+    except Exception as exc:
+        # The whole chunk is lost, for example, when a worker has crashed:
+        return [Failure(exc) for _ in range(size)]
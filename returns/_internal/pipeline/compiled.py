@@ -0,0 +1,193 @@
+from collections.abc import Callable
+from functools import cache, partial
+from operator import attrgetter
+from types import CodeType, MappingProxyType
+from typing import Any, Final, TypeAlias, final
+
+from returns.functions import identity
+from returns.io import IO, IOFailure, IOSuccess
+from returns.maybe import Nothing, Some
+from returns.result import Failure, Success
+
+_Step: TypeAlias = Callable[[Any], Any]
+
+
+_inner_value: Final = attrgetter('_inner_value')
+_ioresult_inner_value: Final = attrgetter('_inner_value._inner_value')
+
+#: Successful builtin containers that can be unwrapped between steps.
+_SUCCESSFUL: Final = MappingProxyType({
+    IO: (IO, _inner_value),
+    Success: (Success, _inner_value),
+    Some: (Some, _inner_value),
+    IOSuccess: (IOSuccess, _ioresult_inner_value),
+})
+
+#: Failed builtin containers, ``.map`` and ``.bind`` return them as is.
+_FAILED: Final = frozenset((Failure, type(Nothing), IOFailure))
+
+
+def compile_pipe(*functions):
+    """
+    Prepares a pipeline once to call it many times.
+
+    Works exactly like :func:`pipe <returns._internal.pipeline.pipe.pipe>`:
+
+    .. code:: python
+
+      >>> from returns.pipeline import compile_pipe, pipe
+      >>> from returns.pointfree import bind, map_
+      >>> from returns.result import Result, Success, Failure
+
+      >>> def check(arg: int) -> Result[int, str]:
+      ...     return Success(arg) if arg > 0 else Failure('negative')
+
+      >>> pipeline = compile_pipe(
+      ...     check,
+      ...     map_(lambda number: number * 2),
+      ...     map_(str),
+      ...     bind(lambda text: Success(text + '!')),
+      ... )
+
+      >>> assert pipeline(1) == Success('2!')
+      >>> assert pipeline(-1) == Failure('negative')
+
+    But, all steps are checked and analyzed when the pipeline is created:
+
+    1. Adjacent :func:`map_ <returns.pointfree.map_>` steps
+       are fused into a single function, or into the next ``bind`` step
+    2. Successful ``Result``, ``Maybe``, ``IO``, and ``IOResult`` values
+       are unwrapped once and all ``map_`` and
+       :func:`bind <returns.pointfree.bind>` steps run on raw values,
+       so a new container is only created by ``bind`` functions
+    3. When ``bind`` returns a failed container,
+       all following ``map_`` and ``bind`` steps are skipped
+
+    Other steps are called as is.
+    All other containers are processed with their ``.map`` and ``.bind``.
+
+    Requires our :ref:`mypy plugin <mypy-plugins>`.
+    """
+    for function in functions:
+        if not callable(function):
+            raise TypeError(
+                f'Pipeline step must be callable, got: {function!r}'
+            )
+    return _CompiledPipe(_compile_steps(functions))
+
+
+@final
+class _CompiledPipe:
+    """Callable pipeline with precompiled steps."""
+
+    __slots__ = ('_steps',)
+
+    def __init__(self, steps: tuple[_Step, ...]) -> None:
+        self._steps = steps
+
+    def __call__(self, instance: Any) -> Any:
+        return _chain(self._steps, instance)
+
+
+def _compile_steps(functions: tuple[_Step, ...]) -> tuple[_Step, ...]:
+    """
+    Groups adjacent ``map_`` and ``bind`` steps into segments.
+
+    Each ``map_`` is fused into the next ``bind`` step,
+    because ``.map(first).bind(second)`` is ``.bind(second(first(...)))``.
+    Trailing ``map_`` steps are fused into a single ``.map`` call.
+    """
+    steps: list[_Step] = []
+    binds: list[_Step] = []
+    pending_map: _Step | None = None
+    for function in functions:
+        lifted = _lifted(function, _factory_code('map_'))
+        if lifted is not None:
+            pending_map = _fuse(pending_map, lifted)
+            continue
+
+        lifted = _lifted(function, _factory_code('bind'))
+        if lifted is None:
+            steps.extend(_as_segment(binds, pending_map))
+            steps.append(function)
+            binds = []
+        else:
+            binds.append(_fuse(pending_map, lifted))
+        pending_map = None
+    steps.extend(_as_segment(binds, pending_map))
+    return tuple(steps)
+
+
+@cache
+def _factory_code(name: str) -> CodeType:
+    """Code object of a pointfree factory that we can fuse."""
+    # `returns.pointfree` imports `returns.pipeline`, so we import it lazily:
+    from returns import pointfree  # noqa: PLC0415
+
+    return getattr(pointfree, name)(identity).__code__  # type: ignore[no-any-return]
+
+
+def _lifted(function: _Step, factory_code: object) -> _Step | None:
+    """Returns a function lifted by ``map_`` or ``bind`` factory."""
+    if getattr(function, '__code__', None) is not factory_code:
+        return None
+    # Both factories only close over the `function` they lift:
+    return function.__closure__[0].cell_contents  # type: ignore
+
+
+def _as_segment(binds: list[_Step], final_map: _Step | None) -> list[_Step]:
+    if not binds and final_map is None:
+        return []
+    return [partial(_run_segment, tuple(binds), final_map)]
+
+
+def _fuse(first: _Step | None, second: _Step) -> _Step:
+    if first is None:
+        return second
+    if isinstance(first, partial) and first.func is _chain:
+        return partial(_chain, (*first.args[0], second))
+    return partial(_chain, (first, second))
+
+
+def _chain(functions: tuple[_Step, ...], instance: Any) -> Any:
+    for function in functions:
+        instance = function(instance)
+    return instance
+
+
+def _run_segment(
+    binds: tuple[_Step, ...],
+    final_map: _Step | None,
+    container: Any,
+) -> Any:
+    """
+    Runs ``bind`` and ``map_`` functions over a container.
+
+    Successful builtin containers are unwrapped,
+    so functions are called with raw values directly.
+    """
+    for index, function in enumerate(binds):
+        successful = _SUCCESSFUL.get(container.__class__)
+        if successful is None:
+            return _run_methods(binds[index:], final_map, container)
+        container = function(successful[1](container))
+
+    if final_map is None:
+        return container
+    successful = _SUCCESSFUL.get(container.__class__)
+    if successful is None:
+        return _run_methods((), final_map, container)
+    return successful[0](final_map(successful[1](container)))
+
+
+def _run_methods(
+    binds: tuple[_Step, ...],
+    final_map: _Step | None,
+    container: Any,
+) -> Any:
+    """Runs functions with ``.bind`` and ``.map`` container methods."""
+    if container.__class__ in _FAILED:
+        return container
+    for function in binds:
+        container = container.bind(function)
+    return container if final_map is None else container.map(final_map)
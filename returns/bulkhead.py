@@ -0,0 +1,182 @@
+import math
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Generic, Never, TypeVar, final, overload
+
+from returns.result import Failure, Result, Success
+
+if TYPE_CHECKING:
+    import anyio
+
+_ValueType = TypeVar('_ValueType')
+_ErrorType_co = TypeVar('_ErrorType_co', covariant=True)
+
+
+@final
+class Bulkhead(Generic[_ErrorType_co]):
+    """
+    Limits how many async functions can run at the same time.
+
+    Create a single bulkhead for each dependency
+    and share it between all pipelines that use it,
+    so they can't send more than ``limit`` concurrent requests in total.
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.bulkhead import Bulkhead
+      >>> from returns.result import Failure, Success
+
+      >>> database = Bulkhead(1, max_waiting=0, on_reject=lambda: 'busy')
+
+      >>> async def query() -> int:
+      ...     await anyio.sleep(0.1)
+      ...     return 1
+
+      >>> async def main() -> None:
+      ...     async with anyio.create_task_group() as tg:
+      ...         tg.start_soon(database.run, query)
+      ...         await anyio.sleep(0.01)
+      ...         assert database.in_flight == 1
+      ...         assert await database.run(query) == Failure('busy')
+      ...     assert await database.run(query) == Success(1)
+
+      >>> anyio.run(main)
+      >>> assert database.rejected == 1
+
+    Other callers wait for a free slot.
+    When ``max_waiting`` is set and there are already
+    this many callers waiting, new callers get ``Failure``
+    created by ``on_reject`` right away.
+
+    It is backed by ``anyio.CapacityLimiter``,
+    ``anyio`` must be installed to use it.
+    A bulkhead must only be used with a single event loop.
+
+    Use it with :func:`returns.pointfree.bind_async`
+    and :func:`returns.pointfree.bind_awaitable`.
+    ``Future`` cannot return ``Failure``,
+    so it only works with bulkheads without ``on_reject``.
+    """
+
+    __slots__ = (
+        '_in_flight',
+        '_limit',
+        '_limiter',
+        '_max_waiting',
+        '_on_reject',
+        '_rejected',
+        '_waiting',
+    )
+
+    @overload
+    def __init__(
+        self: 'Bulkhead[Never]',
+        limit: int,
+        *,
+        max_waiting: None = None,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self,
+        limit: int,
+        *,
+        max_waiting: int | None = None,
+        on_reject: Callable[[], _ErrorType_co],
+    ) -> None: ...
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        max_waiting: int | None = None,
+        on_reject: Callable[[], _ErrorType_co] | None = None,
+    ) -> None:
+        """Creates a bulkhead with ``limit`` slots."""
+        if limit < 1:
+            raise ValueError(
+                f'Bulkhead requires at least one slot, got: {limit}',
+            )
+        if max_waiting is not None and on_reject is None:
+            raise ValueError('Bulkhead with max_waiting requires on_reject')
+        self._limit = limit
+        self._max_waiting = math.inf if max_waiting is None else max_waiting
+        self._on_reject = on_reject
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._rejected = 0
+
+    def __repr__(self) -> str:
+        """Shows current metrics."""
+        return (
+            f'<Bulkhead: {self._in_flight}/{self._limit} in flight, '
+            f'{self._waiting} waiting, {self._rejected} rejected>'
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of functions that are running right now."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers that wait for a free slot."""
+        return self._waiting
+
+    @property
+    def rejected(self) -> int:
+        """Number of callers that were rejected so far."""
+        return self._rejected
+
+    async def run(
+        self,
+        function: Callable[[], Awaitable[_ValueType]],
+    ) -> Result[_ValueType, _ErrorType_co]:
+        """
+        Awaits a function in a free slot.
+
+        Returns ``Failure`` without calling it,
+        when there are too many callers waiting.
+        """
+        import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+        limiter = self._get_limiter()
+        # Each call is a separate borrower,
+        # so the same task can use a bulkhead in nested steps:
+        borrower = object()
+        try:
+            limiter.acquire_on_behalf_of_nowait(borrower)
+        except anyio.WouldBlock:
+            if self._on_reject is not None and (
+                self._waiting >= self._max_waiting
+            ):
+                self._rejected += 1
+                return Failure(self._on_reject())
+            await self._wait(limiter, borrower)
+
+        self._in_flight += 1
+        try:  # noqa: WPS501
+            return Success(await function())
+        finally:
+            self._in_flight -= 1
+            limiter.release_on_behalf_of(borrower)
+
+    async def _wait(
+        self,
+        limiter: 'anyio.CapacityLimiter',
+        borrower: object,
+    ) -> None:
+        self._waiting += 1
+        try:  # noqa: WPS501
+            await limiter.acquire_on_behalf_of(borrower)
+        finally:
+            self._waiting -= 1
+
+    def _get_limiter(self) -> 'anyio.CapacityLimiter':
+        """Creates the limiter lazily, it requires a running event loop."""
+        if self._limiter is None:
+            import anyio  # noqa: PLC0415
+
+            self._limiter = anyio.CapacityLimiter(self._limit)
+        return self._limiter
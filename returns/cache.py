@@ -0,0 +1,543 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import partial, wraps
+from typing import Any, Final, TypeVar, final
+
+from typing_extensions import ParamSpec
+
+from returns._internal.caching import make_key
+
+_ReturnType = TypeVar('_ReturnType')
+_FuncParams = ParamSpec('_FuncParams')
+
+#: Marks cache misses, since ``None`` can be a cached value.
+_missing: Final = object()
+
+
+class Cache(ABC):
+    """
+    Base class for eviction policies of cached decorators.
+
+    Caches are passed to :func:`returns.result.safe`
+    and :func:`returns.io.impure_safe` as ``cache`` argument.
+    Produced containers are cached by function's arguments,
+    arguments must be hashable.
+
+    Set ``skip_failures=True`` to cache only successful containers.
+
+    Each cache counts ``hits``, ``misses``, and ``evictions``.
+    Expired values are counted as evictions as well.
+
+    Caches are thread-safe. Create a new cache for each function,
+    since a cache does not know which function it belongs to.
+    """
+
+    __slots__ = ('_lock', 'evictions', 'hits', 'misses', 'skip_failures')
+
+    def __init__(self, *, skip_failures: bool = False) -> None:
+        """Creates an empty cache."""
+        self.skip_failures = skip_failures
+        #: How many calls returned a cached container.
+        self.hits = 0
+        #: How many calls had to call the function.
+        self.misses = 0
+        #: How many containers were removed to make space or expired.
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Shows policy name and counters.
+
+        .. code:: python
+
+          >>> from returns.cache import LRU
+          >>> LRU(maxsize=1)
+          <LRU: size=0, hits=0, misses=0, evictions=0>
+
+        """
+        counters = (
+            f'hits={self.hits}, misses={self.misses}, '
+            f'evictions={self.evictions}'
+        )
+        return f'<{type(self).__name__}: size={len(self)}, {counters}>'
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of cached containers."""
+
+    def wrap(
+        self,
+        function: Callable[_FuncParams, _ReturnType],
+        success_type: type[Any],
+    ) -> Callable[_FuncParams, _ReturnType]:
+        """
+        Caches containers returned from ``function``.
+
+        Instances of ``success_type`` are successful containers,
+        other returned values are failures.
+        The function itself is called without holding a lock,
+        so concurrent calls with the same arguments can call it twice.
+
+        .. code:: python
+
+          >>> from returns.cache import LRU
+          >>> from returns.result import Result, Success
+
+          >>> cache = LRU(maxsize=10)
+          >>> calls = []
+
+          >>> def function(arg: int) -> Result[int, str]:
+          ...     calls.append(arg)
+          ...     return Success(arg)
+
+          >>> cached = cache.wrap(function, Success)
+          >>> assert cached(1) == cached(1) == Success(1)
+          >>> assert calls == [1]
+          >>> assert (cache.hits, cache.misses) == (1, 1)
+
+        """
+        return self._wrap(function, success_type, make_key)
+
+    def clear(self) -> None:
+        """Removes all cached containers, counters are not changed."""
+        with self._lock:
+            self._clear()
+
+    def _wrap(
+        self,
+        function: Callable[_FuncParams, _ReturnType],
+        success_type: type[Any],
+        key_factory: Callable[..., Hashable],
+    ) -> Callable[_FuncParams, _ReturnType]:
+        """Caches containers with keys created from arguments."""
+
+        @wraps(function)
+        def decorator(
+            *args: _FuncParams.args,
+            **kwargs: _FuncParams.kwargs,
+        ) -> _ReturnType:
+            key = key_factory(args, kwargs)
+            with self._lock:
+                container = self._get(key)
+                if container is _missing:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    return container  # type: ignore[no-any-return]
+
+            container = function(*args, **kwargs)
+            if not self.skip_failures or isinstance(container, success_type):
+                with self._lock:
+                    self._put(key, container)
+            return container
+
+        return decorator
+
+    @abstractmethod
+    def _get(self, key: Hashable) -> Any:
+        """Returns cached container or ``_missing``."""
+
+    @abstractmethod
+    def _put(self, key: Hashable, container: Any) -> None:
+        """Caches new container, evicts old ones when needed."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Removes all cached containers."""
+
+
+@final
+class LRU(Cache):
+    """
+    Evicts the least recently used container.
+
+    .. code:: python
+
+      >>> from returns.cache import LRU
+      >>> from returns.result import safe
+
+      >>> cache = LRU(maxsize=2)
+
+      >>> @safe(cache=cache)
+      ... def parse(number: str) -> int:
+      ...     return int(number)
+
+      >>> for number in ('1', '2', '1', '3', '2'):
+      ...     assert parse(number).unwrap() == int(number)
+
+      >>> cache
+      <LRU: size=2, hits=1, misses=4, evictions=2>
+
+    """
+
+    __slots__ = ('_containers', '_maxsize')
+
+    def __init__(self, maxsize: int = 128, *, skip_failures: bool = False):
+        """Stores up to ``maxsize`` containers."""
+        super().__init__(skip_failures=skip_failures)
+        self._maxsize = _check_maxsize(maxsize)
+        self._containers: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached containers."""
+        return len(self._containers)
+
+    def _get(self, key: Hashable) -> Any:
+        container = self._containers.get(key, _missing)
+        if container is not _missing:
+            self._containers.move_to_end(key)
+        return container
+
+    def _put(self, key: Hashable, container: Any) -> None:
+        self._containers[key] = container
+        self._containers.move_to_end(key)
+        if len(self._containers) > self._maxsize:
+            self._containers.popitem(last=False)
+            self.evictions += 1
+
+    def _clear(self) -> None:
+        self._containers.clear()
+
+
+@final
+class LFU(Cache):
+    """
+    Evicts the least frequently used container.
+
+    Containers that are used equally often
+    are evicted in the least recently used order.
+    All operations take constant time.
+
+    .. code:: python
+
+      >>> from returns.cache import LFU
+      >>> from returns.result import safe
+
+      >>> cache = LFU(maxsize=2)
+
+      >>> @safe(cache=cache)
+      ... def parse(number: str) -> int:
+      ...     return int(number)
+
+      >>> for number in ('1', '1', '2', '3', '1', '2'):
+      ...     assert parse(number).unwrap() == int(number)
+
+      >>> cache
+      <LFU: size=2, hits=2, misses=4, evictions=2>
+
+    """
+
+    __slots__ = ('_buckets', '_containers', '_counts', '_maxsize', '_min_count')
+
+    def __init__(self, maxsize: int = 128, *, skip_failures: bool = False):
+        """Stores up to ``maxsize`` containers."""
+        super().__init__(skip_failures=skip_failures)
+        self._maxsize = _check_maxsize(maxsize)
+        self._containers: dict[Hashable, Any] = {}
+        self._counts: dict[Hashable, int] = {}
+        # Keys by their usage count, each bucket is in the LRU order:
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached containers."""
+        return len(self._containers)
+
+    def _get(self, key: Hashable) -> Any:
+        container = self._containers.get(key, _missing)
+        if container is not _missing:
+            self._move(key, self._counts[key])
+        return container
+
+    def _put(self, key: Hashable, container: Any) -> None:
+        if key in self._counts:
+            self._containers[key] = container
+            return
+        if len(self._containers) >= self._maxsize:
+            self._evict()
+        self._containers[key] = container
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def _clear(self) -> None:
+        self._containers.clear()
+        self._counts.clear()
+        self._buckets.clear()
+
+    def _move(self, key: Hashable, count: int) -> None:
+        """Moves the key to the next usage count bucket."""
+        bucket = self._buckets[count]
+        del bucket[key]  # noqa: WPS420
+        if not bucket:
+            del self._buckets[count]  # noqa: WPS420
+            if self._min_count == count:
+                self._min_count += 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def _evict(self) -> None:
+        bucket = self._buckets[self._min_count]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_count]  # noqa: WPS420
+        del self._containers[key]  # noqa: WPS420
+        del self._counts[key]  # noqa: WPS420
+        self.evictions += 1
+
+
+@final
+class TTL(Cache):
+    """
+    Evicts containers ``seconds`` after they were cached.
+
+    When ``maxsize`` is set, the least recently used container
+    is evicted to make space for a new one.
+
+    .. code:: python
+
+      >>> import time
+      >>> from returns.cache import TTL
+      >>> from returns.io import impure_safe
+
+      >>> cache = TTL(seconds=0.01)
+
+      >>> @impure_safe(cache=cache)
+      ... def now(key: str) -> float:
+      ...     return time.monotonic()
+
+      >>> first = now('a')
+      >>> assert now('a') == first
+      >>> time.sleep(0.02)
+      >>> assert now('a') != first
+
+      >>> cache
+      <TTL: size=1, hits=1, misses=2, evictions=1>
+
+    """
+
+    __slots__ = ('_containers', '_maxsize', '_seconds')
+
+    def __init__(
+        self,
+        seconds: float,
+        maxsize: int | None = None,
+        *,
+        skip_failures: bool = False,
+    ) -> None:
+        """Stores containers for ``seconds``, up to ``maxsize`` of them."""
+        super().__init__(skip_failures=skip_failures)
+        self._seconds = seconds
+        self._maxsize = None if maxsize is None else _check_maxsize(maxsize)
+        self._containers: OrderedDict[Hashable, tuple[float, Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of cached containers, including expired."""
+        return len(self._containers)
+
+    def _get(self, key: Hashable) -> Any:
+        expires, container = self._containers.get(key, (0, _missing))
+        if container is _missing:
+            return _missing
+        if expires <= time.monotonic():
+            del self._containers[key]  # noqa: WPS420
+            self.evictions += 1
+            return _missing
+        self._containers.move_to_end(key)
+        return container
+
+    def _put(self, key: Hashable, container: Any) -> None:
+        self._containers[key] = (time.monotonic() + self._seconds, container)
+        self._containers.move_to_end(key)
+        if self._maxsize is not None and len(self._containers) > self._maxsize:
+            self._containers.popitem(last=False)
+            self.evictions += 1
+
+    def _clear(self) -> None:
+        self._containers.clear()
+
+
+@final
+class SQLite(Cache):
+    """
+    Stores containers in a SQLite database on the local filesystem.
+
+    Cached containers survive restarts of the program,
+    so a re-run over the same inputs does not compute anything again.
+    Containers are pickled, the same way
+    as :class:`returns.primitives.container.BaseContainer` always is.
+
+    Keys are hashes of the decorated function's name, ``version``,
+    and arguments. Change ``version`` when the function's logic changes,
+    so old containers are not used anymore.
+    Unlike other caches, one instance can wrap several functions,
+    since function's name is a part of its keys.
+
+    Arguments must be picklable,
+    containers that cannot be pickled are not stored.
+    Arguments are hashed in their pickled form, so it must not change
+    between runs: for example, sets and frozensets of strings
+    are pickled in a random order because of hash randomization,
+    so their containers are not reused by other processes.
+    Pass sorted tuples instead.
+
+    When ``maxsize`` is set, the oldest stored container
+    is evicted to make space for a new one.
+
+    .. code:: python
+
+      >>> import tempfile
+      >>> from pathlib import Path
+      >>> from returns.cache import SQLite
+      >>> from returns.result import Success, safe
+
+      >>> path = Path(tempfile.mkdtemp()) / 'cache.sqlite'
+
+      >>> def parse(number: str) -> int:
+      ...     return int(number)
+
+      >>> first_run = safe(cache=SQLite(path, version='1'))(parse)
+      >>> assert first_run('1') == Success(1)
+
+      >>> cache = SQLite(path, version='1')
+      >>> second_run = safe(cache=cache)(parse)
+      >>> assert second_run('1') == Success(1)
+      >>> cache
+      <SQLite: size=1, hits=1, misses=0, evictions=0>
+
+    Only use database files that you trust,
+    since unpickling data can execute arbitrary code.
+    """
+
+    __slots__ = (
+        '_connection',
+        '_dumps',
+        '_limit',
+        '_loads',
+        '_pickling_errors',
+        '_sha256',
+        '_size',
+        '_version',
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        version: str = '',
+        maxsize: int | None = None,
+        skip_failures: bool = False,
+    ) -> None:
+        """Opens or creates the database at ``path``."""
+        # Persistence modules are slow to import, most users never need them:
+        import hashlib  # noqa: PLC0415
+        import pickle  # noqa: PLC0415, S403
+        import sqlite3  # noqa: PLC0415
+
+        super().__init__(skip_failures=skip_failures)
+        self._version = version
+        self._limit = None if maxsize is None else _check_maxsize(maxsize)
+        self._dumps = partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
+        self._loads = pickle.loads  # noqa: S301
+        self._pickling_errors = (
+            pickle.PicklingError,
+            TypeError,
+            AttributeError,
+        )
+        self._sha256 = hashlib.sha256
+        self._connection = sqlite3.connect(
+            path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS returns_cache '
+            '(key BLOB PRIMARY KEY, container BLOB NOT NULL)',
+        )
+        self._size = len(self)
+
+    def __len__(self) -> int:
+        """Returns the number of stored containers."""
+        return self._connection.execute(  # type: ignore[no-any-return]
+            'SELECT COUNT(*) FROM returns_cache',
+        ).fetchone()[0]
+
+    def wrap(
+        self,
+        function: Callable[_FuncParams, _ReturnType],
+        success_type: type[Any],
+    ) -> Callable[_FuncParams, _ReturnType]:
+        """Caches containers and uses function's name as a part of keys."""
+        name = getattr(function, '__qualname__', type(function).__qualname__)
+        return self._wrap(
+            function,
+            success_type,
+            partial(_namespaced_key, f'{function.__module__}.{name}'),
+        )
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: Hashable) -> Any:
+        row = self._connection.execute(
+            'SELECT container FROM returns_cache WHERE key = ?',
+            (self._hash(key),),
+        ).fetchone()
+        if row is None:
+            return _missing
+        return self._loads(row[0])
+
+    def _put(self, key: Hashable, container: Any) -> None:
+        try:
+            pickled = self._dumps(container)
+        except self._pickling_errors:
+            return
+        cursor = self._connection.execute(
+            'INSERT OR IGNORE INTO returns_cache VALUES (?, ?)',
+            (self._hash(key), pickled),
+        )
+        self._size += cursor.rowcount
+        if self._limit is not None and self._size > self._limit:
+            self._evict(self._size - self._limit)
+
+    def _clear(self) -> None:
+        self._connection.execute('DELETE FROM returns_cache')
+        self._size = 0
+
+    def _hash(self, key: Hashable) -> bytes:
+        return self._sha256(self._dumps((self._version, key))).digest()
+
+    def _evict(self, count: int) -> None:
+        """Deletes the oldest rows, ``rowid`` grows with each insert."""
+        cursor = self._connection.execute(
+            'DELETE FROM returns_cache WHERE rowid IN '
+            '(SELECT rowid FROM returns_cache ORDER BY rowid LIMIT ?)',
+            (count,),
+        )
+        self._size -= cursor.rowcount
+        self.evictions += cursor.rowcount
+
+
+def _namespaced_key(
+    namespace: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Hashable:
+    return (namespace, make_key(args, kwargs))
+
+
+def _check_maxsize(maxsize: int) -> int:
+    if maxsize < 1:
+        raise ValueError(f'Cache requires positive maxsize, got: {maxsize}')
+    return maxsize
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, TypeVar, final
 
+from returns._internal.chain import then
+from returns._internal.memoize import Memoized
 from returns.functions import identity
 from returns.future import FutureResult
 from returns.interfaces.specific import reader
@@ -148,7 +150,9 @@ class RequiresContext(  # type: ignore[type-var]
           >>> assert first(False).map(lambda number: number * 10)(0.1) -1.0
 
         """
-        return RequiresContext(lambda deps: function(self(deps)))
+        return RequiresContext(
+            then(self._inner_value, lambda previous, _: function(previous)),
+        )
 
     def apply(
         self,
@@ -170,7 +174,10 @@ class RequiresContext(  # type: ignore[type-var]
 
         """
         return RequiresContext(
-            lambda deps: self.map(dekind(container)(deps))(deps),
+            then(
+                self._inner_value,
+                lambda previous, deps: dekind(container)(deps)(previous),
+            ),
         )
 
     def bind(
@@ -206,7 +213,12 @@ class RequiresContext(  # type: ignore[type-var]
           >>> assert first(False).bind(second)(2) == '<'
 
         """
-        return RequiresContext(lambda deps: dekind(function(self(deps)))(deps))
+        return RequiresContext(
+            then(
+                self._inner_value,
+                lambda previous, deps: dekind(function(previous))(deps),
+            ),
+        )
 
     #: Alias for `bind_context` method, it is the same as `bind` here.
     bind_context = bind
@@ -230,6 +242,39 @@ class RequiresContext(  # type: ignore[type-var]
         """
         return RequiresContext(lambda deps: self(function(deps)))
 
+    def memoize(self) -> RequiresContext[_ReturnType_co, _EnvType_contra]:
+        """
+        Runs this container once per ``deps`` inside of a scope.
+
+        It is useful when several branches of a program
+        depend on the same container, like loading a current user:
+        the first branch computes it, other branches reuse the result.
+        Results are shared only inside of
+        :func:`~returns.context.memoized_scope`
+        and dropped when it is closed,
+        outside of it the container runs on each call.
+
+        .. code:: python
+
+          >>> from returns.context import RequiresContext, memoized_scope
+
+          >>> calls = []
+          >>> def load(deps: int) -> int:
+          ...     calls.append(deps)
+          ...     return deps * 10
+
+          >>> config = RequiresContext(load).memoize()
+          >>> program = config.bind(
+          ...     lambda first: config.map(lambda second: first + second),
+          ... )
+          >>> with memoized_scope():
+          ...     assert program(1) == 20
+          ...     assert program(2) == 40
+          >>> assert calls == [1, 2]
+
+        """
+        return RequiresContext(Memoized(self._inner_value))
+
     @classmethod
     def ask(cls) -> RequiresContext[_EnvType_contra, _EnvType_contra]:
         """
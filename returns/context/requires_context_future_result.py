@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, TypeVar, final
 
-from returns._internal.futures import _reader_future_result
+from returns._internal.chain import prepare, then_async
+from returns._internal.futures import _future_result, _reader_future_result
+from returns._internal.memoize import Memoized
 from returns.context import NoDeps
-from returns.future import Future, FutureResult
+from returns.future import Deadline, Future, FutureResult
 from returns.interfaces.specific import future_result, reader_future_result
 from returns.io import IO, IOResult
 from returns.primitives.container import BaseContainer
-from returns.primitives.hkt import Kind3, SupportsKind3, dekind
+from returns.primitives.hkt import Kind3, SupportsKind3
 from returns.result import Result
 
 if TYPE_CHECKING:
@@ -197,7 +200,12 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
           >>> assert anyio.run(failure.swap(), ...) == IOSuccess(1)
 
         """
-        return RequiresContextFutureResult(lambda deps: self(deps).swap())
+        return RequiresContextFutureResult(
+            then_async(
+                self._inner_value,
+                lambda inner, _: inner.swap(),
+            ),
+        )
 
     def map(
         self,
@@ -224,7 +232,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).map(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: inner.map(function),
+            ),
         )
 
     def apply(
@@ -266,7 +277,11 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).apply(dekind(container)(deps)),
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.async_apply, container),
+                awaits=True,
+            ),
         )
 
     def bind(
@@ -312,10 +327,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind(
-                lambda inner: dekind(  # type: ignore[misc]
-                    function(inner),
-                )(deps),
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.bind, function),
+                awaits=True,
             ),
         )
 
@@ -368,12 +383,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: FutureResult(
-                _reader_future_result.async_bind_async(
-                    function,
-                    self,
-                    deps,
-                )
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.async_bind_async, function),
+                awaits=True,
             ),
         )
 
@@ -419,7 +432,14 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_awaitable(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.async_bind_awaitable(
+                    function,
+                    inner,
+                ),
+                awaits=True,
+            ),
         )
 
     def bind_result(
@@ -459,7 +479,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_result(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: inner.bind(function),
+            ),
         )
 
     def bind_context(
@@ -499,8 +522,9 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).map(
-                lambda inner: function(inner)(deps),  # type: ignore[misc]
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.bind_context, function),
             ),
         )
 
@@ -546,8 +570,9 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_result(
-                lambda inner: function(inner)(deps),  # type: ignore[misc]
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.bind_context_result, function),
             ),
         )
 
@@ -592,8 +617,12 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_ioresult(
-                lambda inner: function(inner)(deps),  # type: ignore[misc]
+            then_async(
+                self._inner_value,
+                partial(
+                    _reader_future_result.bind_context_ioresult,
+                    function,
+                ),
             ),
         )
 
@@ -627,7 +656,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_io(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.bind_io(function, inner),
+            ),
         )
 
     def bind_ioresult(
@@ -666,7 +698,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_ioresult(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.bind_ioresult(function, inner),
+            ),
         )
 
     def bind_future(
@@ -703,7 +738,14 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_future(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.async_bind_future(
+                    function,
+                    inner,
+                ),
+                awaits=True,
+            ),
         )
 
     def bind_future_result(
@@ -743,7 +785,11 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.bind(function, inner),
+                awaits=True,
+            ),
         )
 
     def bind_async_future(
@@ -780,7 +826,14 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_async_future(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.async_bind_async_future(
+                    function,
+                    inner,
+                ),
+                awaits=True,
+            ),
         )
 
     def bind_async_future_result(
@@ -822,7 +875,14 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).bind_async(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: _future_result.async_bind_async(
+                    function,
+                    inner,
+                ),
+                awaits=True,
+            ),
         )
 
     def alt(
@@ -856,7 +916,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).alt(function),
+            then_async(
+                self._inner_value,
+                lambda inner, _: inner.alt(function),
+            ),
         )
 
     def lash(
@@ -906,8 +969,10 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: self(deps).lash(
-                lambda inner: function(inner)(deps),  # type: ignore
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.lash, function),
+                awaits=True,
             ),
         )
 
@@ -956,15 +1021,64 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
 
         """
         return RequiresContextFutureResult(
-            lambda deps: FutureResult(
-                _reader_future_result.async_compose_result(
-                    function,
-                    self,
-                    deps,
-                ),
+            then_async(
+                self._inner_value,
+                partial(_reader_future_result.compose_result, function),
+                awaits=True,
             ),
         )
 
+    def timeout(
+        self,
+        seconds: float | Deadline,
+        on_timeout: Callable[[], _NewErrorType],
+    ) -> RequiresContextFutureResult[
+        _ValueType_co, _ErrorType_co | _NewErrorType, _EnvType_contra
+    ]:
+        """
+        Puts a time budget on this container for each call.
+
+        Works the same way as :meth:`returns.future.FutureResult.timeout`.
+        A :class:`returns.future.Deadline` can be passed inside ``deps``,
+        so each step only gets the time that remains:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.context import RequiresContextFutureResult
+          >>> from returns.future import Deadline, Future, FutureResult
+          >>> from returns.io import IOFailure, IOSuccess
+
+          >>> async def slow(arg: int) -> int:
+          ...     await anyio.sleep(arg)
+          ...     return arg
+
+          >>> def request(
+          ...     arg: int,
+          ... ) -> RequiresContextFutureResult[int, str, Deadline]:
+          ...     return RequiresContextFutureResult(
+          ...         lambda deadline: FutureResult.from_future(
+          ...             Future(slow(arg)),
+          ...         ).timeout(deadline, lambda: 'timeout'),
+          ...     )
+
+          >>> assert anyio.run(
+          ...     request(0).bind(request), Deadline.after(1),
+          ... ) == IOSuccess(0)
+          >>> assert anyio.run(
+          ...     request(1).bind(request), Deadline.after(0.01),
+          ... ) == IOFailure('timeout')
+
+          >>> assert anyio.run(
+          ...     request(1).timeout(0.01, lambda: 'budget'),
+          ...     Deadline.after(10),
+          ... ) == IOFailure('budget')
+
+        """
+        return RequiresContextFutureResult(
+            lambda deps: self(deps).timeout(seconds, on_timeout),
+        )
+
     def modify_env(
         self,
         function: Callable[[_NewEnvType], _EnvType_contra],
@@ -990,6 +1104,90 @@ class RequiresContextFutureResult(  # type: ignore[type-var]
         """
         return RequiresContextFutureResult(lambda deps: self(function(deps)))
 
+    def memoize(
+        self,
+    ) -> RequiresContextFutureResult[
+        _ValueType_co, _ErrorType_co, _EnvType_contra
+    ]:
+        """
+        Runs this container once per ``deps`` inside of a scope.
+
+        It is useful when several branches of a program
+        depend on the same container, like loading a current user:
+        the first branch computes it, other branches reuse the result.
+        All branches await the same ``FutureResult``,
+        so the work in flight is shared as well.
+        Results are shared only inside of
+        :func:`~returns.context.memoized_scope`
+        and dropped when it is closed,
+        outside of it the container runs on each call.
+        Containers must be awaited inside of the scope.
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.context import (
+          ...     RequiresContextFutureResult,
+          ...     memoized_scope,
+          ... )
+          >>> from returns.future import FutureResult
+          >>> from returns.io import IOSuccess
+
+          >>> calls = []
+          >>> def load(deps: int) -> FutureResult[int, str]:
+          ...     calls.append(deps)
+          ...     return FutureResult.from_value(deps * 10)
+
+          >>> user = RequiresContextFutureResult(load).memoize()
+          >>> program = user.bind(
+          ...     lambda first: user.map(lambda second: first + second),
+          ... )
+          >>> async def main(deps: int):
+          ...     with memoized_scope():
+          ...         return await program(deps)
+
+          >>> assert anyio.run(main, 1) == IOSuccess(20)
+          >>> assert calls == [1]
+
+        """
+        return RequiresContextFutureResult(Memoized(self._inner_value))
+
+    def compile(
+        self,
+    ) -> Callable[
+        [_EnvType_contra],
+        Awaitable[Result[_ValueType_co, _ErrorType_co]],
+    ]:
+        """
+        Prepares this container to be called many times.
+
+        Returns ``async`` function that takes ``deps``
+        and returns the final ``Result``.
+        It runs all steps in a single awaitable,
+        without any intermediate containers.
+        It is useful when the same program is built once
+        and then called with new ``deps`` for each request.
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.context import RequiresContextFutureResult
+          >>> from returns.result import Result, Success, Failure
+
+          >>> def check(number: int) -> Result[int, str]:
+          ...     return Success(number) if number > 0 else Failure('<')
+
+          >>> program = RequiresContextFutureResult[int, str, int].ask().map(
+          ...     lambda number: number + 1,
+          ... ).bind_result(check)
+          >>> run = program.compile()
+
+          >>> assert anyio.run(run, 1) == Success(2)
+          >>> assert anyio.run(run, -1) == Failure('<')
+
+        """
+        return prepare(self._inner_value)
+
     @classmethod
     def ask(
         cls,
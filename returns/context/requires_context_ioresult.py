@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, TypeVar, final
 
+from returns._internal.chain import then
+from returns._internal.memoize import Memoized
 from returns.context import NoDeps
 from returns.interfaces.specific import reader_ioresult
 from returns.io import IO, IOFailure, IOResult, IOSuccess
@@ -184,7 +186,9 @@ class RequiresContextIOResult(  # type: ignore[type-var]
           >>> assert failure.swap()(...) == IOSuccess(1)
 
         """
-        return RequiresContextIOResult(lambda deps: self(deps).swap())
+        return RequiresContextIOResult(
+            then(self._inner_value, lambda previous, _: previous.swap()),
+        )
 
     def map(
         self,
@@ -207,7 +211,9 @@ class RequiresContextIOResult(  # type: ignore[type-var]
           ... )(...) == IOFailure(1)
 
         """
-        return RequiresContextIOResult(lambda deps: self(deps).map(function))
+        return RequiresContextIOResult(
+            then(self._inner_value, lambda previous, _: previous.map(function)),
+        )
 
     def apply(
         self,
@@ -247,7 +253,10 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).apply(dekind(container)(deps)),
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.apply(dekind(container)(deps)),
+            ),
         )
 
     def bind(
@@ -289,10 +298,11 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).bind(
-                lambda inner: dekind(  # type: ignore[misc]
-                    function(inner),
-                )(deps),
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.bind(
+                    lambda inner: dekind(function(inner))(deps),
+                ),
             ),
         )
 
@@ -329,7 +339,10 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).bind_result(function),
+            then(
+                self._inner_value,
+                lambda previous, _: previous.bind_result(function),
+            ),
         )
 
     def bind_context(
@@ -362,8 +375,11 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).map(
-                lambda inner: function(inner)(deps),  # type: ignore[misc]
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.map(
+                    lambda inner: function(inner)(deps),
+                ),
             ),
         )
 
@@ -415,8 +431,11 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).bind_result(
-                lambda inner: function(inner)(deps),  # type: ignore[misc]
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.bind_result(
+                    lambda inner: function(inner)(deps),
+                ),
             ),
         )
 
@@ -445,7 +464,10 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).bind_io(function),
+            then(
+                self._inner_value,
+                lambda previous, _: previous.bind_io(function),
+            ),
         )
 
     def bind_ioresult(
@@ -479,7 +501,10 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).bind(function),
+            then(
+                self._inner_value,
+                lambda previous, _: previous.bind(function),
+            ),
         )
 
     def alt(
@@ -503,7 +528,9 @@ class RequiresContextIOResult(  # type: ignore[type-var]
           ... )(...) == IOFailure(2)
 
         """
-        return RequiresContextIOResult(lambda deps: self(deps).alt(function))
+        return RequiresContextIOResult(
+            then(self._inner_value, lambda previous, _: previous.alt(function)),
+        )
 
     def lash(
         self,
@@ -548,8 +575,11 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: self(deps).lash(
-                lambda inner: function(inner)(deps),  # type: ignore
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.lash(
+                    lambda inner: function(inner)(deps),  # type: ignore
+                ),
             ),
         )
 
@@ -590,9 +620,12 @@ class RequiresContextIOResult(  # type: ignore[type-var]
 
         """
         return RequiresContextIOResult(
-            lambda deps: dekind(
-                function(self(deps)._inner_value),  # noqa: SLF001
-            )(deps),
+            then(
+                self._inner_value,
+                lambda previous, deps: dekind(
+                    function(previous._inner_value),  # noqa: SLF001
+                )(deps),
+            ),
         )
 
     def modify_env(
@@ -618,6 +651,44 @@ class RequiresContextIOResult(  # type: ignore[type-var]
         """
         return RequiresContextIOResult(lambda deps: self(function(deps)))
 
+    def memoize(
+        self,
+    ) -> RequiresContextIOResult[_ValueType_co, _ErrorType, _EnvType_contra]:
+        """
+        Runs this container once per ``deps`` inside of a scope.
+
+        It is useful when several branches of a program
+        depend on the same container, like loading a current user:
+        the first branch computes it, other branches reuse the result.
+        Results are shared only inside of
+        :func:`~returns.context.memoized_scope`
+        and dropped when it is closed,
+        outside of it the container runs on each call.
+
+        .. code:: python
+
+          >>> from returns.context import (
+          ...     RequiresContextIOResult,
+          ...     memoized_scope,
+          ... )
+          >>> from returns.io import IOSuccess
+
+          >>> calls = []
+          >>> def load(deps: int) -> IOSuccess[int]:
+          ...     calls.append(deps)
+          ...     return IOSuccess(deps * 10)
+
+          >>> user = RequiresContextIOResult(load).memoize()
+          >>> program = user.bind(
+          ...     lambda first: user.map(lambda second: first + second),
+          ... )
+          >>> with memoized_scope():
+          ...     assert program(1) == IOSuccess(20)
+          >>> assert calls == [1]
+
+        """
+        return RequiresContextIOResult(Memoized(self._inner_value))
+
     @classmethod
     def ask(
         cls,
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias, TypeVar, final
 
+from returns._internal.chain import then
+from returns._internal.memoize import Memoized
 from returns.context import NoDeps
 from returns.interfaces.specific import reader_result
 from returns.primitives.container import BaseContainer
@@ -176,7 +178,9 @@ class RequiresContextResult(  # type: ignore[type-var]
           >>> assert failure.swap()(...) == Success(1)
 
         """
-        return RequiresContextResult(lambda deps: self(deps).swap())
+        return RequiresContextResult(
+            then(self._inner_value, lambda previous, _: previous.swap()),
+        )
 
     def map(
         self,
@@ -199,7 +203,9 @@ class RequiresContextResult(  # type: ignore[type-var]
           ... )(...) == Failure(1)
 
         """
-        return RequiresContextResult(lambda deps: self(deps).map(function))
+        return RequiresContextResult(
+            then(self._inner_value, lambda previous, _: previous.map(function)),
+        )
 
     def apply(
         self,
@@ -235,7 +241,10 @@ class RequiresContextResult(  # type: ignore[type-var]
 
         """
         return RequiresContextResult(
-            lambda deps: self(deps).apply(dekind(container)(deps)),
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.apply(dekind(container)(deps)),
+            ),
         )
 
     def bind(
@@ -277,8 +286,11 @@ class RequiresContextResult(  # type: ignore[type-var]
 
         """
         return RequiresContextResult(
-            lambda deps: self(deps).bind(
-                lambda inner: function(inner)(deps),  # type: ignore
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.bind(
+                    lambda inner: function(inner)(deps),  # type: ignore
+                ),
             ),
         )
 
@@ -315,7 +327,12 @@ class RequiresContextResult(  # type: ignore[type-var]
           ... )(RequiresContextResult.no_args) == Failure(':(')
 
         """
-        return RequiresContextResult(lambda deps: self(deps).bind(function))
+        return RequiresContextResult(
+            then(
+                self._inner_value,
+                lambda previous, _: previous.bind(function),
+            ),
+        )
 
     def bind_context(
         self,
@@ -347,8 +364,11 @@ class RequiresContextResult(  # type: ignore[type-var]
 
         """
         return RequiresContextResult(
-            lambda deps: self(deps).map(
-                lambda inner: function(inner)(deps),  # type: ignore[misc]
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.map(
+                    lambda inner: function(inner)(deps),
+                ),
             ),
         )
 
@@ -373,7 +393,9 @@ class RequiresContextResult(  # type: ignore[type-var]
           ... )(...) == Failure(2)
 
         """
-        return RequiresContextResult(lambda deps: self(deps).alt(function))
+        return RequiresContextResult(
+            then(self._inner_value, lambda previous, _: previous.alt(function)),
+        )
 
     def lash(
         self,
@@ -416,8 +438,11 @@ class RequiresContextResult(  # type: ignore[type-var]
 
         """
         return RequiresContextResult(
-            lambda deps: self(deps).lash(
-                lambda inner: function(inner)(deps),  # type: ignore
+            then(
+                self._inner_value,
+                lambda previous, deps: previous.lash(
+                    lambda inner: function(inner)(deps),  # type: ignore
+                ),
             ),
         )
 
@@ -444,6 +469,41 @@ class RequiresContextResult(  # type: ignore[type-var]
         """
         return RequiresContextResult(lambda deps: self(function(deps)))
 
+    def memoize(
+        self,
+    ) -> RequiresContextResult[_ValueType_co, _ErrorType_co, _EnvType_contra]:
+        """
+        Runs this container once per ``deps`` inside of a scope.
+
+        It is useful when several branches of a program
+        depend on the same container, like loading a current user:
+        the first branch computes it, other branches reuse the result.
+        Results are shared only inside of
+        :func:`~returns.context.memoized_scope`
+        and dropped when it is closed,
+        outside of it the container runs on each call.
+
+        .. code:: python
+
+          >>> from returns.context import RequiresContextResult, memoized_scope
+          >>> from returns.result import Success
+
+          >>> calls = []
+          >>> def load(deps: int) -> Success[int]:
+          ...     calls.append(deps)
+          ...     return Success(deps * 10)
+
+          >>> config = RequiresContextResult(load).memoize()
+          >>> program = config.bind(
+          ...     lambda first: config.map(lambda second: first + second),
+          ... )
+          >>> with memoized_scope():
+          ...     assert program(1) == Success(20)
+          >>> assert calls == [1]
+
+        """
+        return RequiresContextResult(Memoized(self._inner_value))
+
     @classmethod
     def ask(
         cls,
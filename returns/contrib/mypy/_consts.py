@@ -16,6 +16,11 @@ TYPED_FLOW_FUNCTION: Final = 'returns._internal.pipeline.flow.flow'
 TYPED_PIPE_FUNCTION: Final = 'returns._internal.pipeline.pipe.pipe'
 TYPED_PIPE_METHOD: Final = 'returns._internal.pipeline.pipe._Pipe.__call__'
 
+#: Used for typed ``compile_pipe`` call, it returns the same ``_Pipe`` type.
+TYPED_COMPILE_PIPE_FUNCTION: Final = (
+    'returns._internal.pipeline.compiled.compile_pipe'
+)
+
 #: Used for HKT emulation.
 TYPED_KINDN: Final = 'returns.primitives.hkt.KindN'
 TYPED_KINDN_ACCESS: Final = f'{TYPED_KINDN}.'
@@ -63,6 +63,7 @@ class _ReturnsPlugin(Plugin):
         _consts.TYPED_CURRY_FUNCTION: curry.analyze,
         _consts.TYPED_FLOW_FUNCTION: flow.analyze,
         _consts.TYPED_PIPE_FUNCTION: pipe.analyze,
+        _consts.TYPED_COMPILE_PIPE_FUNCTION: pipe.analyze,
         _consts.TYPED_KIND_DEKIND: kind.dekind,
     }
 
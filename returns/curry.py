@@ -1,8 +1,8 @@
 from collections.abc import Callable
 from functools import partial as _partial
 from functools import wraps
-from inspect import BoundArguments, Signature
-from typing import Any, TypeAlias, TypeVar
+from inspect import Parameter, Signature
+from typing import Any, Final, TypeVar, final
 
 _ReturnType = TypeVar('_ReturnType')
 
@@ -88,7 +88,10 @@ def curry(function: Callable[..., _ReturnType]) -> Callable[..., _ReturnType]:
 
     Limitations:
 
-    - It is kinda slow. Like 100 times slower than a regular function call.
+    - It is slower than a regular function call,
+      each partial application creates a new function.
+      Functions with ``*args`` or ``**kwargs`` are even slower,
+      because their arguments are bound with ``inspect`` on every call
     - It does not work with several builtins like ``str``, ``int``,
       and possibly other ``C`` defined callables
     - ``*args`` and ``**kwargs`` are not supported
@@ -116,17 +119,17 @@ def curry(function: Callable[..., _ReturnType]) -> Callable[..., _ReturnType]:
     - https://stackoverflow.com/questions/218025/
 
     """
-    argspec = Signature.from_callable(function).bind_partial()
+    plan = _BindingPlan(Signature.from_callable(function))
 
     def decorator(*args, **kwargs):
-        return _eager_curry(function, argspec, args, kwargs)
+        return _eager_curry(function, plan, args, kwargs)
 
     return wraps(function)(decorator)
 
 
 def _eager_curry(
     function: Callable[..., _ReturnType],
-    argspec,
+    plan: '_BindingPlan',
     args: tuple,
     kwargs: dict,
 ) -> _ReturnType | Callable[..., _ReturnType]:
@@ -136,55 +139,133 @@ def _eager_curry(
     The interesting part about it is that it return the result
     or a new callable that will return a result at some point.
     """
-    intermediate, full_args = _intermediate_argspec(argspec, args, kwargs)
-    if full_args is not None:
-        return function(*full_args[0], **full_args[1])
+    if plan.is_complete(args, kwargs):
+        return function(*args, **kwargs)
+
+    bound_args, bound_kwargs = plan.bind_partial(args, kwargs)
 
     # We use closures to avoid names conflict between
     # the function args and args of the curry implementation.
     def decorator(*inner_args, **inner_kwargs):
-        return _eager_curry(function, intermediate, inner_args, inner_kwargs)
+        return _eager_curry(
+            function,
+            plan,
+            bound_args + inner_args,
+            {**bound_kwargs, **inner_kwargs},
+        )
 
     return wraps(function)(decorator)
 
 
-_ArgSpec: TypeAlias = (
-    # Case when all arguments are bound and function can be called:
-    tuple[None, tuple[tuple, dict]]
-    |
-    # Case when there are still unbound arguments:
-    tuple[BoundArguments, None]
-)
-
-
-def _intermediate_argspec(
-    argspec: BoundArguments,
-    args: tuple,
-    kwargs: dict,
-) -> _ArgSpec:
+@final
+class _BindingPlan:
     """
     That's where ``curry`` magic happens.
 
-    We use ``Signature`` objects from ``inspect`` to bind existing arguments.
-
-    If there's a ``TypeError`` while we ``bind`` the arguments we try again.
-    The second time we try to ``bind_partial`` arguments. It can fail too!
-    It fails when there are invalid arguments
-    or more arguments than we can fit in a function.
+    We compute the layout of function's arguments only once:
+    which names can be passed positionally, which can be passed by keywords,
+    and which arguments do not have default values.
+    This is enough to tell complete and partial calls apart
+    without binding arguments on every call.
 
-    This function is slow. Any optimization ideas are welcome!
+    When arguments are invalid, we still use ``inspect.Signature``
+    to raise exactly the same ``TypeError`` as before.
+    Functions with ``*args`` or ``**kwargs``
+    are always processed with ``inspect.Signature``.
     """
-    full_args = argspec.args + args
-    full_kwargs = {**argspec.kwargs, **kwargs}
-
-    try:
-        argspec.signature.bind(*full_args, **full_kwargs)
-    except TypeError:
-        # Another option is to copy-paste and patch `getcallargs` func
-        # but in this case we get responsibility to maintain it over
-        # python releases.
-        # This place is also responsible for raising ``TypeError`` for cases:
-        # 1. When incorrect argument is provided
-        # 2. When too many arguments are provided
-        return argspec.signature.bind_partial(*full_args, **full_kwargs), None
-    return None, (full_args, full_kwargs)
+
+    __slots__ = (
+        '_keywords',
+        '_positional',
+        '_required_keywords',
+        '_required_positional',
+        '_signature',
+    )
+
+    _positional: tuple[str, ...] | None
+
+    def __init__(self, signature: Signature) -> None:
+        self._signature = signature
+        arguments = signature.parameters.values()
+        if any(argument.kind in _VARIADIC for argument in arguments):
+            self._positional = None
+            return
+
+        positional = [
+            argument for argument in arguments if argument.kind in _POSITIONAL
+        ]
+        self._positional = tuple(argument.name for argument in positional)
+        self._required_positional = tuple(
+            argument.name
+            for argument in positional
+            if argument.default is _EMPTY
+        )
+        self._keywords = frozenset(
+            argument.name
+            for argument in arguments
+            if argument.kind is not Parameter.POSITIONAL_ONLY
+        )
+        self._required_keywords = frozenset(
+            argument.name
+            for argument in arguments
+            if argument.kind is Parameter.KEYWORD_ONLY
+            and argument.default is _EMPTY
+        )
+
+    def is_complete(self, args: tuple, kwargs: dict) -> bool:
+        """Tells whether the function can be called with these arguments."""
+        if self._positional is None:
+            return self._signature_is_complete(args, kwargs)
+        if not self._is_valid(args, kwargs):
+            # Raises `TypeError` with the same message as regular calls:
+            self._signature.bind_partial(*args, **kwargs)
+        return kwargs.keys() >= self._required_keywords and all(
+            name in kwargs for name in self._required_positional[len(args) :]
+        )
+
+    def bind_partial(self, args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+        """
+        Moves leading keyword arguments to positional ones.
+
+        It works the same way as ``BoundArguments`` does,
+        so later positional arguments are bound to the next parameters.
+        """
+        if self._positional is None:
+            bound = self._signature.bind_partial(*args, **kwargs)
+            return bound.args, bound.kwargs
+
+        kwargs = dict(kwargs)
+        for name in self._positional[len(args) :]:
+            if name not in kwargs:
+                break
+            args = (*args, kwargs.pop(name))
+        return args, kwargs
+
+    def _is_valid(self, args: tuple, kwargs: dict) -> bool:
+        if len(args) > len(self._positional):  # type: ignore[arg-type]
+            return False
+        return all(
+            name in self._keywords and name not in self._positional[: len(args)]  # type: ignore[index]
+            for name in kwargs
+        )
+
+    def _signature_is_complete(self, args: tuple, kwargs: dict) -> bool:
+        try:
+            self._signature.bind(*args, **kwargs)
+        except TypeError:
+            # This place is also responsible for raising ``TypeError``
+            # for incorrect arguments and for too many arguments:
+            self._signature.bind_partial(*args, **kwargs)
+            return False
+        return True
+
+
+_POSITIONAL: Final = frozenset((
+    Parameter.POSITIONAL_ONLY,
+    Parameter.POSITIONAL_OR_KEYWORD,
+))
+_VARIADIC: Final = frozenset((
+    Parameter.VAR_POSITIONAL,
+    Parameter.VAR_KEYWORD,
+))
+_EMPTY: Final = Parameter.empty
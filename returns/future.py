@@ -1,3 +1,6 @@
+import inspect
+import math
+import time
 from collections.abc import (
     AsyncGenerator,
     AsyncIterator,
@@ -5,13 +8,34 @@ from collections.abc import (
     Callable,
     Coroutine,
     Generator,
+    Hashable,
+    Mapping,
+)
+from concurrent.futures import Executor
+from contextlib import suppress
+from functools import partial, wraps
+from typing import (
+    Any,
+    Generic,
+    Literal,
+    Never,
+    TypeAlias,
+    TypeVar,
+    final,
+    overload,
 )
-from functools import wraps
-from typing import Any, TypeAlias, TypeVar, final, overload
 
 from typing_extensions import ParamSpec
 
-from returns._internal.futures import _future, _future_result
+from returns._internal.caching import make_key
+from returns._internal.futures import (
+    _batch,
+    _cache,
+    _future,
+    _future_result,
+    _race,
+    _timeout,
+)
 from returns.interfaces.specific.future import FutureBased1
 from returns.interfaces.specific.future_result import FutureResultBased2
 from returns.io import IO, IOResult
@@ -38,6 +62,9 @@ _FuncParams = ParamSpec('_FuncParams')
 # Aliases:
 _FirstType = TypeVar('_FirstType')
 
+#: Where blocking functions are offloaded to.
+Offload: TypeAlias = Literal['thread', 'process'] | Executor
+
 
 # Public composition helpers:
 
@@ -99,7 +126,7 @@ class Future(  # type: ignore[type-var]
 
     __slots__ = ()
 
-    _inner_value: Awaitable[_ValueType_co]
+    _inner_value: ReAwaitable[_ValueType_co]
 
     def __init__(self, inner_value: Awaitable[_ValueType_co]) -> None:
         """
@@ -118,7 +145,7 @@ class Future(  # type: ignore[type-var]
           >>> assert anyio.run(container.awaitable) == IO(2)
 
         """
-        super().__init__(ReAwaitable(inner_value))
+        super().__init__(_reawaitable(inner_value))
 
     def __await__(self) -> Generator[None, None, IO[_ValueType_co]]:
         """
@@ -146,7 +173,7 @@ class Future(  # type: ignore[type-var]
             - https://bit.ly/2SfayNc
 
         """
-        return self.awaitable().__await__()
+        return self._inner_value.map(IO).__await__()
 
     async def awaitable(self) -> IO[_ValueType_co]:
         """
@@ -194,7 +221,7 @@ class Future(  # type: ignore[type-var]
           ... ) == IO(2)
 
         """
-        return Future(_future.async_map(function, self._inner_value))
+        return Future(self._inner_value.map(function))
 
     def apply(
         self,
@@ -218,7 +245,11 @@ class Future(  # type: ignore[type-var]
           ... ) == IO('1b')
 
         """
-        return Future(_future.async_apply(dekind(container), self._inner_value))
+        return Future(
+            self._inner_value.bind(
+                partial(_future.async_apply, dekind(container)),
+            ),
+        )
 
     def bind(
         self,
@@ -244,7 +275,7 @@ class Future(  # type: ignore[type-var]
           ... ) == IO(2)
 
         """
-        return Future(_future.async_bind(function, self._inner_value))
+        return Future(self._inner_value.bind(partial(_future.bind, function)))
 
     #: Alias for `bind` method. Part of the `FutureBasedN` interface.
     bind_future = bind
@@ -277,7 +308,9 @@ class Future(  # type: ignore[type-var]
           ... ) == IO('2')
 
         """
-        return Future(_future.async_bind_async(function, self._inner_value))
+        return Future(
+            self._inner_value.bind(partial(_future.async_bind_async, function)),
+        )
 
     #: Alias for `bind_async` method. Part of the `FutureBasedN` interface.
     bind_async_future = bind_async
@@ -307,12 +340,7 @@ class Future(  # type: ignore[type-var]
           ... ) == IO(2)
 
         """
-        return Future(
-            _future.async_bind_awaitable(
-                function,
-                self._inner_value,
-            )
-        )
+        return Future(self._inner_value.bind(function))
 
     def bind_io(
         self,
@@ -338,7 +366,7 @@ class Future(  # type: ignore[type-var]
           ... ) == IO(2)
 
         """
-        return Future(_future.async_bind_io(function, self._inner_value))
+        return Future(self._inner_value.map(partial(_future.bind_io, function)))
 
     def __aiter__(self) -> AsyncIterator[_ValueType_co]:  # noqa: WPS611
         """API for :ref:`do-notation`."""
@@ -400,7 +428,7 @@ class Future(  # type: ignore[type-var]
           >>> assert anyio.run(main) is True
 
         """
-        return Future(async_identity(inner_value))
+        return Future(ReAwaitable.from_value(inner_value))
 
     @classmethod
     def from_future(
@@ -440,7 +468,9 @@ class Future(  # type: ignore[type-var]
           >>> assert anyio.run(main) is True
 
         """
-        return Future(async_identity(inner_value._inner_value))  # noqa: SLF001
+        return Future(
+            ReAwaitable.from_value(inner_value._inner_value),  # noqa: SLF001
+        )
 
     @classmethod
     def from_future_result(
@@ -466,6 +496,13 @@ class Future(  # type: ignore[type-var]
         return Future(inner_value._inner_value)  # noqa: SLF001
 
 
+def _reawaitable(inner_value: Awaitable[_FirstType]) -> ReAwaitable[_FirstType]:
+    """Wraps awaitable into ``ReAwaitable``, if it is not wrapped yet."""
+    if isinstance(inner_value, ReAwaitable):
+        return inner_value
+    return ReAwaitable(inner_value)
+
+
 # Decorators:
 
 
@@ -499,9 +536,35 @@ def future(
     return decorator
 
 
+@overload
 def asyncify(
     function: Callable[_FuncParams, _ValueType_co],
-) -> Callable[_FuncParams, Coroutine[Any, Any, _ValueType_co]]:
+    *,
+    executor: Offload | None = None,
+) -> Callable[_FuncParams, Coroutine[Any, Any, _ValueType_co]]: ...
+
+
+@overload
+def asyncify(
+    *,
+    executor: Offload,
+) -> Callable[
+    [Callable[_FuncParams, _ValueType_co]],
+    Callable[_FuncParams, Coroutine[Any, Any, _ValueType_co]],
+]: ...
+
+
+def asyncify(  # noqa: WPS234
+    function: Callable[_FuncParams, _ValueType_co] | None = None,
+    *,
+    executor: Offload | None = None,
+) -> (
+    Callable[_FuncParams, Coroutine[Any, Any, _ValueType_co]]
+    | Callable[
+        [Callable[_FuncParams, _ValueType_co]],
+        Callable[_FuncParams, Coroutine[Any, Any, _ValueType_co]],
+    ]
+):
     """
     Decorator to turn a common function into an asynchronous function.
 
@@ -529,10 +592,34 @@ def asyncify(
 
       >>> assert anyio.run(test, 1) == 2
 
+    Blocking functions can be offloaded with ``executor`` argument.
+    Use ``'thread'`` to run them in ``anyio`` worker threads,
+    ``'process'`` to run them in ``anyio`` worker processes,
+    or pass any :class:`concurrent.futures.Executor` instance:
+
+    .. code:: python
+
+      >>> @asyncify(executor='thread')
+      ... def blocking(x: int) -> int:
+      ...     return x + 1
+
+      >>> assert anyio.run(blocking, 1) == 2
+
+    Both worker threads and worker processes are limited
+    by ``anyio`` default capacity limiters.
+    Calls to ``Executor`` instances are only limited by the executor itself,
+    they don't take any ``anyio`` worker threads while they wait.
+    Only sync functions can be offloaded.
+    ``anyio`` must be installed to use ``executor``.
+
     Read more about async and sync functions:
     https://journal.stuffwithstuff.com/2015/02/01/what-color-is-your-function/
 
     """
+    if function is None:
+        return partial(asyncify, executor=executor)
+    if executor is not None:
+        return _offloaded(function, executor)
 
     @wraps(function)
     async def decorator(  # noqa: RUF029
@@ -544,6 +631,77 @@ def asyncify(
     return decorator
 
 
+def _offloaded(
+    function: Callable[_FuncParams, _ValueType_co],
+    executor: Offload,
+) -> Callable[_FuncParams, Coroutine[Any, Any, _ValueType_co]]:
+    if inspect.iscoroutinefunction(function):
+        raise TypeError(
+            f'Only sync functions can be offloaded, got: {function!r}',
+        )
+
+    @wraps(function)
+    async def decorator(
+        *args: _FuncParams.args,
+        **kwargs: _FuncParams.kwargs,
+    ) -> _ValueType_co:
+        return await _offload(executor, partial(function, *args, **kwargs))
+
+    return decorator
+
+
+async def _offload(
+    executor: Offload,
+    function: Callable[[], _FirstType],
+) -> _FirstType:
+    """Runs a blocking function outside of the event loop."""
+    import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+    if executor == 'thread':
+        return await anyio.to_thread.run_sync(function)
+    if executor == 'process':
+        return await anyio.to_process.run_sync(function)
+
+    future = executor.submit(function)
+    done = anyio.Event()
+    future.add_done_callback(partial(_call_soon, _get_scheduler(), done.set))
+    try:
+        await done.wait()
+    except BaseException:
+        # Does nothing if `function` is already running or finished:
+        future.cancel()
+        raise
+    return future.result()
+
+
+def _get_scheduler() -> Callable[[Callable[[], object]], object]:
+    """
+    Returns a thread-safe way to call functions in the current event loop.
+
+    This way executor's futures are awaited without worker threads.
+    """
+    import asyncio  # noqa: PLC0415
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # `anyio` supports only `asyncio` and `trio`:
+        import trio  # noqa: PLC0415
+
+        return trio.lowlevel.current_trio_token().run_sync_soon
+    return loop.call_soon_threadsafe
+
+
+def _call_soon(
+    scheduler: Callable[[Callable[[], object]], object],
+    callback: Callable[[], object],
+    _future: object,
+) -> None:
+    # Event loop can be closed already, when a cancelled call ends:
+    with suppress(RuntimeError):
+        scheduler(callback)
+
+
 # FutureResult
 # ============
 
@@ -586,7 +744,7 @@ class FutureResult(  # type: ignore[type-var]
 
     __slots__ = ()
 
-    _inner_value: Awaitable[Result[_ValueType_co, _ErrorType_co]]
+    _inner_value: ReAwaitable[Result[_ValueType_co, _ErrorType_co]]
 
     def __init__(
         self,
@@ -609,7 +767,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> assert anyio.run(container.awaitable) == IOSuccess(2)
 
         """
-        super().__init__(ReAwaitable(inner_value))
+        super().__init__(_reawaitable(inner_value))
 
     def __await__(
         self,
@@ -643,7 +801,7 @@ class FutureResult(  # type: ignore[type-var]
             - https://bit.ly/2SfayNc
 
         """
-        return self.awaitable().__await__()
+        return self._inner_value.map(IOResult.from_result).__await__()
 
     async def awaitable(self) -> IOResult[_ValueType_co, _ErrorType_co]:
         """
@@ -687,7 +845,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> assert anyio.run(FutureFailure(1).swap) == IOSuccess(1)
 
         """
-        return FutureResult(_future_result.async_swap(self._inner_value))
+        return FutureResult(self._inner_value.map(_future_result.swap))
 
     def map(
         self,
@@ -719,10 +877,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_map(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.map(
+                partial(_future_result.map_, function),
+            ),
         )
 
     def apply(
@@ -769,10 +926,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_apply(
-                dekind(container),
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.async_apply, dekind(container)),
+            ),
         )
 
     def bind(
@@ -806,10 +962,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.bind, function),
+            ),
         )
 
     #: Alias for `bind` method.
@@ -848,10 +1003,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_async(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.async_bind_async, function),
+            ),
         )
 
     #: Alias for `bind_async` method.
@@ -887,10 +1041,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_awaitable(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.async_bind_awaitable, function),
+            ),
         )
 
     def bind_result(
@@ -921,10 +1074,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_result(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.map(
+                partial(_future_result.bind_result, function),
+            ),
         )
 
     def bind_ioresult(
@@ -954,10 +1106,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_ioresult(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.map(
+                partial(_future_result.bind_ioresult, function),
+            ),
         )
 
     def bind_io(
@@ -985,10 +1136,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_io(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.map(
+                partial(_future_result.bind_io, function),
+            ),
         )
 
     def bind_future(
@@ -1016,10 +1166,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_future(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.async_bind_future, function),
+            ),
         )
 
     def bind_async_future(
@@ -1052,10 +1201,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_bind_async_future(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.async_bind_async_future, function),
+            ),
         )
 
     def alt(
@@ -1083,10 +1231,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_alt(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.map(
+                partial(_future_result.alt, function),
+            ),
         )
 
     def lash(
@@ -1117,10 +1264,9 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_lash(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.lash, function),
+            ),
         )
 
     def compose_result(
@@ -1156,10 +1302,57 @@ class FutureResult(  # type: ignore[type-var]
 
         """
         return FutureResult(
-            _future_result.async_compose_result(
-                function,
-                self._inner_value,
-            )
+            self._inner_value.bind(
+                partial(_future_result.compose_result, function),
+            ),
+        )
+
+    def timeout(
+        self,
+        seconds: 'float | Deadline',
+        on_timeout: Callable[[], _NewErrorType],
+    ) -> 'FutureResult[_ValueType_co, _ErrorType_co | _NewErrorType]':
+        """
+        Puts a time budget on this container and all its pending steps.
+
+        When time runs out, the result is ``Failure``
+        created by ``on_timeout``.
+        We stop waiting for this container, but its work is not cancelled:
+        it runs in its own task, so this container can still be awaited
+        by other callers or later.
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.future import Future, FutureResult
+          >>> from returns.io import IOFailure, IOSuccess
+
+          >>> async def slow(arg: int) -> int:
+          ...     await anyio.sleep(arg)
+          ...     return arg
+
+          >>> def request(arg: int) -> FutureResult[int, str]:
+          ...     return FutureResult.from_future(Future(slow(arg)))
+
+          >>> assert anyio.run(
+          ...     request(0).timeout(1, lambda: 'timeout').awaitable,
+          ... ) == IOSuccess(0)
+          >>> assert anyio.run(
+          ...     request(1).bind(request).timeout(
+          ...         0.01, lambda: 'timeout',
+          ...     ).awaitable,
+          ... ) == IOFailure('timeout')
+
+        The budget is counted from the moment we start to await.
+        ``seconds`` can also be a :class:`returns.future.Deadline`,
+        in this case only the remaining time is used.
+        Steps that run inside can check the remaining budget
+        with :meth:`returns.future.Deadline.current`.
+
+        Requires ``anyio`` to be installed.
+        """
+        return FutureResult(
+            _timeout.timeout(self._inner_value, seconds, on_timeout),
         )
 
     def __aiter__(self) -> AsyncIterator[_ValueType_co]:  # noqa: WPS611
@@ -1265,7 +1458,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> anyio.run(main)
 
         """
-        return FutureResult(_future_result.async_from_success(inner_value))
+        return FutureResult(inner_value._inner_value.map(Success))  # noqa: SLF001
 
     @classmethod
     def from_failed_future(
@@ -1289,7 +1482,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> anyio.run(main)
 
         """
-        return FutureResult(_future_result.async_from_failure(inner_value))
+        return FutureResult(inner_value._inner_value.map(Failure))  # noqa: SLF001
 
     @classmethod
     def from_future_result(
@@ -1389,7 +1582,9 @@ class FutureResult(  # type: ignore[type-var]
           >>> anyio.run(main)
 
         """
-        return FutureResult(async_identity(inner_value._inner_value))  # noqa: SLF001
+        return FutureResult(
+            ReAwaitable.from_value(inner_value._inner_value),  # noqa: SLF001
+        )
 
     @classmethod
     def from_result(
@@ -1417,7 +1612,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> anyio.run(main)
 
         """
-        return FutureResult(async_identity(inner_value))
+        return FutureResult(ReAwaitable.from_value(inner_value))
 
     @classmethod
     def from_value(
@@ -1441,7 +1636,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> anyio.run(main)
 
         """
-        return FutureResult(async_identity(Success(inner_value)))
+        return FutureResult(ReAwaitable.from_value(Success(inner_value)))
 
     @classmethod
     def from_failure(
@@ -1465,7 +1660,7 @@ class FutureResult(  # type: ignore[type-var]
           >>> anyio.run(main)
 
         """
-        return FutureResult(async_identity(Failure(inner_value)))
+        return FutureResult(ReAwaitable.from_value(Failure(inner_value)))
 
 
 def FutureSuccess(  # noqa: N802
@@ -1517,6 +1712,212 @@ FutureResultE: TypeAlias = FutureResult[_ValueType_co, Exception]
 _ExceptionType = TypeVar('_ExceptionType', bound=Exception)
 
 
+# Timeouts:
+
+
+@final
+class Deadline:
+    """
+    Point in time when some work must be finished.
+
+    Unlike a timeout, a deadline does not grow
+    when it is passed from one step to another,
+    so each step only gets the time that remains.
+
+    .. code:: python
+
+      >>> from returns.future import Deadline
+
+      >>> deadline = Deadline.after(10)
+      >>> assert 0 < deadline.remaining() <= 10
+      >>> assert Deadline.after(-1).remaining() == 0
+
+    Use it with :meth:`returns.future.FutureResult.timeout`.
+    """
+
+    __slots__ = ('_when',)
+
+    def __init__(self, when: float) -> None:
+        """Creates a deadline from :func:`time.monotonic` clock value."""
+        self._when = when
+
+    def __repr__(self) -> str:
+        """Shows the remaining time."""
+        return f'<Deadline: {self.remaining():.3f}s remaining>'
+
+    @classmethod
+    def after(cls, seconds: float) -> 'Deadline':
+        """Creates a deadline that will pass in given ``seconds``."""
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def current(cls) -> 'Deadline | None':
+        """
+        Returns the deadline of the running task.
+
+        It is set by :meth:`returns.future.FutureResult.timeout`
+        or by any other ``anyio`` cancel scope.
+        Returns ``None`` when there's no deadline.
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.future import Deadline, FutureResult
+          >>> from returns.io import IOSuccess
+
+          >>> async def remaining() -> float:
+          ...     deadline = Deadline.current()
+          ...     return deadline.remaining() if deadline else -1
+
+          >>> def pipeline() -> FutureResult[float, str]:
+          ...     return FutureResult.from_value(1).bind(
+          ...         lambda _: FutureResult.from_future(Future(remaining())),
+          ...     )
+
+          >>> assert anyio.run(pipeline().awaitable) == IOSuccess(-1)
+          >>> assert anyio.run(
+          ...     pipeline()
+          ...     .timeout(10, lambda: 'timeout')
+          ...     .map(lambda budget: 0 < budget <= 10)
+          ...     .awaitable,
+          ... ) == IOSuccess(True)
+
+        """
+        import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+        when = _timeout.deadline()
+        effective = anyio.current_effective_deadline()
+        if effective != math.inf:
+            when = min(
+                when, time.monotonic() + effective - anyio.current_time()
+            )
+        return None if when == math.inf else cls(when)
+
+    def remaining(self) -> float:
+        """Returns the number of seconds left, never negative."""
+        return max(self._when - time.monotonic(), 0)
+
+
+# Tail latency:
+
+
+def race(
+    *containers: FutureResult[_NewValueType, _NewErrorType],
+) -> FutureResult[_NewValueType, _NewErrorType]:
+    """
+    Creates ``FutureResult`` from the first finished container.
+
+    All containers are awaited concurrently.
+    When one of them is finished, successfully or not,
+    we stop waiting for all other containers.
+    They run in their own tasks and are not cancelled,
+    so they can still be awaited by other callers or later.
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.future import Future, FutureResult, race
+      >>> from returns.io import IOSuccess
+
+      >>> async def slow() -> int:
+      ...     await anyio.sleep(1)
+      ...     return 1
+
+      >>> assert anyio.run(race(
+      ...     FutureResult.from_future(Future(slow())),
+      ...     FutureResult.from_value(2),
+      ... ).awaitable) == IOSuccess(2)
+
+    Requires ``anyio`` to be installed.
+    See also :func:`returns.future.first_success`.
+    """
+    if not containers:
+        raise ValueError('At least one container is required to race')
+    return FutureResult(_race.race(containers))
+
+
+def first_success(
+    *containers: FutureResult[_NewValueType, _NewErrorType],
+) -> FutureResult[_NewValueType, tuple[_NewErrorType, ...]]:
+    """
+    Creates ``FutureResult`` from the first successful container.
+
+    All containers are awaited concurrently.
+    When one of them succeeds, we stop waiting for all other containers.
+    Like in :func:`returns.future.race`,
+    they are not cancelled and can still be awaited.
+    When all of them fail, failures are collected in the order of arguments.
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.future import FutureFailure, FutureSuccess, first_success
+      >>> from returns.io import IOFailure, IOSuccess
+
+      >>> assert anyio.run(first_success(
+      ...     FutureFailure('a'),
+      ...     FutureSuccess(1),
+      ... ).awaitable) == IOSuccess(1)
+
+      >>> assert anyio.run(first_success(
+      ...     FutureFailure('a'),
+      ...     FutureFailure('b'),
+      ... ).awaitable) == IOFailure(('a', 'b'))
+
+    Requires ``anyio`` to be installed.
+    See also :func:`returns.future.race`.
+    """
+    if not containers:
+        raise ValueError('At least one container is required to race')
+    return FutureResult(_race.first_success(containers))
+
+
+def hedge(
+    factory: Callable[[], FutureResult[_NewValueType, _NewErrorType]],
+    *,
+    after: float,
+    max_attempts: int = 2,
+) -> FutureResult[_NewValueType, _NewErrorType]:
+    """
+    Sends duplicate requests when the first one is too slow.
+
+    ``factory`` creates a new attempt each time it is called.
+    If an attempt has not answered within ``after`` seconds,
+    the next attempt is started, while previous ones keep running.
+    If an attempt fails, the next one is started right away.
+    The first successful attempt wins, all other attempts are cancelled.
+    When all ``max_attempts`` attempts fail, the last failure is returned.
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.future import FutureResult, hedge
+      >>> from returns.io import IOSuccess
+
+      >>> calls = []
+      >>> async def request() -> int:
+      ...     calls.append(len(calls))
+      ...     await anyio.sleep(1 if len(calls) == 1 else 0)
+      ...     return len(calls)
+
+      >>> hedged = hedge(
+      ...     lambda: FutureResult.from_future(Future(request())),
+      ...     after=0.01,
+      ... )
+      >>> assert anyio.run(hedged.awaitable) == IOSuccess(2)
+      >>> assert calls == [0, 1]
+
+    ``factory`` is only called for started attempts,
+    so no coroutines are left unawaited.
+    Requires ``anyio`` to be installed.
+    """
+    if max_attempts < 1:
+        raise ValueError(
+            f'Hedging requires at least one attempt, got: {max_attempts}',
+        )
+    return FutureResult(_race.hedge(factory, after, max_attempts))
+
+
 # Decorators:
 
 
@@ -1536,17 +1937,59 @@ def future_safe(
 ]: ...
 
 
+@overload
+def future_safe(
+    exceptions: Callable[_FuncParams, _ValueType_co],
+    /,
+    *,
+    offload: Offload,
+) -> Callable[_FuncParams, FutureResultE[_ValueType_co]]: ...
+
+
+@overload
+def future_safe(
+    *,
+    offload: Offload,
+) -> Callable[
+    [Callable[_FuncParams, _ValueType_co]],
+    Callable[_FuncParams, FutureResultE[_ValueType_co]],
+]: ...
+
+
+@overload
+def future_safe(
+    exceptions: tuple[type[_ExceptionType], ...],
+    *,
+    offload: Offload,
+) -> Callable[
+    [Callable[_FuncParams, _ValueType_co]],
+    Callable[_FuncParams, FutureResult[_ValueType_co, _ExceptionType]],
+]: ...
+
+
 def future_safe(  # noqa: WPS212, WPS234,
     exceptions: (
         Callable[_FuncParams, Awaitable[_ValueType_co]]
+        | Callable[_FuncParams, _ValueType_co]
         | tuple[type[_ExceptionType], ...]
-    ),
+        | None
+    ) = None,
+    *,
+    offload: Offload | None = None,
 ) -> (
     Callable[_FuncParams, FutureResultE[_ValueType_co]]
     | Callable[
         [Callable[_FuncParams, Awaitable[_ValueType_co]]],
         Callable[_FuncParams, FutureResult[_ValueType_co, _ExceptionType]],
     ]
+    | Callable[
+        [Callable[_FuncParams, _ValueType_co]],
+        Callable[_FuncParams, FutureResultE[_ValueType_co]],
+    ]
+    | Callable[
+        [Callable[_FuncParams, _ValueType_co]],
+        Callable[_FuncParams, FutureResult[_ValueType_co, _ExceptionType]],
+    ]
 ):
     """
     Decorator to convert exception-throwing coroutine to ``FutureResult``.
@@ -1595,6 +2038,22 @@ def future_safe(  # noqa: WPS212, WPS234,
     In this case, only exceptions that are explicitly
     listed are going to be caught.
 
+    Blocking sync functions can be offloaded to worker threads
+    or worker processes with ``offload`` argument,
+    it accepts the same values as ``executor`` in :func:`asyncify`:
+
+    .. code:: python
+
+      >>> @future_safe(offload='thread')
+      ... def blocking(arg: int) -> float:
+      ...     return 1 / arg
+
+      >>> assert anyio.run(blocking(2).awaitable) == IOSuccess(0.5)
+      >>> assert isinstance(
+      ...     anyio.run(blocking(0).awaitable),
+      ...     IOFailure,
+      ... )
+
     Similar to :func:`returns.io.impure_safe` and :func:`returns.result.safe`
     decorators, but works with ``async`` functions.
 
@@ -1622,9 +2081,235 @@ def future_safe(  # noqa: WPS212, WPS234,
 
         return decorator
 
-    if isinstance(exceptions, tuple):
-        return lambda function: _future_safe_factory(function, exceptions)
+    if exceptions is None or isinstance(exceptions, tuple):
+        inner_exceptions = (Exception,) if exceptions is None else exceptions
+        return lambda function: _future_safe_factory(
+            _maybe_offloaded(function, offload),
+            inner_exceptions,  # type: ignore[arg-type]
+        )
     return _future_safe_factory(
-        exceptions,
+        _maybe_offloaded(exceptions, offload),
         (Exception,),  # type: ignore[arg-type]
     )
+
+
+def future_cache(
+    *,
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    failure_ttl: float = 0,
+) -> Callable[
+    [Callable[_FuncParams, FutureResult[_ValueType_co, _ErrorType_co]]],
+    Callable[_FuncParams, FutureResult[_ValueType_co, _ErrorType_co]],
+]:
+    """
+    Decorator to cache ``FutureResult`` by function's arguments.
+
+    All concurrent calls with the same arguments share
+    a single computation, the function is called only once:
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.future import FutureResult, future_cache, future_safe
+      >>> from returns.io import IOSuccess
+
+      >>> calls = []
+
+      >>> @future_cache(ttl=60)
+      ... @future_safe
+      ... async def fetch(key: str) -> str:
+      ...     calls.append(key)
+      ...     await anyio.sleep(0.01)
+      ...     return key.upper()
+
+      >>> async def main() -> None:
+      ...     async with anyio.create_task_group() as tg:
+      ...         for _ in range(10):
+      ...             tg.start_soon(fetch('a').awaitable)
+
+      >>> anyio.run(main)
+      >>> assert calls == ['a']
+      >>> assert anyio.run(fetch('a').awaitable) == IOSuccess('A')
+      >>> assert calls == ['a']
+
+    ``Success`` values are cached for ``ttl`` seconds, forever by default.
+    ``Failure`` values are only shared by callers
+    that wait for the same computation,
+    set ``failure_ttl`` to cache them as well.
+    Raised exceptions and cancelled computations are never cached.
+
+    At most ``maxsize`` least recently used computations are stored,
+    use ``None`` to remove this limit.
+    Arguments must be hashable.
+
+    Cached computations run in their own task and are shared by all callers,
+    so a cancelled caller never affects others.
+    The computation is finished even when all its callers are cancelled.
+    """
+
+    def factory(
+        function: Callable[
+            _FuncParams,
+            FutureResult[_ValueType_co, _ErrorType_co],
+        ],
+    ) -> Callable[_FuncParams, FutureResult[_ValueType_co, _ErrorType_co]]:
+        flight = _cache.SingleFlight(maxsize, ttl, failure_ttl)
+
+        @wraps(function)
+        def decorator(
+            *args: _FuncParams.args,
+            **kwargs: _FuncParams.kwargs,
+        ) -> FutureResult[_ValueType_co, _ErrorType_co]:
+            return FutureResult(
+                flight.get(
+                    make_key(args, kwargs),
+                    lambda: function(*args, **kwargs)._inner_value,  # noqa: SLF001
+                )
+            )
+
+        return decorator
+
+    return factory
+
+
+def _maybe_offloaded(
+    function: Callable[_FuncParams, Any],
+    offload: Offload | None,
+) -> Callable[_FuncParams, Awaitable[Any]]:
+    if offload is None:
+        return function
+    return _offloaded(function, offload)
+
+
+# Batching:
+
+_KeyType = TypeVar('_KeyType', bound=Hashable)
+
+
+def future_batch(
+    on_missing: Callable[[Any], _NewErrorType],
+    *,
+    max_size: int | None = None,
+    window: float = 0,
+) -> Callable[
+    [
+        Callable[
+            [list[_KeyType]],
+            FutureResult[Mapping[_KeyType, _ValueType_co], _ErrorType_co],
+        ],
+    ],
+    Callable[
+        [_KeyType],
+        FutureResult[_ValueType_co, _ErrorType_co | _NewErrorType],
+    ],
+]:
+    """
+    Decorator to load many keys with a single call.
+
+    Turns a function that loads a list of keys into a mapping
+    into a function that loads a single key.
+    All keys that are requested before the first of them is awaited
+    are collected into a single call:
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.future import FutureResult, future_batch, future_safe
+      >>> from returns.iterables import Fold
+      >>> from returns.io import IOSuccess
+
+      >>> calls = []
+
+      >>> @future_batch(KeyError)
+      ... @future_safe
+      ... async def fetch_users(ids: list[int]) -> dict[int, str]:
+      ...     calls.append(ids)
+      ...     return {user_id: 'user{0}'.format(user_id) for user_id in ids}
+
+      >>> assert anyio.run(
+      ...     Fold.collect(
+      ...         [fetch_users(1), fetch_users(2), fetch_users(1)],
+      ...         FutureResult.from_value(()),
+      ...     ).awaitable,
+      ... ) == IOSuccess(('user1', 'user2', 'user1'))
+      >>> assert calls == [[1, 2]]
+
+    ``Success`` and ``Failure`` of the batch are passed to each caller.
+    Keys that are missing in the returned mapping
+    get ``Failure`` with ``on_missing(key)`` value.
+    The same keys in a single batch are loaded only once.
+    Keys must be hashable.
+
+    A batch is sent when the first of its callers awaits it,
+    after all other tasks get a chance to add their keys.
+    Use ``window`` to wait for more keys up to this number of seconds,
+    and ``max_size`` to limit the number of keys in a single call.
+    ``anyio`` must be installed to use this decorator.
+
+    All callers of the same batch share a single call,
+    that runs in its own task, so a cancelled caller never affects others.
+
+    Use :class:`~InMemoryBatch` instead of real functions in tests.
+    """
+
+    def factory(
+        function: Callable[
+            [list[_KeyType]],
+            FutureResult[Mapping[_KeyType, _ValueType_co], _ErrorType_co],
+        ],
+    ) -> Callable[
+        [_KeyType],
+        FutureResult[_ValueType_co, _ErrorType_co | _NewErrorType],
+    ]:
+        batcher = _batch.Batcher(function, on_missing, max_size, window)
+
+        def decorator(
+            key: _KeyType,
+        ) -> FutureResult[_ValueType_co, _ErrorType_co | _NewErrorType]:
+            return FutureResult(batcher.load(key))
+
+        return decorator
+
+    return factory
+
+
+@final
+class InMemoryBatch(Generic[_KeyType, _FirstType]):
+    """
+    Batch function that loads keys from a mapping.
+
+    Use it instead of real batch functions in tests,
+    it records the keys of each call:
+
+    .. code:: python
+
+      >>> import anyio
+      >>> from returns.future import InMemoryBatch, future_batch
+      >>> from returns.io import IOFailure, IOSuccess
+
+      >>> users = InMemoryBatch({1: 'first', 2: 'second'})
+      >>> fetch_user = future_batch('{0} not found'.format)(users)
+
+      >>> assert anyio.run(fetch_user(1).awaitable) == IOSuccess('first')
+      >>> assert anyio.run(fetch_user(3).awaitable) == IOFailure('3 not found')
+      >>> assert users.calls == [[1], [3]]
+
+    """
+
+    __slots__ = ('_mapping', 'calls')
+
+    def __init__(self, mapping: Mapping[_KeyType, _FirstType]) -> None:
+        """Stores the mapping to load keys from."""
+        self._mapping = mapping
+        self.calls: list[list[_KeyType]] = []
+
+    def __call__(
+        self,
+        keys: list[_KeyType],
+    ) -> FutureResult[Mapping[_KeyType, _FirstType], Never]:
+        """Returns all existing keys from the mapping."""
+        self.calls.append(keys)
+        return FutureResult.from_value({
+            key: self._mapping[key] for key in keys if key in self._mapping
+        })
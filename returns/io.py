@@ -6,9 +6,10 @@ from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, final, overload
 
 from typing_extensions import ParamSpec
 
+from returns._internal.do_notation import halt, run_do
+from returns.cache import Cache
 from returns.interfaces.specific import io, ioresult
 from returns.primitives.container import BaseContainer, container_equality
-from returns.primitives.exceptions import UnwrapFailedError
 from returns.primitives.hkt import (
     Kind1,
     Kind2,
@@ -16,6 +17,7 @@ from returns.primitives.hkt import (
     SupportsKind2,
     dekind,
 )
+from returns.primitives.tracing import TraceLine
 from returns.result import Failure, Result, Success
 
 _ValueType_co = TypeVar('_ValueType_co', covariant=True)
@@ -152,7 +154,7 @@ class IO(  # type: ignore[type-var]
 
     def __iter__(self) -> Iterator[_ValueType_co]:
         """API for :ref:`do-notation`."""
-        yield self._inner_value
+        return iter((self._inner_value,))
 
     @classmethod
     def do(
@@ -364,7 +366,7 @@ class IOResult(  # type: ignore[type-var]
         return f'<IOResult: {self._inner_value}>'
 
     @property
-    def trace(self) -> list[FrameInfo] | None:
+    def trace(self) -> list[FrameInfo] | list[TraceLine] | None:
         """Returns a stack trace when :func:`~IOFailure` was called."""
         return self._inner_value.trace
 
@@ -640,8 +642,8 @@ class IOResult(  # type: ignore[type-var]
 
     def __iter__(self) -> Iterator[_ValueType_co]:
         """API for :ref:`do-notation`."""
-        # We also unwrap `IO` here.
-        yield self.unwrap()._inner_value  # noqa: SLF001
+        # We unwrap the inner `Result`, so no `IO` is created here:
+        return iter((self._inner_value.unwrap(),))
 
     @classmethod
     def do(
@@ -671,10 +673,7 @@ class IOResult(  # type: ignore[type-var]
         This feature requires our :ref:`mypy plugin <mypy-plugins>`.
 
         """
-        try:
-            return IOResult.from_value(next(expr))
-        except UnwrapFailedError as exc:
-            return IOResult.from_result(exc.halted_container)  # type: ignore
+        return run_do(expr, IOResult.from_value, IOResult.from_result)
 
     @classmethod
     def from_typecast(
@@ -829,6 +828,10 @@ class IOFailure(IOResult[Any, _ErrorType_co]):
 
     if not TYPE_CHECKING:  # noqa: WPS604  # pragma: no branch
 
+        def __iter__(self):
+            """Ends :ref:`do-notation` without raising exceptions."""
+            return halt(self._inner_value)
+
         def bind(self, function):
             """Does nothing for ``IOFailure``."""
             return self
@@ -905,18 +908,38 @@ def impure_safe(
 @overload
 def impure_safe(
     exceptions: tuple[type[_ExceptionType], ...],
+    *,
+    cache: Cache | None = None,
 ) -> Callable[
     [Callable[_FuncParams, _NewValueType]],
     Callable[_FuncParams, IOResult[_NewValueType, _ExceptionType]],
 ]: ...
 
 
+@overload
+def impure_safe(
+    *,
+    cache: Cache,
+) -> Callable[
+    [Callable[_FuncParams, _NewValueType]],
+    Callable[_FuncParams, IOResultE[_NewValueType]],
+]: ...
+
+
 def impure_safe(  # noqa: WPS234
     exceptions: (
-        Callable[_FuncParams, _NewValueType] | tuple[type[_ExceptionType], ...]
-    ),
+        Callable[_FuncParams, _NewValueType]
+        | tuple[type[_ExceptionType], ...]
+        | None
+    ) = None,
+    *,
+    cache: Cache | None = None,
 ) -> (
     Callable[_FuncParams, IOResultE[_NewValueType]]
+    | Callable[
+        [Callable[_FuncParams, _NewValueType]],
+        Callable[_FuncParams, IOResultE[_NewValueType]],
+    ]
     | Callable[
         [Callable[_FuncParams, _NewValueType]],
         Callable[_FuncParams, IOResult[_NewValueType, _ExceptionType]],
@@ -960,6 +983,19 @@ def impure_safe(  # noqa: WPS234
     In this case, only exceptions that are explicitly
     listed are going to be caught.
 
+    Produced containers can be cached by function's arguments
+    with ``cache`` argument, see :mod:`returns.cache` for eviction policies:
+
+    .. code:: python
+
+      >>> from returns.cache import LRU
+
+      >>> @impure_safe(cache=LRU(maxsize=128, skip_failures=True))
+      ... def parse(number: str) -> int:
+      ...     return int(number)
+
+      >>> assert parse('1') == IOSuccess(1)
+
     Similar to :func:`returns.future.future_safe`
     and :func:`returns.result.safe` decorators.
     """
@@ -978,10 +1014,16 @@ def impure_safe(  # noqa: WPS234
             except inner_exceptions as exc:
                 return IOFailure(exc)
 
-        return decorator
+        if cache is None:
+            return decorator
+        return cache.wrap(decorator, IOSuccess)
 
-    if isinstance(exceptions, tuple):
-        return lambda function: factory(function, exceptions)
+    if exceptions is None or isinstance(exceptions, tuple):
+        inner_exceptions = (Exception,) if exceptions is None else exceptions
+        return lambda function: factory(
+            function,
+            inner_exceptions,  # type: ignore[arg-type]
+        )
     return factory(
         exceptions,
         (Exception,),  # type: ignore[arg-type]
@@ -1,18 +1,39 @@
 from abc import abstractmethod
-from collections.abc import Callable, Iterable
-from typing import TypeVar, final
+from collections import deque
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, TypeVar, final
 
 from returns.interfaces.applicative import ApplicativeN
 from returns.interfaces.failable import FailableN
+from returns.interfaces.specific.future import FutureLikeN
+from returns.interfaces.specific.future_result import FutureResultLikeN
+from returns.interfaces.unwrappable import Unwrappable
+from returns.io import IO, IOFailure, IOResult, IOSuccess
+from returns.maybe import Nothing, Some
+from returns.pipeline import is_successful
 from returns.primitives.hkt import KindN, kinded
+from returns.result import Failure, Result, ResultE, Success
+
+if TYPE_CHECKING:
+    from returns.future import Offload
 
 _FirstType = TypeVar('_FirstType')
 _SecondType = TypeVar('_SecondType')
 _ThirdType = TypeVar('_ThirdType')
 _UpdatedType = TypeVar('_UpdatedType')
+_ItemType = TypeVar('_ItemType')
 
 _ApplicativeKind = TypeVar('_ApplicativeKind', bound=ApplicativeN)
 _FailableKind = TypeVar('_FailableKind', bound=FailableN)
+_FutureKind = TypeVar('_FutureKind', bound=FutureLikeN)
+_FutureResultKind = TypeVar('_FutureResultKind', bound=FutureResultLikeN)
 
 
 class AbstractFold:
@@ -219,6 +240,281 @@ class AbstractFold:
         """
         return cls._collect_all(iterable, acc)
 
+    @final
+    @kinded
+    @classmethod
+    def collect_until_failure(
+        cls,
+        iterable: Iterable[
+            KindN[_FailableKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FailableKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> tuple[
+        KindN[
+            _FailableKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        int,
+    ]:
+        """
+        Transforms an iterable of containers into a single container.
+
+        Works the same way as :meth:`~AbstractFold.collect` does,
+        but stops consuming the iterable on the first failed container.
+        Returns the collected container and the number of consumed items.
+
+        It is useful when items are produced lazily
+        and producing them is expensive, like reading files or databases:
+
+        .. code:: python
+
+          >>> from returns.result import Success, Failure
+          >>> from returns.iterables import Fold
+
+          >>> items = iter([Success(1), Failure('a'), Success(3)])
+          >>> assert Fold.collect_until_failure(
+          ...     items, Success(()),
+          ... ) == (Failure('a'), 2)
+          >>> assert list(items) == [Success(3)]
+
+          >>> assert Fold.collect_until_failure(
+          ...     [Success(1), Success(2)], Success(()),
+          ... ) == (Success((1, 2)), 2)
+          >>> assert Fold.collect_until_failure(
+          ...     [Success(1)], Failure('b'),
+          ... ) == (Failure('b'), 0)
+
+        Only containers that can be inspected right away,
+        like ``Result``, ``Maybe``, and ``IOResult``, can stop early.
+        Lazy containers like ``RequiresContextResult``
+        consume the whole iterable.
+
+        Public interface for ``_collect_until_failure`` method.
+        Cannot be modified directly.
+        """
+        return cls._collect_until_failure(iterable, acc)
+
+    @final
+    @kinded
+    @classmethod
+    def traverse(
+        cls,
+        iterable: Iterable[_ItemType],
+        function: Callable[
+            [_ItemType],
+            KindN[_ApplicativeKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _ApplicativeKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Maps each item to a container and collects them in a single pass.
+
+        It is the same as ``Fold.collect(map(function, iterable), acc)``,
+        but ``function`` is not called anymore after the first failed
+        container, when this container can be inspected right away.
+        No intermediate list of containers is created.
+
+        .. code:: python
+
+          >>> from returns.result import Result, Success, Failure, safe
+          >>> from returns.iterables import Fold
+
+          >>> parse = safe(int)
+
+          >>> assert Fold.traverse(['1', '2'], parse, Success(())) == Success(
+          ...     (1, 2),
+          ... )
+
+          >>> rows = iter(['1', 'a', '3'])
+          >>> assert isinstance(
+          ...     Fold.traverse(rows, parse, Success(())),
+          ...     Failure,
+          ... )
+          >>> assert list(rows) == ['3']
+
+        See :meth:`~AbstractFold.traverse_all` to skip failed containers.
+
+        Public interface for ``_traverse`` method. Cannot be modified directly.
+        """
+        return cls._traverse(iterable, function, acc)
+
+    @final
+    @kinded
+    @classmethod
+    def traverse_all(
+        cls,
+        iterable: Iterable[_ItemType],
+        function: Callable[
+            [_ItemType],
+            KindN[_FailableKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FailableKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _FailableKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Maps each item to a container and collects all successful ones.
+
+        It is the same as ``Fold.collect_all(map(function, iterable), acc)``,
+        but no intermediate list of containers is created.
+
+        .. code:: python
+
+          >>> from returns.maybe import Some, maybe
+          >>> from returns.iterables import Fold
+
+          >>> source = {'a': 1, 'b': 2}
+          >>> assert Fold.traverse_all(
+          ...     ['a', 'c', 'b'],
+          ...     maybe(source.get),
+          ...     Some(()),
+          ... ) == Some((1, 2))
+
+        Public interface for ``_traverse_all`` method.
+        Cannot be modified directly.
+        """
+        return cls._traverse_all(iterable, function, acc)
+
+    @final
+    @kinded
+    @classmethod
+    def collect_concurrently(
+        cls,
+        iterable: Iterable[
+            KindN[_FutureKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FutureKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        limit: int,
+    ) -> KindN[
+        _FutureKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Transforms an iterable of futures into a single future concurrently.
+
+        Works the same way as :meth:`~AbstractFold.collect` does,
+        but awaits up to ``limit`` containers at the same time
+        instead of awaiting them one by one:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.future import FutureSuccess, FutureFailure
+          >>> from returns.io import IOSuccess, IOFailure
+          >>> from returns.iterables import Fold
+
+          >>> items = [FutureSuccess(1), FutureSuccess(2)]
+          >>> assert anyio.run(
+          ...     Fold.collect_concurrently(items, FutureSuccess(()), 10)
+          ...     .awaitable,
+          ... ) == IOSuccess((1, 2))
+
+          >>> items = [FutureSuccess(1), FutureFailure('a'), FutureFailure('b')]
+          >>> assert anyio.run(
+          ...     Fold.collect_concurrently(items, FutureSuccess(()), 10)
+          ...     .awaitable,
+          ... ) == IOFailure('a')
+
+        Values are collected in the order of the iterable.
+        The iterable is consumed lazily: new items are taken
+        only when there's a free slot.
+
+        When a container fails, we stop taking new items
+        and cancel all running containers that go after the failed one,
+        they cannot change the result anymore.
+        The first failed container in the order of the iterable is returned.
+
+        Works with ``Future``, ``FutureResult``,
+        and ``RequiresContextFutureResult``, requires ``anyio``.
+        Other types are collected with :meth:`~AbstractFold.collect`.
+
+        Public interface for ``_collect_concurrently`` method.
+        Cannot be modified directly.
+        """
+        return cls._collect_concurrently(iterable, acc, limit)
+
+    @final
+    @kinded
+    @classmethod
+    def collect_all_concurrently(
+        cls,
+        iterable: Iterable[
+            KindN[_FutureResultKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FutureResultKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        limit: int,
+    ) -> KindN[
+        _FutureResultKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Collects all successful futures concurrently.
+
+        Works the same way as :meth:`~AbstractFold.collect_all` does,
+        but awaits up to ``limit`` containers at the same time:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.future import FutureSuccess, FutureFailure
+          >>> from returns.io import IOSuccess
+          >>> from returns.iterables import Fold
+
+          >>> items = [FutureSuccess(1), FutureFailure('a'), FutureSuccess(3)]
+          >>> assert anyio.run(
+          ...     Fold.collect_all_concurrently(items, FutureSuccess(()), 2)
+          ...     .awaitable,
+          ... ) == IOSuccess((1, 3))
+
+        Values are collected in the order of the iterable.
+        Works with ``FutureResult`` and ``RequiresContextFutureResult``,
+        requires ``anyio``.
+        Other types are collected with :meth:`~AbstractFold.collect_all`.
+
+        Public interface for ``_collect_all_concurrently`` method.
+        Cannot be modified directly.
+        """
+        return cls._collect_all_concurrently(iterable, acc, limit)
+
     # Protected part
     # ==============
 
@@ -307,6 +603,136 @@ class AbstractFold:
             _concat_failable_safely,
         )
 
+    @classmethod
+    def _collect_until_failure(
+        cls,
+        iterable: Iterable[
+            KindN[_ApplicativeKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> tuple[
+        KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        int,
+    ]:
+        consumed = 0
+        if _is_failed(acc):
+            return acc, consumed
+
+        wrapped = acc.from_value(_concat_sequence)
+        for current in iterable:
+            consumed += 1
+            acc = _concat_applicative(current, acc, wrapped)
+            if _is_failed(acc):
+                break
+        return acc, consumed
+
+    @classmethod
+    def _traverse(
+        cls,
+        iterable: Iterable[_ItemType],
+        function: Callable[
+            [_ItemType],
+            KindN[_ApplicativeKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _ApplicativeKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        collected, _ = cls._collect_until_failure(map(function, iterable), acc)
+        return collected
+
+    @classmethod
+    def _traverse_all(
+        cls,
+        iterable: Iterable[_ItemType],
+        function: Callable[
+            [_ItemType],
+            KindN[_FailableKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FailableKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _FailableKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        return cls._collect_all(map(function, iterable), acc)
+
+    @classmethod
+    def _collect_concurrently(
+        cls,
+        iterable: Iterable[
+            KindN[_FutureKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FutureKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        limit: int,
+    ) -> KindN[
+        _FutureKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        from returns._internal.futures import _gather  # noqa: PLC0415
+
+        collected = _gather.collect(iterable, acc, limit, skip_failures=False)
+        if collected is None:
+            return cls._collect(iterable, acc)
+        return collected  # type: ignore[no-any-return]
+
+    @classmethod
+    def _collect_all_concurrently(
+        cls,
+        iterable: Iterable[
+            KindN[_FutureResultKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FutureResultKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        limit: int,
+    ) -> KindN[
+        _FutureResultKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        from returns._internal.futures import _gather  # noqa: PLC0415
+
+        collected = _gather.collect(iterable, acc, limit, skip_failures=True)
+        if collected is None:
+            return cls._collect_all(iterable, acc)
+        return collected  # type: ignore[no-any-return]
+
 
 class Fold(AbstractFold):
     """
@@ -355,11 +781,243 @@ class Fold(AbstractFold):
             acc = concat(current, acc, wrapped)
         return acc
 
+    @classmethod
+    def _collect(
+        cls,
+        iterable: Iterable[
+            KindN[_ApplicativeKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _ApplicativeKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Protected part of ``collect`` method.
+
+        Builtin containers are collected into a single list
+        without any ``.apply`` calls, all other types use ``_loop``.
+        """
+        collected = _collect_builtin(iterable, acc, skip_failures=False)
+        if collected is None:
+            return super()._collect(iterable, acc)
+        return collected  # type: ignore[no-any-return]
+
+    @classmethod
+    def _collect_all(
+        cls,
+        iterable: Iterable[
+            KindN[_FailableKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FailableKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _FailableKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Protected part of ``collect_all`` method.
+
+        Builtin containers are collected into a single list
+        without any ``.apply`` calls, all other types use ``_loop``.
+        """
+        collected = _collect_builtin(iterable, acc, skip_failures=True)
+        if collected is None:
+            return super()._collect_all(iterable, acc)
+        return collected  # type: ignore[no-any-return]
+
+    @classmethod
+    def _collect_until_failure(
+        cls,
+        iterable: Iterable[
+            KindN[_ApplicativeKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> tuple[
+        KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+        int,
+    ]:
+        """
+        Protected part of ``collect_until_failure`` method.
+
+        Builtin containers are collected into a single list
+        without any ``.apply`` calls, all other types use ``.apply``.
+        """
+        collected = _collect_builtin_until_failure(iterable, acc)
+        if collected is None:
+            return super()._collect_until_failure(iterable, acc)
+        return collected
+
+    @classmethod
+    def _traverse(
+        cls,
+        iterable: Iterable[_ItemType],
+        function: Callable[
+            [_ItemType],
+            KindN[_ApplicativeKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _ApplicativeKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _ApplicativeKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Protected part of ``traverse`` method.
+
+        Lazy containers call ``function`` once for each item,
+        created containers are reused on each call with ``deps``.
+        """
+        collected, _ = cls._collect_until_failure(
+            _traversed(iterable, function, acc),
+            acc,
+        )
+        return collected
+
+    @classmethod
+    def _traverse_all(
+        cls,
+        iterable: Iterable[_ItemType],
+        function: Callable[
+            [_ItemType],
+            KindN[_FailableKind, _FirstType, _SecondType, _ThirdType],
+        ],
+        acc: KindN[
+            _FailableKind,
+            'tuple[_FirstType, ...]',
+            _SecondType,
+            _ThirdType,
+        ],
+    ) -> KindN[
+        _FailableKind,
+        'tuple[_FirstType, ...]',
+        _SecondType,
+        _ThirdType,
+    ]:
+        """
+        Protected part of ``traverse_all`` method.
+
+        Lazy containers call ``function`` once for each item,
+        created containers are reused on each call with ``deps``.
+        """
+        return cls._collect_all(_traversed(iterable, function, acc), acc)
+
+
+def parallel_traverse(  # noqa: WPS211
+    function: Callable[[_FirstType], _UpdatedType],
+    iterable: Iterable[_FirstType],
+    *,
+    executor: 'Offload' = 'process',
+    chunksize: int = 1,
+    ordered: bool = True,
+    buffersize: int | None = None,
+) -> Generator[ResultE[_UpdatedType], None, None]:
+    """
+    Calls ``function`` on each item in worker processes or threads.
+
+    Yields ``Result`` for each item: raised exceptions are returned
+    as ``Failure`` the same way :func:`returns.result.safe` does,
+    so one failed item does not affect any other ones:
+
+    .. code:: python
+
+      >>> from returns.iterables import Fold, parallel_traverse
+      >>> from returns.result import Success
+
+      >>> outcomes = list(parallel_traverse(
+      ...     lambda number: 1 / number,
+      ...     [1, 0, 2],
+      ...     executor='thread',
+      ... ))
+      >>> assert outcomes[0] == Success(1.0)
+      >>> assert isinstance(outcomes[1].failure(), ZeroDivisionError)
+      >>> assert outcomes[2] == Success(0.5)
+
+      >>> assert Fold.collect(
+      ...     parallel_traverse(abs, [-1, -2], executor='thread'),
+      ...     Success(()),
+      ... ) == Success((1, 2))
+
+    ``executor`` can be ``'process'``, ``'thread'``,
+    or any ``concurrent.futures.Executor`` instance.
+    For ``'process'`` and ``'thread'`` a new pool is created
+    and shut down when the iteration ends.
+    Functions and items must be picklable for process pools.
+
+    Items are sent to workers in chunks of ``chunksize`` items,
+    large chunks reduce the overhead of sending small tasks to processes.
+    When ``ordered=False``, chunks are yielded as soon as they are finished.
+
+    By default all chunks are submitted before the first one is yielded,
+    as ``Executor.map`` does.
+    Use ``buffersize`` to keep at most this number of chunks
+    submitted at the same time, the iterable is consumed lazily then.
+    When the iteration is stopped early, pending chunks are cancelled.
+
+    When a worker cannot return a chunk at all,
+    for example, when a worker process crashes
+    or the returned value cannot be pickled,
+    each item of this chunk is returned as ``Failure`` with this error.
+    Chunks that a broken pool refuses to take fail the same way.
+    """
+    if chunksize < 1:
+        raise ValueError(f'Chunk size must be positive, got: {chunksize}')
+    if buffersize is not None and buffersize < 1:
+        raise ValueError(f'Buffer size must be positive, got: {buffersize}')
+    # `concurrent.futures` is only imported when it is used:
+    from returns._internal import parallel  # noqa: PLC0415
+
+    traverse = parallel.ParallelTraverse(executor, function, buffersize)
+    chunks = parallel.chunked(iterable, chunksize)
+    if ordered:
+        return traverse.ordered(chunks)
+    return traverse.unordered(chunks)
+
 
 # Helper functions
 # ================
 
 
+def _is_failed(container: object) -> bool:
+    """
+    Tells whether a container is known to be failed.
+
+    Only ``Unwrappable`` containers can be inspected without running them.
+    """
+    if isinstance(container, Unwrappable):
+        return not is_successful(container)
+    return False
+
+
 def _concat_sequence(
     first: _FirstType,
 ) -> Callable[
@@ -426,3 +1084,178 @@ def _concat_failable_safely(
     We need both ``.apply`` and ``.lash`` methods here.
     """
     return _concat_applicative(current, acc, function).lash(lambda _: acc)
+
+
+# Fast collection of builtin containers
+# =====================================
+
+
+def _inner_value(container: Any) -> Any:
+    return container._inner_value  # noqa: SLF001
+
+
+def _ioresult_inner_value(container: Any) -> Any:
+    return container._inner_value._inner_value  # noqa: SLF001
+
+
+#: Maps eager accumulator types to their successful type and a value getter.
+_EAGER: Final = MappingProxyType({
+    IO: (IO, _inner_value),
+    Success: (Success, _inner_value),
+    Failure: (Success, _inner_value),
+    Some: (Some, _inner_value),
+    type(Nothing): (Some, _inner_value),
+    IOSuccess: (IOSuccess, _ioresult_inner_value),
+    IOFailure: (IOSuccess, _ioresult_inner_value),
+})
+
+
+@cache
+def _lazy_types() -> tuple[type[Any], ...]:
+    """
+    Returns lazy containers, they are collected when called with ``deps``.
+
+    Readers are imported on the first use,
+    so importing this module does not import all of them.
+    """
+    from returns.context import (  # noqa: PLC0415
+        RequiresContext,
+        RequiresContextIOResult,
+        RequiresContextResult,
+    )
+
+    return (RequiresContext, RequiresContextResult, RequiresContextIOResult)
+
+
+def _collect_builtin(
+    iterable: Iterable[Any],
+    acc: Any,
+    *,
+    skip_failures: bool,
+) -> Any | None:
+    """
+    Collects builtin containers in linear time.
+
+    Keeps the exact semantics of ``_loop`` with ``_concat_sequence``:
+    the whole iterable is always consumed, the first failed container
+    or a failed ``acc`` is returned as is.
+
+    Returns ``None`` for all other types, they must use ``_loop``.
+    """
+    if isinstance(acc, _lazy_types()):
+        containers = _reusable(iterable)
+        return acc.__class__(
+            lambda deps: _collect_lazy(containers, acc, deps, skip_failures),
+        )
+
+    eager = _EAGER.get(acc.__class__)
+    if eager is None:
+        return None
+    return _collect_eager(iter(iterable), acc, *eager, skip_failures)
+
+
+def _collect_builtin_until_failure(
+    iterable: Iterable[Any],
+    acc: Any,
+) -> tuple[Any, int] | None:
+    """
+    Collects builtin containers until the first failed one.
+
+    Lazy containers cannot be inspected, so they consume all items.
+    Returns ``None`` for all other types, they must use ``.apply``.
+    """
+    if isinstance(acc, _lazy_types()):
+        containers = _reusable(iterable)
+        collected = _collect_builtin(containers, acc, skip_failures=False)
+        return collected, len(containers)
+
+    eager = _EAGER.get(acc.__class__)
+    if eager is None:
+        return None
+    return _collect_eager_until_failure(iterable, acc, *eager)
+
+
+def _collect_eager(
+    iterator: Iterator[Any],
+    acc: Any,
+    success_type: type[Any],
+    inner_value: Callable[[Any], Any],
+    skip_failures: bool,  # noqa: FBT001
+) -> Any:
+    """Collects successful values into a list and freezes it once."""
+    if skip_failures and isinstance(acc, success_type):
+        return acc.from_value((
+            *inner_value(acc),
+            *(
+                inner_value(current)
+                for current in iterator
+                if isinstance(current, success_type)
+            ),
+        ))
+
+    collected, _ = _collect_eager_until_failure(
+        iterator,
+        acc,
+        success_type,
+        inner_value,
+    )
+    deque(iterator, maxlen=0)
+    return collected
+
+
+def _collect_eager_until_failure(
+    iterable: Iterable[Any],
+    acc: Any,
+    success_type: type[Any],
+    inner_value: Callable[[Any], Any],
+) -> tuple[Any, int]:
+    """Collects successful values until the first failed one."""
+    if not isinstance(acc, success_type):
+        return acc, 0
+
+    collected = list(inner_value(acc))
+    initial_size = len(collected)
+    for consumed, current in enumerate(iterable, start=1):
+        if not isinstance(current, success_type):
+            return current, consumed
+        collected.append(inner_value(current))
+    return acc.from_value(tuple(collected)), len(collected) - initial_size
+
+
+def _reusable(iterable: Iterable[Any]) -> tuple[Any, ...]:
+    """
+    Returns items that can be iterated again on each call with ``deps``.
+
+    We take a snapshot, so later changes of the passed collection
+    do not change already created containers.
+    """
+    return tuple(iterable)
+
+
+def _traversed(
+    iterable: Iterable[Any],
+    function: Callable[[Any], Any],
+    acc: Any,
+) -> Iterable[Any]:
+    """Maps items lazily, lazy containers store mapped items once."""
+    if isinstance(acc, _lazy_types()):
+        return tuple(map(function, iterable))
+    return map(function, iterable)
+
+
+def _collect_lazy(
+    containers: Iterable[Any],
+    acc: Any,
+    deps: Any,
+    skip_failures: bool,  # noqa: FBT001
+) -> Any:
+    """Calls all lazy containers with ``deps`` and collects the results."""
+    evaluated = acc(deps)
+    if not isinstance(evaluated, (Result, IOResult)):
+        # `RequiresContext` returns raw values:
+        return (*evaluated, *(container(deps) for container in containers))
+    return _collect_builtin(
+        (container(deps) for container in containers),
+        evaluated,
+        skip_failures=skip_failures,
+    )
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Any, ClassVar, Never, Optional, TypeVar, final
 
 from typing_extensions import ParamSpec
 
+from returns._internal.do_notation import halt, run_do
+from returns.functions import identity
 from returns.interfaces.specific.maybe import MaybeBased2
 from returns.primitives.container import BaseContainer, container_equality
 from returns.primitives.exceptions import UnwrapFailedError
@@ -147,7 +149,7 @@ class Maybe(  # type: ignore[type-var]
 
     def __iter__(self) -> Iterator[_ValueType_co]:
         """API for :ref:`do-notation`."""
-        yield self.unwrap()
+        return iter((self.unwrap(),))
 
     @classmethod
     def do(
@@ -176,10 +178,7 @@ class Maybe(  # type: ignore[type-var]
         See :ref:`do-notation` to learn more.
 
         """
-        try:
-            return Maybe.from_value(next(expr))
-        except UnwrapFailedError as exc:
-            return exc.halted_container  # type: ignore
+        return run_do(expr, Maybe.from_value, identity)
 
     def value_or(
         self,
@@ -345,6 +344,10 @@ class _Nothing(Maybe[Any]):
         """
         return '<Nothing>'
 
+    def __iter__(self):
+        """Ends :ref:`do-notation` without raising exceptions."""
+        return halt(self)
+
     def map(self, function):
         """Does nothing for ``Nothing``."""
         return self
@@ -1,5 +1,6 @@
 from typing import Any
 
+from returns._internal.pipeline.compiled import compile_pipe as compile_pipe
 from returns._internal.pipeline.flow import flow as flow
 from returns._internal.pipeline.managed import managed as managed
 from returns._internal.pipeline.pipe import pipe as pipe
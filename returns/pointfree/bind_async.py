@@ -1,7 +1,10 @@
 from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from typing import Never, TypeVar, overload
 
+from returns._internal.futures import _limit
+from returns.bulkhead import Bulkhead
 from returns.interfaces.specific.future import FutureLikeN
+from returns.interfaces.specific.future_result import FutureResultLikeN
 from returns.primitives.hkt import Kinded, KindN, kinded
 
 _FirstType = TypeVar('_FirstType')
@@ -10,8 +13,10 @@ _ThirdType = TypeVar('_ThirdType')
 _UpdatedType = TypeVar('_UpdatedType')
 
 _FutureKind = TypeVar('_FutureKind', bound=FutureLikeN)
+_FutureResultKind = TypeVar('_FutureResultKind', bound=FutureResultLikeN)
 
 
+@overload
 def bind_async(
     function: Callable[
         [_FirstType],
@@ -22,6 +27,55 @@ def bind_async(
         [KindN[_FutureKind, _FirstType, _SecondType, _ThirdType]],
         KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType],
     ]
+]: ...
+
+
+@overload
+def bind_async(  # type: ignore[overload-overlap]
+    function: Callable[
+        [_FirstType],
+        Awaitable[KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType]],
+    ],
+    *,
+    limiter: Bulkhead[Never],
+) -> Kinded[
+    Callable[
+        [KindN[_FutureKind, _FirstType, _SecondType, _ThirdType]],
+        KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType],
+    ]
+]: ...
+
+
+@overload
+def bind_async(
+    function: Callable[
+        [_FirstType],
+        Awaitable[
+            KindN[_FutureResultKind, _UpdatedType, _SecondType, _ThirdType]
+        ],
+    ],
+    *,
+    limiter: Bulkhead[_SecondType],
+) -> Kinded[
+    Callable[
+        [KindN[_FutureResultKind, _FirstType, _SecondType, _ThirdType]],
+        KindN[_FutureResultKind, _UpdatedType, _SecondType, _ThirdType],
+    ]
+]: ...
+
+
+def bind_async(
+    function: Callable[
+        [_FirstType],
+        Awaitable[KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType]],
+    ],
+    *,
+    limiter: Bulkhead[_SecondType] | None = None,
+) -> Kinded[
+    Callable[
+        [KindN[_FutureKind, _FirstType, _SecondType, _ThirdType]],
+        KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType],
+    ]
 ]:
     """
     Compose a container and ``async`` function returning a container.
@@ -47,6 +101,20 @@ def bind_async(
         >>> bound = bind_async(coroutine)(Future.from_value(1))
         >>> assert anyio.run(bound.awaitable) == IO('2')
 
+    Pass ``limiter`` to limit how many functions can run at the same time,
+    see :class:`returns.bulkhead.Bulkhead` for more info.
+    Returned containers are awaited in the same slot, when possible:
+
+    .. code:: python
+
+        >>> from returns.bulkhead import Bulkhead
+
+        >>> database = Bulkhead(10)
+        >>> bound = bind_async(coroutine, limiter=database)(
+        ...     Future.from_value(1),
+        ... )
+        >>> assert anyio.run(bound.awaitable) == IO('2')
+
     Note, that this function works
     for all containers with ``.bind_async`` method.
     See :class:`returns.primitives.interfaces.specific.future.FutureLikeN`
@@ -58,6 +126,10 @@ def bind_async(
     def factory(
         container: KindN[_FutureKind, _FirstType, _SecondType, _ThirdType],
     ) -> KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType]:
-        return container.bind_async(function)
+        if limiter is None:
+            return container.bind_async(function)
+        return container.bind_async(
+            _limit.limit_async(function, limiter, type(container)),
+        )
 
     return factory
@@ -1,7 +1,10 @@
 from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from typing import Never, TypeVar, overload
 
+from returns._internal.futures import _limit
+from returns.bulkhead import Bulkhead
 from returns.interfaces.specific.future import FutureLikeN
+from returns.interfaces.specific.future_result import FutureResultLikeN
 from returns.primitives.hkt import Kinded, KindN, kinded
 
 _FirstType = TypeVar('_FirstType')
@@ -10,8 +13,10 @@ _ThirdType = TypeVar('_ThirdType')
 _UpdatedType = TypeVar('_UpdatedType')
 
 _FutureKind = TypeVar('_FutureKind', bound=FutureLikeN)
+_FutureResultKind = TypeVar('_FutureResultKind', bound=FutureResultLikeN)
 
 
+@overload
 def bind_awaitable(
     function: Callable[[_FirstType], Awaitable[_UpdatedType]],
 ) -> Kinded[
@@ -19,6 +24,44 @@ def bind_awaitable(
         [KindN[_FutureKind, _FirstType, _SecondType, _ThirdType]],
         KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType],
     ]
+]: ...
+
+
+@overload
+def bind_awaitable(
+    function: Callable[[_FirstType], Awaitable[_UpdatedType]],
+    *,
+    limiter: Bulkhead[Never],
+) -> Kinded[
+    Callable[
+        [KindN[_FutureKind, _FirstType, _SecondType, _ThirdType]],
+        KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType],
+    ]
+]: ...
+
+
+@overload
+def bind_awaitable(
+    function: Callable[[_FirstType], Awaitable[_UpdatedType]],
+    *,
+    limiter: Bulkhead[_SecondType],
+) -> Kinded[
+    Callable[
+        [KindN[_FutureResultKind, _FirstType, _SecondType, _ThirdType]],
+        KindN[_FutureResultKind, _UpdatedType, _SecondType, _ThirdType],
+    ]
+]: ...
+
+
+def bind_awaitable(
+    function: Callable[[_FirstType], Awaitable[_UpdatedType]],
+    *,
+    limiter: Bulkhead[_SecondType] | None = None,
+) -> Kinded[
+    Callable[
+        [KindN[_FutureKind, _FirstType, _SecondType, _ThirdType]],
+        KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType],
+    ]
 ]:
     """
     Composes a container a regular ``async`` function.
@@ -47,6 +90,22 @@ def bind_awaitable(
         ...     bind_awaitable(coroutine)(Future.from_value(1)).awaitable,
         ... ) == IO(2)
 
+    Pass ``limiter`` to limit how many functions can run at the same time,
+    rejected calls return ``Failure``,
+    see :class:`returns.bulkhead.Bulkhead` for more info:
+
+    .. code:: python
+
+        >>> from returns.bulkhead import Bulkhead
+        >>> from returns.future import FutureResult
+        >>> from returns.io import IOSuccess
+
+        >>> database = Bulkhead(10, max_waiting=100, on_reject=lambda: 'busy')
+        >>> bound = bind_awaitable(coroutine, limiter=database)(
+        ...     FutureResult.from_value(1),
+        ... )
+        >>> assert anyio.run(bound.awaitable) == IOSuccess(2)
+
     Note, that this function works
     for all containers with ``.bind_awaitable`` method.
     See :class:`returns.primitives.interfaces.specific.future.FutureLikeN`
@@ -58,6 +117,10 @@ def bind_awaitable(
     def factory(
         container: KindN[_FutureKind, _FirstType, _SecondType, _ThirdType],
     ) -> KindN[_FutureKind, _UpdatedType, _SecondType, _ThirdType]:
-        return container.bind_awaitable(function)
+        if limiter is None:
+            return container.bind_awaitable(function)
+        return container.bind_async(
+            _limit.limit_awaitable(function, limiter, type(container)),
+        )
 
     return factory
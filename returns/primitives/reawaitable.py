@@ -1,17 +1,41 @@
-from collections.abc import Awaitable, Callable, Generator
-from functools import wraps
-from typing import NewType, ParamSpec, TypeVar, cast, final
+from collections.abc import Awaitable, Callable, Coroutine, Generator
+from functools import partial, wraps
+from types import TracebackType
+from typing import (
+    Any,
+    Final,
+    Generic,
+    NewType,
+    ParamSpec,
+    Protocol,
+    TypeVar,
+    cast,
+    final,
+)
 
 _ValueType = TypeVar('_ValueType')
+_ValueType_co = TypeVar('_ValueType_co', covariant=True)
+_NewValueType = TypeVar('_NewValueType')
 _AwaitableT = TypeVar('_AwaitableT', bound=Awaitable)
 _Ps = ParamSpec('_Ps')
 
 _Sentinel = NewType('_Sentinel', object)
 _sentinel: _Sentinel = cast(_Sentinel, object())
 
+#: Detached computations, ``asyncio`` keeps only weak references to tasks.
+_tasks: Final[set[Awaitable[None]]] = set()
+
+
+class _Event(Protocol):
+    """Event that is shared by ``anyio`` and ``asyncio``."""
+
+    def set(self) -> object: ...
+
+    async def wait(self) -> object: ...
+
 
 @final
-class ReAwaitable:
+class ReAwaitable(Generic[_ValueType_co]):
     """
     Allows to write coroutines that can be awaited multiple times.
 
@@ -46,16 +70,91 @@ class ReAwaitable:
     We try to make this type transparent.
     It should not actually be visible to any of its users.
 
-    """
+    It is also safe to ``await`` the same instance from many tasks
+    at the same time. The first awaiter runs the computation,
+    while other ones wait for its result without blocking the event loop:
 
-    __slots__ = ('_cache', '_coro')
+    .. code:: python
 
-    def __init__(self, coro: Awaitable[_ValueType]) -> None:
-        """We need just an awaitable to work with."""
-        self._coro = coro
-        self._cache: _ValueType | _Sentinel = _sentinel
+      >>> async def fan_out() -> list[IO[int]]:
+      ...     instance = Future(example(1))
+      ...     results = []
+      ...     async with anyio.create_task_group() as tg:
+      ...         for _ in range(3):
+      ...             tg.start_soon(_append, results, instance)
+      ...     return results
+
+      >>> async def _append(results, instance) -> None:
+      ...     results.append(await instance)
+
+      >>> assert anyio.run(fan_out) == [IO(1), IO(1), IO(1)]
+
+    Raised exceptions are shared by all awaiters the same way.
+    The coroutine itself is released as soon as it is finished.
 
-    def __await__(self) -> Generator[None, None, _ValueType]:
+    Cancellation rules:
+
+    1. When an awaiter that waits for another one is cancelled,
+       nothing else is affected
+    2. When the awaiter that runs the computation is cancelled,
+       the computation is cancelled as well,
+       because a coroutine cannot be resumed after that.
+       All other awaiters, including future ones,
+       get ``RuntimeError`` in this case
+
+    Use ``shared=True`` when many independent callers share one computation,
+    or :meth:`~ReAwaitable.detached` to await an existing instance this way.
+    Then it runs in its own detached task, so all awaiters just wait for it.
+    Cancelled awaiters never affect others in this mode,
+    the computation is finished even if nobody waits for it anymore:
+
+    .. code:: python
+
+      >>> async def cancelled_driver() -> list[int]:
+      ...     instance = ReAwaitable(slow(), shared=True)
+      ...     results = []
+      ...     async with anyio.create_task_group() as tg:
+      ...         with anyio.move_on_after(0):
+      ...             await instance
+      ...         tg.start_soon(_append, results, instance)
+      ...     return results
+
+      >>> async def slow() -> int:
+      ...     await anyio.sleep(0.01)
+      ...     return 1
+
+      >>> assert anyio.run(cancelled_driver) == [1]
+
+    """
+
+    __slots__ = (
+        '_awaits',
+        '_cache',
+        '_coro',
+        '_exception',
+        '_shared',
+        '_step',
+        '_traceback',
+        '_waiters',
+    )
+
+    def __init__(
+        self,
+        coro: Awaitable[_ValueType_co],
+        *,
+        shared: bool = False,
+    ) -> None:
+        """We need just an awaitable to work with."""
+        self._coro: Awaitable[Any] | None = coro
+        self._step: Callable[[Any], Any] | None = None
+        self._awaits = False
+        self._shared = shared
+        self._cache: _ValueType_co | _Sentinel = _sentinel
+        self._exception: BaseException | None = None
+        self._traceback: TracebackType | None = None
+        self._waiters: list[_Event] | None = None
+
+    def __await__(self) -> Generator[None, None, _ValueType_co]:
         """
         Allows to use ``await`` multiple times.
 
@@ -79,6 +178,8 @@ class ReAwaitable:
           Hello
 
         """
+        if self._coro is None and self._exception is None:
+            return _resolved(self._cache)  # type: ignore[arg-type]
         return self._awaitable().__await__()
 
     def __repr__(self) -> str:
@@ -87,6 +188,7 @@ class ReAwaitable:
 
         .. code:: python
 
+          >>> import anyio
           >>> from returns.primitives.reawaitable import ReAwaitable
 
           >>> async def test() -> int:
@@ -96,15 +198,327 @@ class ReAwaitable:
           >>> repr(ReAwaitable(test))
           '<function test at 0x...>'
 
+        When the coroutine is finished, its result is shown instead:
+
+        .. code:: python
+
+          >>> instance = ReAwaitable(test())
+          >>> assert anyio.run(lambda: instance) == 1
+          >>> repr(instance)
+          '<ReAwaitable: 1>'
+
+        """
+        if self._step is not None:
+            return f'<ReAwaitable: pending {self._step!r}>'
+        if self._coro is not None:
+            return repr(self._coro)
+        if self._exception is None:
+            return f'<ReAwaitable: {self._cache!r}>'
+        return f'<ReAwaitable: {self._exception!r}>'
+
+    @classmethod
+    def from_value(
+        cls,
+        inner_value: _NewValueType,
+    ) -> 'ReAwaitable[_NewValueType]':
+        """
+        Creates an already resolved instance.
+
+        No coroutines are created, ``await`` returns the value at once:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.primitives.reawaitable import ReAwaitable
+
+          >>> instance = ReAwaitable.from_value(1)
+          >>> assert anyio.run(lambda: instance) == 1
+
+        """
+        return cls._from_outcome(inner_value, None)
+
+    def map(
+        self,
+        function: Callable[[_ValueType_co], _NewValueType],
+    ) -> 'ReAwaitable[_NewValueType]':
+        """
+        Creates a new instance with ``function`` applied to the value.
+
+        No coroutines are created here.
+        When this instance is already resolved,
+        ``function`` is called right away.
+        Otherwise, all pending steps are executed one by one
+        in a single coroutine, when any of them is awaited:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.primitives.reawaitable import ReAwaitable
+
+          >>> async def test() -> int:
+          ...    return 1
+
+          >>> instance = ReAwaitable(test()).map(lambda number: number + 1)
+          >>> assert anyio.run(lambda: instance) == 2
+
+        """
+        return self._then(function, awaits=False)
+
+    def bind(
+        self,
+        function: Callable[[_ValueType_co], Awaitable[_NewValueType]],
+    ) -> 'ReAwaitable[_NewValueType]':
+        """
+        Creates a new instance that awaits ``function`` called with the value.
+
+        Works the same way as :meth:`~ReAwaitable.map` does:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.primitives.reawaitable import ReAwaitable
+
+          >>> async def test(number: int) -> int:
+          ...    return number + 1
+
+          >>> instance = ReAwaitable(test(1)).bind(test)
+          >>> assert anyio.run(lambda: instance) == 3
+
+        """
+        return self._then(function, awaits=True)
+
+    def detached(self) -> 'ReAwaitable[_ValueType_co]':
         """
-        return repr(self._coro)
+        Returns an instance that runs this computation in its own task.
 
-    async def _awaitable(self) -> _ValueType:
-        """Caches the once awaited value forever."""
-        if self._cache is _sentinel:
-            self._cache = await self._coro
+        Cancelled awaiters of the returned instance do not cancel
+        this computation, so it can still be awaited later.
+        Resolved and shared instances are returned as is:
+
+        .. code:: python
+
+          >>> import anyio
+          >>> from returns.primitives.reawaitable import ReAwaitable
+
+          >>> async def slow() -> int:
+          ...     await anyio.sleep(0.01)
+          ...     return 1
+
+          >>> async def main() -> int:
+          ...     instance = ReAwaitable(slow())
+          ...     with anyio.move_on_after(0):
+          ...         await instance.detached()
+          ...     return await instance
+
+          >>> assert anyio.run(main) == 1
+
+          >>> resolved = ReAwaitable.from_value(1)
+          >>> assert resolved.detached() is resolved
+
+        """
+        if self._coro is None or self._shared:
+            return self
+        return ReAwaitable(self, shared=True)
+
+    async def _awaitable(self) -> _ValueType_co:
+        """Caches the once awaited value or raised exception forever."""
+        while self._coro is not None:
+            if self._waiters is None and self._shared:
+                _spawn(partial(self._run, self._start()))
+            elif self._waiters is None:
+                await self._run(self._start())
+            else:
+                event = _create_event()
+                self._waiters.append(event)
+                await event.wait()
+        if self._exception is not None:
+            # We raise the same exception many times, reset its traceback:
+            raise self._exception.with_traceback(self._traceback)
         return self._cache  # type: ignore
 
+    @classmethod
+    def _from_outcome(
+        cls,
+        cache: Any,
+        exception: BaseException | None,
+    ) -> 'ReAwaitable[Any]':
+        instance = cls.__new__(cls)
+        instance._coro = None  # noqa: SLF001
+        instance._step = None  # noqa: SLF001
+        instance._awaits = False  # noqa: SLF001
+        instance._shared = False  # noqa: SLF001
+        instance._cache = cache  # noqa: SLF001
+        instance._exception = exception  # noqa: SLF001
+        instance._traceback = (  # noqa: SLF001
+            None if exception is None else exception.__traceback__
+        )
+        instance._waiters = None  # noqa: SLF001
+        return instance
+
+    def _then(
+        self,
+        function: Callable[[Any], Any],
+        *,
+        awaits: bool,
+    ) -> 'ReAwaitable[Any]':
+        if self._coro is None:
+            return self._then_resolved(function, awaits=awaits)
+        instance = ReAwaitable(self)
+        instance._step = function
+        instance._awaits = awaits
+        return instance
+
+    def _then_resolved(
+        self,
+        function: Callable[[Any], Any],
+        *,
+        awaits: bool,
+    ) -> 'ReAwaitable[Any]':
+        """Calls the step right away, nothing is left to await."""
+        if self._exception is not None:
+            return self
+        try:
+            computed = function(self._cache)
+        except Exception as exc:
+            return self._from_outcome(_sentinel, exc)
+        if not awaits:
+            return self._from_outcome(computed, None)
+        if isinstance(computed, ReAwaitable):
+            return computed
+        return ReAwaitable(computed)
+
+    async def _run(  # noqa: C901, WPS231
+        self,
+        chain: list['ReAwaitable[Any]'],
+    ) -> None:
+        """
+        Runs all pending steps up to this instance in a single coroutine.
+
+        Each passed instance is resolved with its own value,
+        so intermediate results are still computed only once.
+        Other awaiters of these instances wait for us.
+        Steps are marked as started before they are called,
+        this way we know what to do on cancellation.
+        """
+        try:  # noqa: PLW0717, WPS229
+            computed = await chain[0]._coro  # type: ignore[misc]  # noqa: SLF001
+            for instance in chain:
+                step = instance._step  # noqa: SLF001
+                instance._step = None  # noqa: SLF001
+                if step is not None:
+                    computed = step(computed)
+                if instance._awaits:  # noqa: SLF001
+                    computed = await computed  # noqa: WPS476
+                instance._resolve(computed, None)  # noqa: SLF001
+        except Exception as exc:
+            for instance in chain:
+                instance._fail(exc)  # noqa: SLF001
+        except BaseException:
+            for instance in chain:
+                instance._cancel()  # noqa: SLF001
+            raise
+
+    def _start(self) -> list['ReAwaitable[Any]']:
+        """
+        Marks this instance and its pending parents as running.
+
+        Shared parents are never run inline, we await them instead.
+        """
+        chain = [self]
+        while chain[-1]._step is not None:  # noqa: SLF001
+            parent = cast(ReAwaitable[Any], chain[-1]._coro)  # noqa: SLF001
+            if (
+                parent._coro is None  # noqa: SLF001
+                or parent._waiters is not None  # noqa: SLF001
+                or parent._shared  # noqa: SLF001
+            ):
+                break
+            chain.append(parent)
+        chain.reverse()
+        for instance in chain:
+            instance._waiters = []  # noqa: SLF001
+        return chain
+
+    def _resolve(
+        self,
+        cache: Any,
+        exception: BaseException | None,
+    ) -> None:
+        """Saves the result and releases everything we were waiting for."""
+        self._cache = cache
+        self._exception = exception
+        self._traceback = None if exception is None else exception.__traceback__
+        self._coro = None
+        self._step = None
+        self._wake()
+
+    def _fail(self, exception: Exception) -> None:
+        """Saves the raised exception, if we are not resolved yet."""
+        if self._coro is not None:
+            self._resolve(_sentinel, exception)
+
+    def _cancel(self) -> None:
+        """
+        Handles cancellation of the task that runs this instance.
+
+        Started computation cannot be resumed, so it is marked as cancelled.
+        Other awaiters can still run computations that were not started.
+        """
+        if self._coro is None:
+            return
+        if self._step is None:
+            self._resolve(
+                _sentinel,
+                RuntimeError('ReAwaitable computation was cancelled'),
+            )
+        else:
+            self._wake()
+
+    def _wake(self) -> None:
+        """Wakes up all waiting awaiters."""
+        waiters = self._waiters or ()
+        self._waiters = None
+        for event in waiters:
+            event.set()
+
+
+def _resolved(inner_value: _ValueType) -> Generator[None, None, _ValueType]:
+    """Returns the value without suspending and without any coroutines."""
+    yield from ()  # noqa: WPS353
+    return inner_value  # noqa: B901
+
+
+def _create_event() -> _Event:
+    """Creates an event for the running event loop."""
+    try:
+        import anyio  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        import asyncio  # noqa: PLC0415
+
+        return asyncio.Event()
+    return anyio.Event()
+
+
+def _spawn(function: Callable[[], Coroutine[Any, Any, None]]) -> None:
+    """Runs ``function`` in a new task, that is not bound to any awaiter."""
+    import asyncio  # noqa: PLC0415
+    import contextvars  # noqa: PLC0415
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # `anyio` supports only `asyncio` and `trio`:
+        import trio  # noqa: PLC0415
+
+        trio.lowlevel.spawn_system_task(
+            function,
+            context=contextvars.copy_context(),
+        )
+        return
+    task = loop.create_task(function())
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
 
 def reawaitable(
     coro: Callable[_Ps, _AwaitableT],
@@ -1,16 +1,57 @@
+import linecache
+import sys
 import types
 from collections.abc import Callable, Iterator
 from contextlib import AbstractContextManager, contextmanager
-from inspect import FrameInfo, stack
-from typing import TypeVar, overload
-
-from returns.result import Failure
+from contextvars import ContextVar
+from functools import cache, partial
+from inspect import FrameInfo, getframeinfo
+from itertools import count, islice
+from typing import Final, NamedTuple, TypeVar, final, overload
 
 _FunctionType = TypeVar('_FunctionType', bound=Callable)
 
 
+class _TraceLineStruct(NamedTuple):
+    """Basic struct to represent a single frame of a lightweight trace."""
+
+    filename: str
+    lineno: int
+    function: str
+
+
+@final
+class TraceLine(_TraceLineStruct):
+    """
+    Frame of a lightweight trace.
+
+    Has the same ``filename``, ``lineno``, ``function``,
+    and ``code_context`` fields as :class:`inspect.FrameInfo`,
+    but does not keep a reference to the frame itself.
+    """
+
+    __slots__ = ()
+
+    @property
+    def code_context(self) -> list[str] | None:
+        """Reads the source line only when it is requested."""
+        source_line = linecache.getline(self.filename, self.lineno)
+        return [source_line] if source_line else None
+
+
+#: Trace collector that is active in the current thread or ``asyncio`` task.
+_collector: Final[
+    ContextVar[Callable[[], list[FrameInfo] | list[TraceLine] | None] | None]
+] = ContextVar('collector', default=None)
+
+
 @overload
-def collect_traces() -> AbstractContextManager[None]: ...
+def collect_traces(
+    *,
+    lightweight: bool = False,
+    depth: int | None = None,
+    sample_rate: int = 1,
+) -> AbstractContextManager[None]: ...
 
 
 @overload
@@ -19,6 +60,10 @@ def collect_traces(function: _FunctionType) -> _FunctionType: ...
 
 def collect_traces(
     function: _FunctionType | None = None,
+    *,
+    lightweight: bool = False,
+    depth: int | None = None,
+    sample_rate: int = 1,
 ) -> _FunctionType | AbstractContextManager[None]:
     """
     Context Manager/Decorator to active traces collect to the Failures.
@@ -56,38 +101,143 @@ def collect_traces(
         /example_folder/example.py:1 in `<module>`
         # doctest: # noqa: DAR301, E501
 
+    Collecting full traces is slow, so there are several options
+    to make it cheap enough:
+
+    - ``lightweight=True`` stores only :class:`~TraceLine` objects
+      without frames, source lines are only read when they are requested
+    - ``depth`` limits the number of inspected and stored frames
+    - ``sample_rate=N`` only traces every ``N``-th created failure
+
+    .. code:: python
+
+        >>> from returns.primitives.tracing import TraceLine
+
+        >>> with collect_traces(lightweight=True, depth=2, sample_rate=2):
+        ...     failures = [Result.from_failure(number) for number in range(4)]
+
+        >>> traced = [failure for failure in failures if failure.trace]
+        >>> assert len(traced) == 2
+        >>> assert len(traced[0].trace) == 2
+        >>> assert isinstance(traced[0].trace[0], TraceLine)
+
+    All scopes with the same options share a single sampling counter,
+    so ``sample_rate`` samples failures across all requests and tasks.
+
     """
+    if sample_rate < 1:
+        raise ValueError(
+            f'Trace sample rate must be positive, got: {sample_rate}',
+        )
+    if depth is not None and depth < 0:
+        raise ValueError(f'Trace depth must not be negative, got: {depth}')
+    collector = _get_collector(
+        lightweight=lightweight,
+        depth=depth,
+        sample_rate=sample_rate,
+    )
 
     @contextmanager
     def factory() -> Iterator[None]:
-        unpatched_get_trace = getattr(Failure, '_get_trace')  # noqa: B009
-        substitute_get_trace = types.MethodType(_get_trace, Failure)
-        setattr(Failure, '_get_trace', substitute_get_trace)  # noqa: B010
+        token = _collector.set(collector)
         try:  # noqa: WPS501
             yield
         finally:
-            setattr(Failure, '_get_trace', unpatched_get_trace)  # noqa: B010
+            _collector.reset(token)
 
     return factory()(function) if function else factory()
 
 
-def _get_trace(_self: Failure) -> list[FrameInfo] | None:
+def get_trace() -> list[FrameInfo] | list[TraceLine] | None:
+    """
+    Collects a trace for a new ``Failure``, when it is enabled.
+
+    Tracing is enabled by :func:`~collect_traces`
+    only for the current thread or ``asyncio`` task,
+    so it does not affect any other concurrent code.
+    """
+    collector = _collector.get()
+    return None if collector is None else collector()
+
+
+@cache
+def _get_collector(
+    *,
+    lightweight: bool,
+    depth: int | None,
+    sample_rate: int,
+) -> Callable[[], list[FrameInfo] | list[TraceLine] | None]:
+    """Creates one collector with its own counter for each set of options."""
+    return partial(
+        _get_trace_lines if lightweight else _get_trace,
+        depth=depth,
+        counter=count(),
+        sample_rate=sample_rate,
+    )
+
+
+def _get_trace(
+    *,
+    depth: int | None,
+    counter: Iterator[int],
+    sample_rate: int,
+) -> list[FrameInfo] | None:
     """
-    Function to be used on Monkey Patching.
+    Function to collect full traces.
 
-    This function is the substitute for '_get_trace' method from ``Failure``
-    class on Monkey Patching promoted by
-    :func:`returns.primitives.tracing.collect_traces` function.
+    It is called by :func:`~get_trace`
+    when tracing is enabled by :func:`~collect_traces`.
 
-    We get all the call stack from the current call and return it from the
-    third position, to avoid two useless calls on the call stack.
-    Those useless calls are a call to this function and a call to `__init__`
-    method from ``Failure`` class. We're just interested in the call stack
-    ending on ``Failure`` function call!
+    We walk the call stack with ``sys._getframe`` starting from the fourth
+    frame, to avoid three useless calls on the call stack.
+    Those useless calls are a call to this function, a call to ``get_trace``,
+    and a call to `__init__` method from ``Failure`` class.
+    We're just interested in the call stack ending on ``Failure`` call!
+    Only the first ``depth`` frames are inspected.
 
     See also:
         - https://github.com/dry-python/returns/issues/409
 
     """
-    current_stack = stack()
-    return current_stack[2:]
+    if next(counter) % sample_rate:
+        return None
+    frames = _outer_frames(sys._getframe(3))  # noqa: SLF001
+    return [_frame_info(frame) for frame in islice(frames, depth)]
+
+
+def _get_trace_lines(
+    *,
+    depth: int | None,
+    counter: Iterator[int],
+    sample_rate: int,
+) -> list[TraceLine] | None:
+    """
+    Function to collect lightweight traces.
+
+    We walk the call stack with ``sys._getframe`` starting from the caller
+    of ``Failure`` and only store filenames, line numbers, and function names.
+    We do not keep any references to frames
+    and do not read any source files here.
+    """
+    if next(counter) % sample_rate:
+        return None
+    frames = _outer_frames(sys._getframe(3))  # noqa: SLF001
+    return [
+        TraceLine(
+            frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+        )
+        for frame in islice(frames, depth)
+    ]
+
+
+def _outer_frames(frame: types.FrameType | None) -> Iterator[types.FrameType]:
+    """Lazily walks from the given frame to the outermost one."""
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def _frame_info(frame: types.FrameType) -> FrameInfo:
+    """Creates the same ``FrameInfo`` as :func:`inspect.stack` does."""
+    traceback = getframeinfo(frame)
+    return FrameInfo(frame, *traceback, positions=traceback.positions)
@@ -14,10 +14,14 @@ from typing import (
 
 from typing_extensions import ParamSpec
 
+from returns._internal.do_notation import halt, run_do
+from returns.cache import Cache
+from returns.functions import identity
 from returns.interfaces.specific import result
 from returns.primitives.container import BaseContainer, container_equality
 from returns.primitives.exceptions import UnwrapFailedError
 from returns.primitives.hkt import Kind2, SupportsKind2
+from returns.primitives.tracing import TraceLine, get_trace
 
 # Definitions:
 _ValueType_co = TypeVar('_ValueType_co', covariant=True)
@@ -51,13 +55,13 @@ class Result(  # type: ignore[type-var]
     __match_args__ = ('_inner_value',)
 
     _inner_value: _ValueType_co | _ErrorType_co
-    _trace: list[FrameInfo] | None
+    _trace: list[FrameInfo] | list[TraceLine] | None
 
     #: Typesafe equality comparison with other `Result` objects.
     equals = container_equality
 
     @property
-    def trace(self) -> list[FrameInfo] | None:
+    def trace(self) -> list[FrameInfo] | list[TraceLine] | None:
         """Returns a list with stack trace when :func:`~Failure` was called."""
         return self._trace
 
@@ -197,7 +201,7 @@ class Result(  # type: ignore[type-var]
 
     def __iter__(self) -> Iterator[_ValueType_co]:
         """API for :ref:`do-notation`."""
-        yield self.unwrap()
+        return iter((self.unwrap(),))
 
     @classmethod
     def do(
@@ -227,10 +231,7 @@ class Result(  # type: ignore[type-var]
         This feature requires our :ref:`mypy plugin <mypy-plugins>`.
 
         """
-        try:
-            return Result.from_value(next(expr))
-        except UnwrapFailedError as exc:
-            return exc.halted_container  # type: ignore
+        return run_do(expr, Result.from_value, identity)
 
     def value_or(
         self,
@@ -358,10 +359,14 @@ class Failure(Result[Any, _ErrorType_co]):  # noqa: WPS338
     def __init__(self, inner_value: _ErrorType_co) -> None:
         """Failure constructor."""
         super().__init__(inner_value)
-        object.__setattr__(self, '_trace', self._get_trace())
+        object.__setattr__(self, '_trace', get_trace())
 
     if not TYPE_CHECKING:  # noqa: WPS604  # pragma: no branch
 
+        def __iter__(self):
+            """Ends :ref:`do-notation` without raising exceptions."""
+            return halt(self)
+
         def alt(self, function):
             """Composes failed container with a pure function to modify failure."""  # noqa: E501
             return Failure(function(self._inner_value))
@@ -403,9 +408,6 @@ class Failure(Result[Any, _ErrorType_co]):  # noqa: WPS338
         """Returns failed value."""
         return self._inner_value
 
-    def _get_trace(self) -> list[FrameInfo] | None:
-        """Method that will be monkey patched when trace is active."""
-
 
 @final
 class Success(Result[_ValueType_co, Any]):
@@ -488,18 +490,38 @@ def safe(
 @overload
 def safe(
     exceptions: tuple[type[_ExceptionType], ...],
+    *,
+    cache: Cache | None = None,
 ) -> Callable[
     [Callable[_FuncParams, _ValueType_co]],
     Callable[_FuncParams, Result[_ValueType_co, _ExceptionType]],
 ]: ...
 
 
+@overload
+def safe(
+    *,
+    cache: Cache,
+) -> Callable[
+    [Callable[_FuncParams, _ValueType_co]],
+    Callable[_FuncParams, ResultE[_ValueType_co]],
+]: ...
+
+
 def safe(  # noqa: WPS234
     exceptions: (
-        Callable[_FuncParams, _ValueType_co] | tuple[type[_ExceptionType], ...]
-    ),
+        Callable[_FuncParams, _ValueType_co]
+        | tuple[type[_ExceptionType], ...]
+        | None
+    ) = None,
+    *,
+    cache: Cache | None = None,
 ) -> (
     Callable[_FuncParams, ResultE[_ValueType_co]]
+    | Callable[
+        [Callable[_FuncParams, _ValueType_co]],
+        Callable[_FuncParams, ResultE[_ValueType_co]],
+    ]
     | Callable[
         [Callable[_FuncParams, _ValueType_co]],
         Callable[_FuncParams, Result[_ValueType_co, _ExceptionType]],
@@ -542,6 +564,19 @@ def safe(  # noqa: WPS234
     In this case, only exceptions that are explicitly
     listed are going to be caught.
 
+    Produced containers can be cached by function's arguments
+    with ``cache`` argument, see :mod:`returns.cache` for eviction policies:
+
+    .. code:: python
+
+      >>> from returns.cache import LRU
+
+      >>> @safe(cache=LRU(maxsize=128, skip_failures=True))
+      ... def parse(number: str) -> int:
+      ...     return int(number)
+
+      >>> assert parse('1') == Success(1)
+
     Similar to :func:`returns.io.impure_safe`
     and :func:`returns.future.future_safe` decorators.
     """
@@ -560,10 +595,16 @@ def safe(  # noqa: WPS234
             except inner_exceptions as exc:
                 return Failure(exc)
 
-        return decorator
+        if cache is None:
+            return decorator
+        return cache.wrap(decorator, Success)
 
-    if isinstance(exceptions, tuple):
-        return lambda function: factory(function, exceptions)
+    if exceptions is None or isinstance(exceptions, tuple):
+        inner_exceptions = (Exception,) if exceptions is None else exceptions
+        return lambda function: factory(
+            function,
+            inner_exceptions,  # type: ignore[arg-type]
+        )
     return factory(
         exceptions,
         (Exception,),  # type: ignore[arg-type]
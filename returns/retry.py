@@ -0,0 +1,306 @@
+import random
+import threading
+import time
+from collections.abc import Callable
+from functools import partial, wraps
+from typing import Any, TypeAlias, TypeVar, final
+
+from typing_extensions import ParamSpec
+
+from returns.future import FutureResult
+from returns.io import IOResult
+from returns.pipeline import is_successful
+from returns.result import Result, Success
+from returns.unsafe import unsafe_perform_io
+
+_ContainerType = TypeVar(
+    '_ContainerType',
+    bound=(Result[Any, Any] | IOResult[Any, Any] | FutureResult[Any, Any]),  # noqa: WPS221
+)
+_FuncParams = ParamSpec('_FuncParams')
+
+_Predicate: TypeAlias = Callable[[Any], bool]
+
+
+@final
+class Backoff:
+    """
+    Exponential backoff with optional full jitter.
+
+    Delay before the ``n``-th retry is ``initial * multiplier ** (n - 1)``,
+    but never more than ``maximum`` seconds.
+    With ``jitter=True`` a random delay between zero
+    and this value is used, so clients that failed at the same time
+    do not retry at the same time.
+
+    .. code:: python
+
+      >>> from returns.retry import Backoff
+
+      >>> backoff = Backoff(initial=1, multiplier=2, maximum=5, jitter=False)
+      >>> assert [backoff.delay(attempt) for attempt in (1, 2, 3, 4)] == [
+      ...     1, 2, 4, 5,
+      ... ]
+      >>> assert 0 <= Backoff(initial=1).delay(1) <= 1
+
+    """
+
+    __slots__ = ('_initial', '_jitter', '_maximum', '_multiplier')
+
+    def __init__(
+        self,
+        initial: float = 0.1,
+        multiplier: float = 2,
+        maximum: float = 10,
+        *,
+        jitter: bool = True,
+    ) -> None:
+        """Creates new backoff policy, all values are in seconds."""
+        self._initial = initial
+        self._multiplier = multiplier
+        self._maximum = maximum
+        self._jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Returns delay in seconds before the ``attempt``-th retry."""
+        delay = min(
+            self._initial * self._multiplier ** (attempt - 1),
+            self._maximum,
+        )
+        if self._jitter:
+            return random.uniform(0, delay)  # noqa: S311
+        return delay
+
+
+@final
+class RetryBudget:
+    """
+    Token bucket that limits how many retries can be made.
+
+    Each retry takes one token. Tokens are refilled
+    with ``refill_rate`` tokens per second up to ``capacity`` tokens.
+    When there are no tokens left, we stop retrying
+    and return the last failure.
+
+    Create a single budget and share it between all retried functions,
+    so retries cannot amplify load on a system that is already failing.
+    It is safe to share it between threads.
+
+    .. code:: python
+
+      >>> from returns.retry import RetryBudget
+
+      >>> budget = RetryBudget(capacity=2, refill_rate=0)
+      >>> assert budget.acquire()
+      >>> assert budget.acquire()
+      >>> assert not budget.acquire()
+
+    """
+
+    __slots__ = ('_capacity', '_lock', '_refill_rate', '_tokens', '_updated')
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        """Creates a full bucket."""
+        self._capacity = capacity
+        self._refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Takes a single token if there's one."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._refill_rate,
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def retry(
+    *,
+    max_attempts: int = 3,
+    max_elapsed: float | None = None,
+    backoff: Backoff | None = None,
+    when: _Predicate | None = None,
+    budget: RetryBudget | None = None,
+) -> Callable[
+    [Callable[_FuncParams, _ContainerType]],
+    Callable[_FuncParams, _ContainerType],
+]:
+    """
+    Retries functions that return ``Result``, ``IOResult``, or ``FutureResult``.
+
+    A function is called again when it returns a failed container,
+    until one of these happens:
+
+    1. It returns a successful container
+    2. ``when`` returns ``False`` for the failure value
+    3. ``max_attempts`` calls are made
+    4. The next retry would end after ``max_elapsed`` seconds
+    5. ``budget`` has no tokens left
+
+    Then the last returned container is returned.
+
+    .. code:: python
+
+      >>> from returns.result import Result, Success, Failure
+      >>> from returns.retry import Backoff, retry
+
+      >>> calls = []
+
+      >>> @retry(max_attempts=3, backoff=Backoff(initial=0))
+      ... def unstable() -> Result[int, str]:
+      ...     calls.append(1)
+      ...     return Success(len(calls)) if len(calls) > 1 else Failure('a')
+
+      >>> assert unstable() == Success(2)
+
+      >>> @retry(when=lambda error: error != 'fatal')
+      ... def fatal() -> Result[int, str]:
+      ...     return Failure('fatal')
+
+      >>> assert fatal() == Failure('fatal')
+
+    We sleep with :func:`time.sleep` between attempts
+    of ``Result`` and ``IOResult`` functions.
+    ``FutureResult`` functions are retried lazily when awaited,
+    we sleep with ``anyio.sleep`` there, so it works with any event loop.
+
+    Exceptions are not caught, use :func:`returns.result.safe`,
+    :func:`returns.io.impure_safe`, or :func:`returns.future.future_safe`
+    to convert them into failures first.
+    """
+    if max_attempts < 1:
+        raise ValueError(
+            f'Retry requires at least one attempt, got: {max_attempts}',
+        )
+    return _Retry(
+        max_attempts,
+        max_elapsed,
+        Backoff() if backoff is None else backoff,
+        _any_failure if when is None else when,
+        budget,
+    )
+
+
+@final
+class _Retry:
+    """Retry policy that is used as a decorator."""
+
+    __slots__ = (
+        '_backoff',
+        '_budget',
+        '_max_attempts',
+        '_max_elapsed',
+        '_when',
+    )
+
+    def __init__(  # noqa: WPS211
+        self,
+        max_attempts: int,
+        max_elapsed: float | None,
+        backoff: Backoff,
+        when: _Predicate,
+        budget: RetryBudget | None,
+    ) -> None:
+        self._max_attempts = max_attempts
+        self._max_elapsed = max_elapsed
+        self._backoff = backoff
+        self._when = when
+        self._budget = budget
+
+    def __call__(
+        self,
+        function: Callable[_FuncParams, _ContainerType],
+    ) -> Callable[_FuncParams, _ContainerType]:
+        @wraps(function)
+        def decorator(
+            *args: _FuncParams.args,
+            **kwargs: _FuncParams.kwargs,
+        ) -> _ContainerType:
+            return self._run(  # type: ignore[no-any-return]
+                partial(function, *args, **kwargs),
+            )
+
+        return decorator
+
+    def _run(self, attempt: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        container = attempt()
+        if isinstance(container, FutureResult):
+            # Futures are lazy, the first attempt only runs when awaited:
+            return FutureResult(self._run_async(attempt, container))
+        return self._run_sync(attempt, container, started)
+
+    def _run_sync(
+        self,
+        attempt: Callable[[], Any],
+        container: Any,
+        started: float,
+    ) -> Any:
+        attempts = 1
+        while not is_successful(container):
+            delay = self._next_delay(
+                attempts,
+                started,
+                _failure_value(container),
+            )
+            if delay is None:
+                break
+            time.sleep(delay)
+            container = attempt()
+            attempts += 1
+        return container
+
+    async def _run_async(
+        self,
+        attempt: Callable[[], FutureResult[Any, Any]],
+        container: FutureResult[Any, Any],
+    ) -> Result[Any, Any]:
+        import anyio  # noqa: PLC0415  # `anyio` should be installed separately
+
+        started = time.monotonic()
+        attempts = 1
+        outcome = await container._inner_value  # noqa: SLF001
+        while not isinstance(outcome, Success):
+            delay = self._next_delay(attempts, started, outcome.failure())
+            if delay is None:
+                break
+            await anyio.sleep(delay)  # noqa: WPS476
+            outcome = await attempt()._inner_value  # noqa: SLF001, WPS476
+            attempts += 1
+        return outcome
+
+    def _next_delay(
+        self,
+        attempts: int,
+        started: float,
+        failure: object,
+    ) -> float | None:
+        """Returns delay before the next attempt or ``None`` to stop."""
+        if attempts >= self._max_attempts or not self._when(failure):
+            return None
+        delay = self._backoff.delay(attempts)
+        if self._max_elapsed is not None and (
+            time.monotonic() - started + delay > self._max_elapsed
+        ):
+            return None
+        if self._budget is not None and not self._budget.acquire():
+            return None
+        return delay
+
+
+def _failure_value(container: Result[Any, Any] | IOResult[Any, Any]) -> Any:
+    if isinstance(container, IOResult):
+        return unsafe_perform_io(container.failure())
+    return container.failure()
+
+
+def _any_failure(failure: object) -> bool:
+    return True
@@ -0,0 +1,132 @@
+import anyio
+import pytest
+
+from returns.bulkhead import Bulkhead
+from returns.result import Failure, Success
+
+
+class _Tracked:
+    """Records the number of concurrent calls."""
+
+    def __init__(self, *, delay: float = 0.01) -> None:
+        self.running = 0
+        self.peak = 0
+        self._delay = delay
+
+    async def __call__(self) -> int:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:  # noqa: WPS501
+            await anyio.sleep(self._delay)
+        finally:
+            self.running -= 1
+        return self.peak
+
+
+def _busy() -> str:
+    return 'busy'
+
+
+async def _raise() -> int:
+    raise ValueError('error')
+
+
+@pytest.mark.anyio
+async def test_bulkhead_limit():
+    """Ensures that only ``limit`` functions run at the same time."""
+    bulkhead = Bulkhead(2)
+    tracked = _Tracked()
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(5):
+            task_group.start_soon(bulkhead.run, tracked)
+
+    assert tracked.peak == 2
+    assert (bulkhead.in_flight, bulkhead.waiting, bulkhead.rejected) == (
+        0,
+        0,
+        0,
+    )
+
+
+@pytest.mark.anyio
+async def test_bulkhead_metrics():
+    """Ensures that running and waiting callers are counted."""
+    bulkhead = Bulkhead(1, max_waiting=2, on_reject=_busy)
+    tracked = _Tracked(delay=0.1)
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(3):
+            task_group.start_soon(bulkhead.run, tracked)
+        await anyio.sleep(0.05)
+
+        assert bulkhead.in_flight == 1
+        assert bulkhead.waiting == 2
+        assert await bulkhead.run(tracked) == Failure('busy')
+        assert repr(bulkhead) == (
+            '<Bulkhead: 1/1 in flight, 2 waiting, 1 rejected>'
+        )
+
+    assert await bulkhead.run(tracked) == Success(1)
+    assert bulkhead.rejected == 1
+
+
+@pytest.mark.anyio
+async def test_bulkhead_fail_fast():
+    """Ensures that ``max_waiting=0`` rejects callers without free slots."""
+    bulkhead = Bulkhead(1, max_waiting=0, on_reject=_busy)
+    tracked = _Tracked(delay=0.1)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(bulkhead.run, tracked)
+        await anyio.sleep(0.05)
+        assert await bulkhead.run(tracked) == Failure('busy')
+
+    assert await bulkhead.run(tracked) == Success(1)
+
+
+@pytest.mark.anyio
+async def test_bulkhead_nested():
+    """Ensures that the same task can take several slots."""
+    bulkhead = Bulkhead(2)
+
+    async def factory() -> int:
+        inner = await bulkhead.run(_Tracked())
+        return bulkhead.in_flight + inner.unwrap()
+
+    assert await bulkhead.run(factory) == Success(2)
+
+
+@pytest.mark.anyio
+async def test_bulkhead_exception():
+    """Ensures that raised exceptions release slots."""
+    bulkhead = Bulkhead(1)
+
+    with pytest.raises(ValueError, match='error'):
+        await bulkhead.run(_raise)
+
+    assert bulkhead.in_flight == 0
+    assert await bulkhead.run(_Tracked()) == Success(1)
+
+
+@pytest.mark.anyio
+async def test_bulkhead_cancel_waiting():
+    """Ensures that cancelled callers stop waiting."""
+    bulkhead = Bulkhead(1)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(bulkhead.run, _Tracked(delay=0.1))
+        await anyio.sleep(0.01)
+        with anyio.move_on_after(0.05):
+            await bulkhead.run(_Tracked())
+        assert bulkhead.waiting == 0
+
+    assert bulkhead.in_flight == 0
+
+
+def test_bulkhead_validation():
+    """Ensures that wrong arguments are rejected."""
+    with pytest.raises(ValueError, match='at least one slot'):
+        Bulkhead(0)
+    with pytest.raises(ValueError, match='requires on_reject'):
+        Bulkhead(1, max_waiting=1)  # type: ignore[call-overload]
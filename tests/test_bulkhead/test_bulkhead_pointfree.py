@@ -0,0 +1,112 @@
+import anyio
+import pytest
+
+from returns.bulkhead import Bulkhead
+from returns.context import RequiresContextFutureResult
+from returns.future import Future, FutureResult
+from returns.io import IO, IOFailure, IOSuccess
+from returns.pointfree import bind_async, bind_awaitable
+
+
+def _busy() -> str:
+    return 'busy'
+
+
+async def _hold() -> None:
+    await anyio.sleep(0.1)
+
+
+async def _increment(number: int) -> int:
+    return number + 1
+
+
+async def _in_flight(bulkhead: Bulkhead[str]) -> int:
+    return bulkhead.in_flight
+
+
+@pytest.mark.anyio
+async def test_bind_async_awaits_in_slot():
+    """Ensures that returned containers are awaited in the same slot."""
+    bulkhead = Bulkhead(1)
+
+    async def factory(number: int) -> FutureResult[int, str]:
+        return FutureResult.from_future(Future(_in_flight(bulkhead)))
+
+    bound = bind_async(factory, limiter=bulkhead)(FutureResult.from_value(1))
+
+    assert await bound == IOSuccess(1)
+    assert bulkhead.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_bind_async_rejected():
+    """Ensures that rejected calls return ``Failure``."""
+    bulkhead = Bulkhead(1, max_waiting=0, on_reject=_busy)
+
+    async def factory(number: int) -> FutureResult[int, str]:
+        return FutureResult.from_value(number)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(bulkhead.run, _hold)
+        await anyio.sleep(0.05)
+        assert await bind_async(factory, limiter=bulkhead)(
+            FutureResult.from_value(1),
+        ) == IOFailure('busy')
+
+
+@pytest.mark.anyio
+async def test_bind_async_context():
+    """Ensures that limited steps work with context containers."""
+    bulkhead = Bulkhead(1, max_waiting=0, on_reject=_busy)
+
+    async def factory(
+        number: int,
+    ) -> RequiresContextFutureResult[int, str, int]:
+        return (
+            RequiresContextFutureResult[int, str, int]
+            .ask()
+            .map(
+                number.__add__,
+            )
+        )
+
+    bound = bind_async(factory, limiter=bulkhead)(
+        RequiresContextFutureResult.from_value(1),
+    )
+
+    assert await bound(2) == IOSuccess(3)
+
+
+@pytest.mark.anyio
+async def test_bind_awaitable_limited():
+    """Ensures that ``bind_awaitable`` runs functions in slots."""
+    bulkhead = Bulkhead(1, max_waiting=0, on_reject=_busy)
+
+    assert await bind_awaitable(_increment, limiter=Bulkhead(1))(
+        Future.from_value(1),
+    ) == IO(2)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(bulkhead.run, _hold)
+        await anyio.sleep(0.05)
+        assert await bind_awaitable(_increment, limiter=bulkhead)(
+            FutureResult.from_value(1),
+        ) == IOFailure('busy')
+
+    assert await bind_awaitable(_increment, limiter=bulkhead)(
+        FutureResult.from_value(1),
+    ) == IOSuccess(2)
+
+
+def test_future_rejected_limiter():
+    """Ensures that ``Future`` can't use bulkheads that reject calls."""
+    bulkhead = Bulkhead(1, max_waiting=0, on_reject=_busy)
+
+    with pytest.raises(TypeError, match='cannot return rejected calls'):
+        bind_awaitable(_increment, limiter=bulkhead)(  # type: ignore[type-var]
+            Future.from_value(1),
+        )
+    with pytest.raises(TypeError, match='cannot return rejected calls'):
+        bind_async(_increment, limiter=bulkhead)(  # type: ignore[arg-type]
+            Future.from_value(1),  # type: ignore[arg-type]
+        )
@@ -0,0 +1,157 @@
+import time
+from collections.abc import Callable
+from typing import TypeAlias
+
+import pytest
+
+from returns.cache import LFU, LRU, TTL, Cache
+from returns.result import Failure, Result, Success
+
+
+class _Calls:
+    """Records calls, negative numbers are failures."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def __call__(self, number: int, **kwargs: int) -> Result[int, int]:
+        self.calls.append(number)
+        if number < 0:
+            return Failure(number)
+        return Success(number)
+
+
+_Cached: TypeAlias = Callable[..., Result[int, int]]
+
+
+def _cached(cache: Cache) -> tuple[_Cached, _Calls]:
+    function = _Calls()
+    return cache.wrap(function, Success), function
+
+
+def test_lru():
+    """Ensures that the least recently used container is evicted."""
+    cache = LRU(maxsize=2)
+    cached, function = _cached(cache)
+
+    for number in (1, 2, 1, 3, 2, 1):
+        assert cached(number) == Success(number)
+
+    assert function.calls == [1, 2, 3, 2, 1]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 5, 3)
+    assert len(cache) == 2
+
+
+def test_lfu():
+    """Ensures that the least frequently used container is evicted."""
+    cache = LFU(maxsize=2)
+    cached, function = _cached(cache)
+
+    for number in (1, 1, 2, 2, 2, 3, 2, 1, 3):
+        assert cached(number) == Success(number)
+
+    assert function.calls == [1, 2, 3, 1, 3]
+    assert (cache.hits, cache.misses, cache.evictions) == (4, 5, 3)
+    assert len(cache) == 2
+
+
+def test_lfu_ties():
+    """Ensures that equally used containers are evicted in the LRU order."""
+    cache = LFU(maxsize=2)
+    cached, function = _cached(cache)
+
+    for number in (1, 2, 3, 2, 1):
+        assert cached(number) == Success(number)
+
+    assert function.calls == [1, 2, 3, 1]
+
+
+def test_lfu_reentrant():
+    """Ensures that storing the same key twice keeps its usage count."""
+    cache = LFU(maxsize=2)
+    calls: list[int] = []
+
+    def factory(number: int) -> Result[int, int]:
+        calls.append(number)
+        if len(calls) == 1:
+            cached(number)  # the same key is stored by the nested call first
+        return Success(number)
+
+    cached = cache.wrap(factory, Success)
+
+    assert cached(1) == Success(1)
+    assert cached(1) == Success(1)
+    assert calls == [1, 1]
+    assert len(cache) == 1
+
+
+def test_ttl():
+    """Ensures that containers expire after ``seconds``."""
+    cache = TTL(seconds=0.01, maxsize=2)
+    cached, function = _cached(cache)
+
+    for number in (1, 2, 3, 3):
+        assert cached(number) == Success(number)
+    time.sleep(0.02)
+    assert cached(3) == Success(3)
+
+    assert function.calls == [1, 2, 3, 3]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 4, 2)
+    assert len(cache) == 2
+
+
+def test_skip_failures():
+    """Ensures that failures can be excluded from the cache."""
+    cache = LRU(skip_failures=True)
+    cached, function = _cached(cache)
+
+    for number in (-1, -1, 1, 1):
+        cached(number)
+
+    assert function.calls == [-1, -1, 1]
+
+
+def test_kwargs():
+    """Ensures that keyword arguments are part of the key."""
+    cache = LRU()
+    cached, function = _cached(cache)
+
+    cached(1, other=1)
+    cached(1, other=1)
+    cached(1, other=2)
+    cached(1)
+
+    assert function.calls == [1, 1, 1]
+
+
+@pytest.mark.parametrize('cache', [LRU(), LFU(), TTL(seconds=60)])
+def test_clear(cache: Cache):
+    """Ensures that cached containers can be removed."""
+    cached, function = _cached(cache)
+
+    cached(1)
+    cache.clear()
+    cached(1)
+    cached(1)
+
+    assert function.calls == [1, 1]
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.parametrize('policy', [LRU, LFU])
+def test_wrong_maxsize(policy: type[LRU] | type[LFU]):
+    """Ensures that ``maxsize`` must be positive."""
+    with pytest.raises(ValueError, match='positive maxsize'):
+        policy(maxsize=0)
+
+
+def test_repr():
+    """Ensures that counters are shown in ``repr``."""
+    cache = TTL(seconds=60)
+    cached, _ = _cached(cache)
+
+    cached(1)
+    cached(1)
+
+    assert repr(cache) == '<TTL: size=1, hits=1, misses=1, evictions=0>'
@@ -0,0 +1,175 @@
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from returns.cache import SQLite
+from returns.io import IOSuccess, impure_safe
+from returns.result import Failure, Result, Success
+
+
+class _Calls:
+    """Records calls, negative numbers are failures."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def __call__(self, number: int) -> Result[int, str]:
+        self.calls.append(number)
+        if number < 0:
+            return Failure('negative')
+        return Success(number)
+
+
+def _other(number: int) -> Result[int, str]:
+    return Success(-number)
+
+
+def _not_picklable(number: int) -> Result[threading.Lock, str]:
+    return Success(threading.Lock())
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    """Path to a new database."""
+    return tmp_path / 'cache.sqlite'
+
+
+def test_persistent(path: Path):
+    """Ensures that containers survive between cache instances."""
+    function = _Calls()
+    cached = SQLite(path).wrap(function, Success)
+    assert cached(1) == Success(1)
+    assert cached(-1) == Failure('negative')
+
+    cache = SQLite(path)
+    cached = cache.wrap(function, Success)
+    assert cached(1) == Success(1)
+    assert cached(-1) == Failure('negative')
+
+    assert function.calls == [1, -1]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 0, 2)
+
+
+def test_version(path: Path):
+    """Ensures that new version does not use old containers."""
+    function = _Calls()
+    SQLite(path, version='1').wrap(function, Success)(1)
+    SQLite(path, version='2').wrap(function, Success)(1)
+    SQLite(path, version='1').wrap(function, Success)(1)
+
+    assert function.calls == [1, 1]
+
+
+def test_namespace(path: Path):
+    """Ensures that functions do not share containers."""
+    function = _Calls()
+    first = SQLite(path).wrap(function, Success)
+    second = SQLite(path).wrap(_other, Success)
+
+    assert first(1) == Success(1)
+    assert second(1) == Success(-1)
+
+
+def test_namespace_same_instance(path: Path):
+    """Ensures that functions wrapped by one instance do not share keys."""
+    function = _Calls()
+    cache = SQLite(path)
+    first = cache.wrap(function, Success)
+    second = cache.wrap(_other, Success)
+
+    assert first(1) == Success(1)
+    assert second(1) == Success(-1)
+    assert first(1) == Success(1)
+    assert function.calls == [1]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+def test_maxsize(path: Path):
+    """Ensures that the oldest containers are evicted."""
+    function = _Calls()
+    cache = SQLite(path, maxsize=2)
+    cached = cache.wrap(function, Success)
+
+    for number in (1, 2, 3, 3, 1):
+        cached(number)
+
+    reopened = SQLite(path, maxsize=2)
+    reopened.wrap(function, Success)(4)
+
+    assert function.calls == [1, 2, 3, 1, 4]
+    assert cache.evictions == 2
+    assert reopened.evictions == 1
+    assert len(reopened) == 2
+
+
+def test_skip_failures(path: Path):
+    """Ensures that failures can be excluded from the database."""
+    function = _Calls()
+    cached = SQLite(path, skip_failures=True).wrap(function, Success)
+
+    cached(-1)
+    cached(-1)
+
+    assert function.calls == [-1, -1]
+
+
+def test_not_picklable(path: Path):
+    """Ensures that containers that cannot be pickled are not stored."""
+    cache = SQLite(path)
+    cached = cache.wrap(_not_picklable, Success)
+
+    assert isinstance(cached(1).unwrap(), type(threading.Lock()))
+    assert not len(cache)
+
+
+def test_impure_safe(path: Path):
+    """Ensures that ``IOResult`` containers are stored as well."""
+    cache = SQLite(path)
+
+    @impure_safe(cache=cache)
+    def factory(number: int) -> int:
+        return number
+
+    assert factory(1) == IOSuccess(1)
+    assert factory(1) == IOSuccess(1)
+    assert cache.hits == 1
+
+
+def test_clear_and_close(path: Path):
+    """Ensures that the database can be cleared and closed."""
+    function = _Calls()
+    cache = SQLite(path)
+    cached = cache.wrap(function, Success)
+
+    cached(1)
+    cache.clear()
+    cached(1)
+    cache.close()
+
+    assert function.calls == [1, 1]
+    assert len(SQLite(path)) == 1
+
+
+def test_wrong_maxsize(path: Path):
+    """Ensures that ``maxsize`` must be positive."""
+    with pytest.raises(ValueError, match='positive maxsize'):
+        SQLite(path, maxsize=0)
+
+
+def test_sqlite_imported_lazily():
+    """Ensures that containers do not import persistence modules."""
+    code = (
+        'import sys, returns.cache, returns.io, returns.result; '
+        "print(sorted({'hashlib', 'pickle', 'sqlite3'} & set(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert output == '[]\n'
@@ -0,0 +1,96 @@
+import pytest
+
+from returns.context import (
+    RequiresContext,
+    RequiresContextIOResult,
+    RequiresContextResult,
+)
+from returns.functions import compose
+from returns.io import IOFailure, IOSuccess
+from returns.result import Failure, Success
+
+_STEPS = 10_000
+
+
+def _increment(number: int) -> int:
+    return number + 1
+
+
+@pytest.mark.parametrize(
+    ('container_type', 'expected'),
+    [
+        (RequiresContext, _STEPS),
+        (RequiresContextResult, Success(_STEPS)),
+        (RequiresContextIOResult, IOSuccess(_STEPS)),
+    ],
+)
+def test_long_chain(container_type, expected):
+    """Ensures that long chains do not hit the recursion limit."""
+    container = container_type.from_value(0)
+    bound = compose(_increment, container_type.from_value)
+    for index in range(_STEPS):
+        if index % 2:
+            container = container.map(_increment)
+        else:
+            container = container.bind(bound)
+    assert container(...) == expected
+
+
+def test_long_apply_chain():
+    """Ensures that long ``apply`` chains do not hit the recursion limit."""
+    container = RequiresContextResult.from_value(0)
+    function = RequiresContextResult.from_value(_increment)
+    for _ in range(_STEPS):
+        container = container.apply(function)
+    assert container(...) == Success(_STEPS)
+
+
+def test_long_lash_chain():
+    """Ensures that long failed chains do not hit the recursion limit."""
+    container = RequiresContextIOResult.from_failure(0)
+    lashed = compose(_increment, RequiresContextIOResult.from_failure)
+    for _ in range(_STEPS):
+        container = container.lash(lashed).alt(abs)
+    assert container(...) == IOFailure(_STEPS)
+
+
+def test_shared_chain():
+    """Ensures that branches of the same chain are independent."""
+    calls: list[int] = []
+
+    def factory(deps: int) -> int:
+        calls.append(deps)
+        return deps
+
+    base: RequiresContext[int, int] = RequiresContext(factory).map(
+        lambda number: number * 2,
+    )
+
+    assert base(1) == 2
+    first = base.map(lambda number: number + 1)
+    second = base.map(lambda number: number - 1).modify_env(int)
+
+    assert first(2) == 5
+    assert second('3') == 5
+    assert base(4) == 8
+    assert calls == [1, 2, 3, 4]
+
+
+def test_chain_failure_short_circuits():
+    """Ensures that steps still follow the semantics of ``Result``."""
+    container = RequiresContextResult.from_value(1).bind_result(
+        lambda _: Failure('a'),
+    )
+    for _ in range(_STEPS):
+        container = container.map(lambda number: number + 1)
+    assert container(...) == Failure('a')
+
+
+def test_chain_repr():
+    """Ensures that chains show their source and the number of steps."""
+    container = RequiresContext(str).map(len).map(abs)
+    expected = "<RequiresContext: <Chain: <class 'str'> with 2 steps>>"
+
+    assert repr(container) == expected
+    assert container(-10) == 3
+    assert repr(container) == expected
@@ -0,0 +1,200 @@
+from typing import Any
+
+import pytest
+
+from returns.context import (
+    RequiresContext,
+    RequiresContextFutureResult,
+    RequiresContextIOResult,
+    RequiresContextResult,
+    memoized_scope,
+)
+from returns.future import Future, FutureResult
+from returns.io import IO, IOFailure, IOResult, IOSuccess
+from returns.result import Failure, Result, Success
+
+_RCFR = RequiresContextFutureResult
+
+
+def _increment(number: int) -> int:
+    return number + 1
+
+
+def _add_deps(number: int) -> _RCFR[int, str, int]:
+    return _RCFR(lambda deps: FutureResult.from_value(number + deps))
+
+
+async def _async_add_deps(number: int) -> _RCFR[int, str, int]:
+    return _add_deps(number)
+
+
+async def _async_value(number: int) -> int:
+    return number + 1
+
+
+async def _async_future(number: int) -> Future[int]:
+    return Future.from_value(number + 1)
+
+
+async def _async_future_result(number: int) -> FutureResult[int, str]:
+    return FutureResult.from_value(number + 1)
+
+
+def _check(number: int) -> Result[int, str]:
+    if number > 0:
+        return Success(number)
+    return Failure(str(number))
+
+
+def _program(container: _RCFR[int, str, int]) -> _RCFR[Any, Any, int]:
+    container = container.map(_increment).apply(
+        _RCFR.from_value(lambda number: number * 2),
+    )
+    container = container.bind_result(_check).bind(_add_deps)
+    container = container.bind_async(_async_add_deps).bind_awaitable(
+        _async_value,
+    )
+    container = (
+        container
+        .bind_context(
+            lambda number: RequiresContext(number.__add__),
+        )
+        .bind_context_result(
+            lambda number: RequiresContextResult.from_result(_check(number)),
+        )
+        .bind_context_ioresult(
+            lambda number: RequiresContextIOResult.from_value(number + 1),
+        )
+    )
+    container = container.bind_io(IO.from_value).bind_ioresult(IOSuccess)
+    container = container.bind_future(Future.from_value).bind_future_result(
+        FutureResult.from_value,
+    )
+    return (
+        container
+        .bind_async_future(
+            _async_future,
+        )
+        .bind_async_future_result(
+            _async_future_result,
+        )
+        .alt(
+            '{0}!'.format,
+        )
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ('deps', 'expected'),
+    [
+        (1, Success(11)),
+        (-1, Failure('0!')),
+    ],
+)
+async def test_compile_all_steps(deps: int, expected: Result[int, str]):
+    """Ensures that compiled programs work the same way as regular ones."""
+    program = _program(_RCFR[int, str, int].ask())
+
+    assert await program.compile()(deps) == expected
+    assert await program(deps) == IOResult.from_result(expected)
+
+
+@pytest.mark.anyio
+async def test_compile_failures():
+    """Ensures that failed values skip all steps but recovering ones."""
+    program = (
+        _program(_RCFR.from_failure('a'))
+        .lash(
+            lambda error: _RCFR.from_value(len(error)),
+        )
+        .swap()
+        .compose_result(
+            lambda inner: _RCFR.from_result(inner.swap()),
+        )
+    )
+
+    assert await program.compile()(0) == Success(2)
+    assert await program(0) == IOSuccess(2)
+
+
+@pytest.mark.anyio
+async def test_compile_lash_success():
+    """Ensures that ``lash`` skips successful values."""
+    program = _RCFR.from_value(1).lash(_RCFR.from_failure)
+
+    assert await program.compile()(...) == Success(1)
+
+
+@pytest.mark.anyio
+async def test_compile_regular_function():
+    """Ensures that containers without steps can be compiled too."""
+    run = _RCFR.from_value(1).compile()
+
+    assert await run(...) == Success(1)
+    assert await run(...) == Success(1)
+
+
+@pytest.mark.anyio
+async def test_compile_memoize():
+    """Ensures that compiled programs memoize containers in a scope."""
+    calls: list[int] = []
+
+    def factory(deps: int) -> FutureResult[int, str]:
+        calls.append(deps)
+        return FutureResult.from_value(deps)
+
+    memoized = _RCFR(factory).memoize()
+    run = memoized.bind(
+        lambda first: memoized.map(first.__add__),
+    ).compile()
+
+    with memoized_scope():
+        assert await run(1) == Success(2)
+    assert calls == [1]
+    with memoized_scope():
+        assert await run(1) == Success(2)
+    assert calls == [1, 1]
+
+    nested = _RCFR[int, str, int].ask().bind_awaitable(run)
+    with memoized_scope():
+        assert await nested(2) == IOSuccess(Success(4))
+    assert calls == [1, 1, 2]
+
+
+@pytest.mark.anyio
+async def test_compile_long_chain():
+    """Ensures that long async chains do not hit the recursion limit."""
+    program = _RCFR.from_value(0)
+    for _ in range(10_000):
+        program = program.map(_increment).bind(_RCFR.from_value)
+
+    assert await program.compile()(...) == Success(10_000)
+    assert await program(...) == IOSuccess(10_000)
+
+
+def test_compile_repr():
+    """Ensures that async chains show the number of steps."""
+    program = _RCFR.from_value(0).map(str)
+
+    assert repr(program).startswith(
+        '<RequiresContextFutureResult: <AsyncChain: <function',
+    )
+    assert repr(program).endswith('with 1 steps>>')
+
+
+def test_unawaited_call(recwarn):
+    """Ensures that containers that are never awaited don't warn."""
+    _RCFR.from_value(1).map(_increment)(...)
+
+    assert not recwarn.list
+
+
+@pytest.mark.anyio
+async def test_compile_io_failure():
+    """Ensures that failed ``IOResult`` steps are propagated."""
+    program = _RCFR.from_value(1).bind_ioresult(
+        lambda _: IOFailure('a'),
+    )
+
+    assert await program.compile()(...) == Failure('a')
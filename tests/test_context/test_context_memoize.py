@@ -0,0 +1,225 @@
+import operator
+from typing import Any
+
+import anyio
+import pytest
+
+from returns.context import (
+    RequiresContext,
+    RequiresContextFutureResult,
+    RequiresContextIOResult,
+    RequiresContextResult,
+    memoized_scope,
+)
+from returns.future import FutureResult
+from returns.io import IOResult, IOSuccess
+from returns.result import Result, Success
+
+
+def _twice(memoized: Any) -> Any:
+    """Program that uses the same container in two branches."""
+    return memoized.bind(
+        lambda first: memoized.map(first.__add__),
+    )
+
+
+class _Load:
+    """Records ``deps`` of each call."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def __call__(self, deps: int) -> int:
+        self.calls.append(deps)
+        return deps * 10
+
+
+@pytest.mark.parametrize(
+    ('container_type', 'wrap', 'expected'),
+    [
+        (RequiresContext, int, 20),
+        (RequiresContextResult, Success, Success(20)),
+        (RequiresContextIOResult, IOSuccess, IOSuccess(20)),
+    ],
+)
+def test_memoize_branches(container_type, wrap, expected):
+    """Ensures that branches share memoized containers in a scope."""
+    load = _Load()
+    memoized = container_type(lambda deps: wrap(load(deps))).memoize()
+    program = _twice(memoized)
+
+    with memoized_scope():
+        assert program(1) == expected
+    assert load.calls == [1]
+    with memoized_scope():
+        assert program(1) == expected
+    assert load.calls == [1, 1]
+
+
+def test_memoize_without_scope():
+    """Ensures that memoized containers run on each call without a scope."""
+    load = _Load()
+    memoized: RequiresContext[int, int] = RequiresContext(load).memoize()
+
+    assert _twice(memoized)(1) == 20
+    assert load.calls == [1, 1]
+
+
+def test_memoize_nested_scopes():
+    """Ensures that nested scopes reuse the outer one."""
+    load = _Load()
+    memoized: RequiresContext[int, int] = RequiresContext(load).memoize()
+
+    with memoized_scope():
+        assert memoized(1) == 10
+        with memoized_scope():
+            assert memoized(1) == 10
+        assert memoized(1) == 10
+    assert load.calls == [1]
+
+
+def test_memoize_per_deps():
+    """Ensures that different ``deps`` objects are computed separately."""
+    load = _Load()
+    memoized: RequiresContext[int, int] = RequiresContext(load).memoize()
+    negated: RequiresContext[int, int] = memoized.modify_env(operator.neg)
+    program = memoized.bind(lambda first: negated.map(first.__add__))
+
+    with memoized_scope():
+        assert program(-1) == 0
+    assert load.calls == [-1, 1]
+
+
+def test_memoize_without_memoize():
+    """Ensures that regular containers are called once per use."""
+    load = _Load()
+    container = RequiresContext(load)
+
+    with memoized_scope():
+        assert container.bind(lambda _: container)(1) == 10
+    assert load.calls == [1, 1]
+
+
+def test_memoize_exceptions():
+    """Ensures that raised exceptions are not memoized."""
+    calls: list[int] = []
+
+    def factory(deps: int) -> int:
+        calls.append(deps)
+        if len(calls) == 1:
+            raise ValueError(deps)
+        return deps
+
+    memoized = RequiresContext(factory).memoize()
+    with memoized_scope():
+        with pytest.raises(ValueError, match='1'):
+            memoized(1)
+        assert memoized.bind(lambda _: memoized)(1) == 1
+    assert calls == [1, 1]
+
+
+def test_memoize_nested_branches():
+    """Ensures that branches share results, when only they are memoized."""
+    load = _Load()
+    memoized: RequiresContext[int, int] = RequiresContext(load).memoize()
+    program = (
+        RequiresContext[int, int]
+        .ask()
+        .bind(lambda _: memoized)
+        .bind(lambda first: memoized.map(first.__add__))
+    )
+
+    with memoized_scope():
+        assert program(1) == 20
+    assert load.calls == [1]
+
+
+def test_memoize_function_branches():
+    """Ensures that functions of ``deps`` share memoized containers."""
+    load = _Load()
+    memoized: RequiresContext[int, int] = RequiresContext(load).memoize()
+    program = RequiresContext[int, int](
+        lambda deps: memoized(deps) + memoized(deps),
+    )
+
+    with memoized_scope():
+        assert program(1) == 20
+    assert load.calls == [1]
+
+
+def test_memoize_repr():
+    """Ensures that memoized functions are shown in ``repr``."""
+    load = _Load()
+    memoized = RequiresContext(load).memoize()
+
+    assert repr(memoized) == f'<RequiresContext: <Memoized: {load!r}>>'
+
+
+@pytest.mark.anyio
+async def test_memoize_future_in_flight():
+    """Ensures that concurrent branches share the work in flight."""
+    calls: list[int] = []
+    memoized = RequiresContextFutureResult[int, str, int](
+        lambda deps: FutureResult(_load_later(calls, deps)),
+    ).memoize()
+    program = (
+        RequiresContextFutureResult[int, str, int]
+        .ask()
+        .bind_awaitable(
+            lambda deps: _concurrently(memoized, deps),
+        )
+    )
+
+    expected = IOSuccess([IOSuccess(10), IOSuccess(10)])
+
+    with memoized_scope():
+        assert await program(1) == expected
+    assert calls == [1]
+    with memoized_scope():
+        assert await program(1) == expected
+    assert calls == [1, 1]
+
+
+@pytest.mark.anyio
+async def test_memoize_future_branches():
+    """Ensures that sequential async branches share the result."""
+    calls: list[int] = []
+
+    memoized = RequiresContextFutureResult[int, str, int](
+        lambda deps: FutureResult(_load_later(calls, deps)),
+    ).memoize()
+
+    with memoized_scope():
+        assert await _twice(memoized)(2) == IOSuccess(40)
+    assert calls == [2]
+
+
+def test_memoize_regular_call():
+    """Ensures that regular containers return their inner value as is."""
+    future_result = FutureResult[int, str].from_value(1)
+    container = RequiresContextFutureResult[int, str, int](
+        lambda _: future_result,
+    )
+
+    assert container(1) is future_result
+
+
+async def _load_later(calls: list[int], deps: int) -> Result[int, str]:
+    calls.append(deps)
+    await anyio.sleep(0.01)
+    return Success(deps * 10)
+
+
+async def _concurrently(
+    memoized: RequiresContextFutureResult[int, str, int],
+    deps: int,
+) -> list[IOResult[int, str]]:
+    outcomes: list[IOResult[int, str]] = []
+
+    async def factory() -> None:
+        outcomes.append(await memoized(deps))
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(factory)
+        task_group.start_soon(factory)
+    return outcomes
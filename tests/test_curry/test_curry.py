@@ -192,3 +192,53 @@ def test_raises():
         factory(1, 2)
     with pytest.raises(TypeError):
         factory(1, 2, 3)  # type: ignore
+
+
+def test_positional_only_and_kwonly():
+    """The decorator should work with positional-only and kw-only args."""
+
+    @curry
+    def factory(arg: int, /, other: int = 2, *, by: int) -> tuple[int, ...]:
+        return (arg, other, by)
+
+    assert factory(1)(by=3) == (1, 2, 3)
+    assert factory(1, 5)(by=3) == (1, 5, 3)
+
+    with pytest.raises(TypeError, match='positional only'):
+        factory(arg=1)  # type: ignore
+    with pytest.raises(TypeError, match="multiple values for argument 'other'"):
+        factory(1, 2, other=3)  # type: ignore
+
+
+def test_keyword_args_become_positional():
+    """Keyword args are bound to leading parameters, like ``inspect`` does."""
+
+    @curry
+    def factory(arg: int, other: int, *, by: int) -> tuple[int, ...]:
+        return (arg, other, by)
+
+    leading = factory(arg=1, other=2)
+    assert leading(by=3) == (1, 2, 3)
+    assert factory(arg=1)(2, by=3) == (1, 2, 3)
+
+    with pytest.raises(TypeError, match="multiple values for argument 'arg'"):
+        factory(other=2)(1, arg=3)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs', 'message'),
+    [
+        ((1, 2, 3), {}, 'too many positional arguments'),
+        ((1,), {'arg': 2}, "multiple values for argument 'arg'"),
+        ((), {'missing': 1}, "unexpected keyword argument 'missing'"),
+    ],
+)
+def test_error_messages(args, kwargs, message):
+    """Ensures that invalid arguments raise the same errors as before."""
+
+    @curry
+    def factory(arg: int, other: int) -> tuple[int, int]:
+        return (arg, other)
+
+    with pytest.raises(TypeError, match=message):
+        factory(*args, **kwargs)
@@ -1,3 +1,7 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
 import pytest
 
 from returns.future import asyncify
@@ -14,3 +18,61 @@ async def test_asyncify_decorator():
     coro = _function(2)
 
     assert await coro == 1
+
+
+def _thread_id() -> int:
+    return threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_asyncify_thread():
+    """Ensure that ``executor='thread'`` runs functions in worker threads."""
+    assert await asyncify(_thread_id, executor='thread')() != _thread_id()
+
+
+@pytest.mark.anyio
+async def test_asyncify_process():
+    """Ensure that ``executor='process'`` runs functions in processes."""
+    assert await asyncify(executor='process')(pow)(2, 3) == 8
+
+
+@pytest.mark.anyio
+async def test_asyncify_executor():
+    """Ensure that any ``Executor`` can be used."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert await asyncify(abs, executor=executor)(-2) == 2
+
+
+@pytest.mark.anyio
+async def test_asyncify_executor_cancelled():
+    """Ensure that cancelled calls are not started by ``Executor``."""
+    calls: list[int] = []
+    event = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(event.wait)
+        with anyio.move_on_after(0.01):
+            await asyncify(calls.append, executor=executor)(1)
+        event.set()
+
+    assert not calls
+
+
+@pytest.mark.anyio
+async def test_asyncify_executor_without_threads():
+    """Ensure that executor calls do not take ``anyio`` worker threads."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    event = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(asyncify(event.wait, executor=executor))
+            await anyio.sleep(0.01)
+            borrowed_tokens = limiter.borrowed_tokens
+            event.set()
+
+    assert borrowed_tokens == 0
+
+
+def test_asyncify_async_function():
+    """Ensure that async functions can not be offloaded."""
+    with pytest.raises(TypeError, match='Only sync functions'):
+        asyncify(anyio.sleep, executor='thread')
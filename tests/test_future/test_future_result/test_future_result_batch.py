@@ -0,0 +1,170 @@
+from types import MappingProxyType
+
+import anyio
+import pytest
+
+from returns.future import FutureResult, InMemoryBatch, future_batch
+from returns.io import IOFailure, IOResult, IOSuccess
+from returns.iterables import Fold
+from returns.result import Result
+
+_USERS = MappingProxyType({1: 'first', 2: 'second', 3: 'third'})
+
+
+def _missing(key: int) -> str:
+    return f'missing {key}'
+
+
+async def _raise(keys: list[int]) -> Result[dict[int, str], str]:
+    raise ValueError(keys)
+
+
+@pytest.mark.anyio
+async def test_batch_collect():
+    """Ensures that keys requested together are loaded with one call."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing)(users)
+
+    collected = Fold.collect(
+        [fetch_user(2), fetch_user(1), fetch_user(2), fetch_user(4)],
+        FutureResult.from_value(()),
+    )
+
+    assert await collected == IOFailure('missing 4')
+    assert users.calls == [[2, 1, 4]]
+
+
+@pytest.mark.anyio
+async def test_batch_concurrent_tasks():
+    """Ensures that keys of tasks in the same tick share one call."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing)(users)
+    outcomes: dict[int, IOResult[str, str]] = {}
+
+    async def factory(key: int) -> None:
+        outcomes[key] = await fetch_user(key)
+
+    async with anyio.create_task_group() as task_group:
+        for user_id in _USERS:
+            task_group.start_soon(factory, user_id)
+
+    assert outcomes == {
+        1: IOSuccess('first'),
+        2: IOSuccess('second'),
+        3: IOSuccess('third'),
+    }
+    assert sorted(*users.calls) == [1, 2, 3]
+
+
+@pytest.mark.anyio
+async def test_batch_new_calls():
+    """Ensures that keys requested after a batch is sent make a new one."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing)(users)
+    first = fetch_user(1)
+
+    assert await first == IOSuccess('first')
+    assert await fetch_user(1) == IOSuccess('first')
+    assert await first == IOSuccess('first')
+    assert users.calls == [[1], [1]]
+
+
+@pytest.mark.anyio
+async def test_batch_failure():
+    """Ensures that a failed batch fails all its callers."""
+    fetch_user = future_batch(_missing)(
+        lambda keys: FutureResult.from_failure(len(keys)),
+    )
+    first = fetch_user(1)
+    second = fetch_user(2)
+
+    assert await first == IOFailure(2)
+    assert await second == IOFailure(2)
+
+
+@pytest.mark.anyio
+async def test_batch_exception():
+    """Ensures that raised exceptions are shared by all callers."""
+    fetch_user = future_batch(_missing)(
+        lambda keys: FutureResult(_raise(keys)),
+    )
+    first = fetch_user(1)
+    second = fetch_user(2)
+
+    with pytest.raises(ValueError, match=r'\[1, 2\]'):
+        await first
+    with pytest.raises(ValueError, match=r'\[1, 2\]'):
+        await second
+
+
+@pytest.mark.anyio
+async def test_batch_max_size():
+    """Ensures that batches are not bigger than ``max_size``."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing, max_size=2)(users)
+
+    collected = Fold.collect(
+        [fetch_user(1), fetch_user(1), fetch_user(2), fetch_user(3)],
+        FutureResult.from_value(()),
+    )
+
+    assert await collected == IOSuccess(('first', 'first', 'second', 'third'))
+    assert users.calls == [[1, 2], [3]]
+
+
+@pytest.mark.anyio
+async def test_batch_window():
+    """Ensures that ``window`` waits for keys from later ticks."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing, window=0.05)(users)
+    outcomes: dict[int, IOResult[str, str]] = {}
+
+    async def factory(key: int) -> None:
+        await anyio.sleep(0.01 * key)
+        outcomes[key] = await fetch_user(key)
+
+    async with anyio.create_task_group() as task_group:
+        for key in (1, 2):
+            task_group.start_soon(factory, key)
+
+    assert outcomes == {1: IOSuccess('first'), 2: IOSuccess('second')}
+    assert users.calls == [[1, 2]]
+
+
+@pytest.mark.anyio
+async def test_batch_window_full():
+    """Ensures that full batches are sent before the window is over."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing, max_size=2, window=10)(users)
+
+    async def factory(key: int) -> None:
+        await anyio.sleep(0.01 * key)
+        assert await fetch_user(key) == IOSuccess(_USERS[key])
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as task_group:
+            for key in (1, 2):
+                task_group.start_soon(factory, key)
+
+    assert sorted(*users.calls) == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_batch_cancelled():
+    """Ensures that cancelled callers do not affect other keys."""
+    users = InMemoryBatch(_USERS)
+    fetch_user = future_batch(_missing, window=0.05)(users)
+    outcomes: list[IOResult[str, str]] = []
+
+    async def factory(key: int) -> None:
+        outcomes.append(await fetch_user(key))
+
+    async with anyio.create_task_group() as task_group:
+        first = fetch_user(1)
+        task_group.start_soon(factory, 2)
+        with anyio.move_on_after(0.01):
+            await first
+
+    assert outcomes == [IOSuccess('second')]
+    assert await first == IOSuccess('first')
+    assert users.calls == [[1, 2]]
@@ -0,0 +1,201 @@
+import gc
+
+import anyio
+import pytest
+
+from returns.future import FutureResult, future_cache
+from returns.io import IOFailure, IOSuccess
+from returns.result import Failure, Result, Success
+
+
+class _Calls:
+    """Records calls and returns ``FutureResult`` after a short delay."""
+
+    def __init__(self, *, delay: float = 0) -> None:
+        self.calls: list[tuple[int, dict[str, int]]] = []
+        self._delay = delay
+
+    def __call__(self, number: int, **kwargs: int) -> FutureResult[int, int]:
+        self.calls.append((number, kwargs))
+        return FutureResult(self._compute(number))
+
+    async def _compute(self, number: int) -> Result[int, int]:
+        await anyio.sleep(self._delay)
+        if number < 0:
+            return Failure(number)
+        return Success(number)
+
+
+async def _raise(calls: list[int]) -> Result[int, int]:
+    calls.append(1)
+    raise ValueError('error')
+
+
+@pytest.mark.anyio
+async def test_future_cache_single_flight():
+    """Ensures that concurrent calls share one computation."""
+    function = _Calls(delay=0.01)
+    cached = future_cache()(function)
+    outcomes: list[object] = []
+
+    async def factory() -> None:
+        outcomes.append(await cached(1))
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(10):
+            task_group.start_soon(factory)
+
+    assert outcomes == [IOSuccess(1) for _ in range(10)]
+    assert await cached(1) == IOSuccess(1)
+    assert len(function.calls) == 1
+
+
+@pytest.mark.anyio
+async def test_future_cache_ttl():
+    """Ensures that successful values expire after ``ttl``."""
+    function = _Calls()
+    cached = future_cache(ttl=0.01)(function)
+
+    assert await cached(1) == IOSuccess(1)
+    assert await cached(1) == IOSuccess(1)
+    await anyio.sleep(0.02)
+    assert await cached(1) == IOSuccess(1)
+    assert len(function.calls) == 2
+
+
+@pytest.mark.anyio
+async def test_future_cache_failures():
+    """Ensures that failures are only shared by concurrent callers."""
+    function = _Calls(delay=0.01)
+    cached = future_cache()(function)
+
+    first = cached(-1)
+    second = cached(-1)
+
+    assert await first == IOFailure(-1)
+    assert await second == IOFailure(-1)
+    assert len(function.calls) == 1
+
+    assert await cached(-1) == IOFailure(-1)
+    assert len(function.calls) == 2
+
+
+@pytest.mark.anyio
+async def test_future_cache_failure_ttl():
+    """Ensures that failures are cached for ``failure_ttl``."""
+    function = _Calls()
+    cached = future_cache(failure_ttl=0.01)(function)
+
+    assert await cached(-1) == IOFailure(-1)
+    assert await cached(-1) == IOFailure(-1)
+    await anyio.sleep(0.02)
+    assert await cached(-1) == IOFailure(-1)
+    assert len(function.calls) == 2
+
+
+@pytest.mark.anyio
+async def test_future_cache_maxsize():
+    """Ensures that least recently used computations are evicted."""
+    function = _Calls()
+    cached = future_cache(maxsize=2)(function)
+
+    for number in (1, 2, 1, 3, 1, 2):
+        assert await cached(number) == IOSuccess(number)
+
+    assert [call[0] for call in function.calls] == [1, 2, 3, 2]
+
+
+@pytest.mark.anyio
+async def test_future_cache_unbounded():
+    """Ensures that ``maxsize=None`` stores everything."""
+    function = _Calls()
+    cached = future_cache(maxsize=None)(function)
+
+    for number in (1, 2, 3, 1, 2, 3):
+        assert await cached(number) == IOSuccess(number)
+
+    assert len(function.calls) == 3
+
+
+@pytest.mark.anyio
+async def test_future_cache_kwargs():
+    """Ensures that keyword arguments are part of the key."""
+    function = _Calls()
+    cached = future_cache()(function)
+
+    assert await cached(1, other=2) == IOSuccess(1)
+    assert await cached(1, other=2) == IOSuccess(1)
+    assert await cached(1) == IOSuccess(1)
+    assert function.calls == [(1, {'other': 2}), (1, {})]
+
+
+@pytest.mark.anyio
+async def test_future_cache_exceptions():
+    """Ensures that raised exceptions are not cached."""
+    calls: list[int] = []
+    cached = future_cache(maxsize=1)(
+        lambda number: FutureResult(_raise(calls)),
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match='error'):
+            await cached(1)
+    assert len(calls) == 2
+
+    evicted = cached(1)
+    other = cached(2)  # evicts the first computation before it is started
+    for container in (evicted, other):
+        with pytest.raises(ValueError, match='error'):
+            await container  # noqa: WPS476
+
+
+@pytest.mark.anyio
+async def test_future_cache_cancelled():
+    """Ensures that cancelled callers do not cancel the computation."""
+    function = _Calls(delay=0.05)
+    cached = future_cache()(function)
+
+    with anyio.move_on_after(0.01) as scope:
+        await cached(1)
+
+    assert scope.cancelled_caught
+    assert await cached(1) == IOSuccess(1)
+    assert len(function.calls) == 1
+
+
+@pytest.mark.anyio
+async def test_future_cache_cancelled_concurrently():
+    """Ensures that other callers are not affected by the cancelled one."""
+    function = _Calls(delay=0.05)
+    cached = future_cache()(function)
+    outcomes: list[object] = []
+
+    async def factory() -> None:
+        outcomes.append(await cached(1))
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(3):
+            task_group.start_soon(factory)
+        with anyio.move_on_after(0.02):
+            await cached(1)
+
+    assert outcomes == [IOSuccess(1) for _ in range(3)]
+    assert len(function.calls) == 1
+
+
+def test_future_cache_unhashable():
+    """Ensures that arguments must be hashable."""
+    cached = future_cache()(FutureResult.from_value)
+
+    with pytest.raises(TypeError):
+        cached([])
+
+
+@pytest.mark.filterwarnings('error')
+def test_future_cache_not_awaited():
+    """Ensures that evicted and not awaited calls do not produce warnings."""
+    cached = future_cache(maxsize=1)(FutureResult[int, int].from_value)
+
+    cached(1)
+    cached(2)
+    gc.collect()
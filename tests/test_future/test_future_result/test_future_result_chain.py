@@ -0,0 +1,53 @@
+import pytest
+
+from returns.future import Future, FutureResult, FutureSuccess
+from returns.io import IO, IOFailure, IOSuccess
+
+
+def _increment(number: int) -> int:
+    return number + 1
+
+
+def _future_increment(number: int) -> Future[int]:
+    return Future.from_value(number + 1)
+
+
+def _positive(number: int) -> FutureResult[int, int]:
+    if number > 0:
+        return FutureResult.from_value(number)
+    return FutureResult.from_failure(number)
+
+
+@pytest.mark.anyio
+async def test_long_future_chain():
+    """Ensures that long ``Future`` chains are awaited in one frame."""
+    container = Future.from_value(0)
+    for _ in range(1000):
+        container = container.map(_increment).bind(_future_increment)
+
+    assert await container == IO(2000)
+
+
+@pytest.mark.anyio
+async def test_long_future_result_chain():
+    """Ensures that long ``FutureResult`` chains are awaited in one frame."""
+    container = FutureSuccess(0)
+    for _ in range(1000):
+        container = container.map(_increment).bind(_positive)
+
+    assert await container == IOSuccess(1000)
+    assert await container.swap().alt(_increment).lash(_positive) == (
+        IOSuccess(1001)
+    )
+
+
+@pytest.mark.anyio
+async def test_shared_future_result_chain():
+    """Ensures that steps are shared between awaited containers."""
+    calls: list[int] = []
+    first = FutureSuccess(1).map(calls.append)
+    second = first.map(lambda _: -1).bind(_positive)
+
+    assert await second == IOFailure(-1)
+    assert await first == IOSuccess(None)
+    assert calls == [1]
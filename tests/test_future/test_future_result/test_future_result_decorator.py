@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from operator import truediv
+
 import anyio
 import pytest
 
@@ -61,3 +64,45 @@ async def test_future_safe_decorator_w_unexpected_error():
     """Ensure that @future_safe does not swallow non-specified exceptions."""
     with pytest.raises(AssertionError):
         await _coro_three('0')
+
+
+def _blocking(arg: int) -> float:
+    assert isinstance(arg, int)
+    return 1 / arg
+
+
+@pytest.mark.anyio
+async def test_future_safe_offload_thread():
+    """Ensure that ``offload`` runs sync functions and catches errors."""
+    offloaded = future_safe(offload='thread')(_blocking)
+
+    assert await offloaded(2) == IOSuccess(0.5)
+    assert isinstance(await offloaded(0), IOFailure)
+
+
+@pytest.mark.anyio
+async def test_future_safe_offload_process():
+    """Ensure that exceptions from worker processes are caught."""
+    offloaded = future_safe((ZeroDivisionError,), offload='process')(truediv)
+
+    assert await offloaded(1, 2) == IOSuccess(0.5)
+    assert isinstance(await offloaded(1, 0), IOFailure)
+
+
+@pytest.mark.anyio
+async def test_future_safe_offload_executor():
+    """Ensure that ``offload`` works with direct calls and executors."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offloaded = future_safe(_blocking, offload=executor)
+
+        assert await offloaded(2) == IOSuccess(0.5)
+        with pytest.raises(AssertionError):
+            await future_safe((ZeroDivisionError,), offload=executor)(
+                _blocking,
+            )('0')  # type: ignore[arg-type]
+
+
+def test_future_safe_offload_async():
+    """Ensure that async functions can not be offloaded."""
+    with pytest.raises(TypeError, match='Only sync functions'):
+        future_safe(anyio.sleep, offload='thread')
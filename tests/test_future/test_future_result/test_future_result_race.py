@@ -0,0 +1,206 @@
+import anyio
+import pytest
+
+from returns.future import (
+    Future,
+    FutureFailure,
+    FutureResult,
+    FutureSuccess,
+    first_success,
+    hedge,
+    race,
+)
+from returns.io import IOFailure, IOSuccess
+
+
+async def _delayed(number: int, delay: float, finished: list[int]) -> int:
+    await anyio.sleep(delay)
+    finished.append(number)
+    return number
+
+
+def _success(
+    number: int,
+    delay: float,
+    finished: list[int],
+) -> FutureResult[int, int]:
+    return FutureResult.from_future(Future(_delayed(number, delay, finished)))
+
+
+def _failure(
+    number: int,
+    delay: float,
+    finished: list[int],
+) -> FutureResult[int, int]:
+    return _success(number, delay, finished).bind(FutureFailure)
+
+
+async def _raise() -> int:
+    raise ValueError('unexpected')
+
+
+class _Attempts:
+    """Creates attempts with given delays and results."""
+
+    def __init__(self, *attempts: tuple[float, bool]) -> None:
+        self.attempts = attempts
+        self.started: list[int] = []
+        self.finished: list[int] = []
+
+    def __call__(self) -> FutureResult[int, int]:
+        index = len(self.started)
+        self.started.append(index)
+        delay, is_success = self.attempts[index]
+        if is_success:
+            return _success(index, delay, self.finished)
+        return _failure(index, delay, self.finished)
+
+
+@pytest.mark.anyio
+async def test_race_first_finished():
+    """Ensures that the first finished container wins."""
+    finished: list[int] = []
+
+    with anyio.fail_after(5):
+        assert await race(
+            _success(1, 10, finished),
+            _failure(2, 0, finished),
+        ) == IOFailure(2)
+    assert finished == [2]
+
+
+@pytest.mark.anyio
+async def test_race_loser_reawait():
+    """Ensures that containers that lost a race can be awaited again."""
+    finished: list[int] = []
+    loser = _success(1, 0.05, finished)
+
+    with anyio.fail_after(5):
+        assert await race(
+            loser,
+            _failure(2, 0, finished),
+        ) == IOFailure(2)
+        assert await loser == IOSuccess(1)
+        assert await race(loser) == IOSuccess(1)
+    assert finished == [2, 1]
+
+
+@pytest.mark.anyio
+async def test_first_success_loser_reawait():
+    """Ensures that containers after the first success can be awaited."""
+    finished: list[int] = []
+    loser = _success(2, 0.05, finished)
+
+    with anyio.fail_after(5):
+        assert await first_success(
+            _success(1, 0, finished),
+            loser,
+        ) == IOSuccess(1)
+        assert await loser == IOSuccess(2)
+    assert finished == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_race_resolved():
+    """Ensures that resolved containers can be raced."""
+    assert await race(FutureSuccess(1)) == IOSuccess(1)
+
+
+@pytest.mark.anyio
+async def test_race_raises():
+    """Ensures that unexpected exceptions are raised as is."""
+    finished: list[int] = []
+
+    with anyio.fail_after(5), pytest.raises(ValueError, match='unexpected'):
+        await race(
+            _success(1, 10, finished),
+            FutureResult.from_future(Future(_raise())),
+        )
+    assert not finished
+
+
+@pytest.mark.anyio
+async def test_first_success():
+    """Ensures that the first successful container wins."""
+    finished: list[int] = []
+
+    with anyio.fail_after(5):
+        assert await first_success(
+            _failure(1, 0, finished),
+            _success(2, 0.01, finished),
+            _success(3, 10, finished),
+        ) == IOSuccess(2)
+    assert finished == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_first_success_all_failures():
+    """Ensures that all failures are collected in the order of arguments."""
+    finished: list[int] = []
+
+    assert await first_success(
+        _failure(1, 0.02, finished),
+        _failure(2, 0, finished),
+    ) == IOFailure((1, 2))
+    assert finished == [2, 1]
+
+
+@pytest.mark.anyio
+async def test_hedge_slow_attempt():
+    """Ensures that a duplicate attempt is started after a delay."""
+    attempts = _Attempts((10, True), (0, True), (0, True))
+
+    with anyio.fail_after(5):
+        assert await hedge(
+            attempts,
+            after=0.01,
+            max_attempts=3,
+        ) == IOSuccess(1)
+    assert attempts.started == [0, 1]
+    assert attempts.finished == [1]
+
+
+@pytest.mark.anyio
+async def test_hedge_fast_attempt():
+    """Ensures that no duplicates are created for fast attempts."""
+    attempts = _Attempts((0, True), (0, True))
+
+    assert await hedge(attempts, after=10) == IOSuccess(0)
+    assert attempts.started == [0]
+
+
+@pytest.mark.anyio
+async def test_hedge_failed_attempt():
+    """Ensures that a failed attempt starts the next one right away."""
+    attempts = _Attempts((0, False), (0, True))
+
+    with anyio.fail_after(5):
+        assert await hedge(attempts, after=10) == IOSuccess(1)
+    assert attempts.started == [0, 1]
+
+
+@pytest.mark.anyio
+async def test_hedge_all_failed():
+    """Ensures that the failure of the last attempt is returned."""
+    attempts = _Attempts((0.02, False), (0, False))
+
+    assert await hedge(attempts, after=0.01) == IOFailure(1)
+    assert attempts.finished == [1, 0]
+
+
+@pytest.mark.anyio
+async def test_hedge_single_attempt():
+    """Ensures that ``max_attempts=1`` does not create duplicates."""
+    attempts = _Attempts((0.02, True))
+
+    assert await hedge(attempts, after=0, max_attempts=1) == IOSuccess(0)
+
+
+def test_race_requires_containers():
+    """Ensures that at least one container is required."""
+    with pytest.raises(ValueError, match='At least one'):
+        race()
+    with pytest.raises(ValueError, match='At least one'):
+        first_success()
+    with pytest.raises(ValueError, match='at least one attempt'):
+        hedge(_Attempts(), after=1, max_attempts=0)
@@ -0,0 +1,107 @@
+from collections.abc import Awaitable
+from typing import TypeVar
+
+import pytest
+
+from returns.future import Future, FutureResult, future, future_safe
+from returns.io import IO, IOFailure, IOResult, IOSuccess
+from returns.result import Failure, Success
+
+_AwaitedType = TypeVar('_AwaitedType')
+
+
+def _resolved(container: Awaitable[_AwaitedType]) -> _AwaitedType:
+    """Returns the awaited value, only if ``await`` does not suspend."""
+    try:
+        next(container.__await__())
+    except StopIteration as exc:
+        return exc.value  # type: ignore[no-any-return]
+    raise AssertionError('Awaitable has suspended')
+
+
+def _fail(number: int) -> int:
+    raise ValueError(number)
+
+
+async def _coroutine(number: int) -> int:
+    return number
+
+
+@pytest.mark.parametrize(
+    ('container', 'expected'),
+    [
+        (FutureResult.from_value(1), IOSuccess(1)),
+        (FutureResult.from_failure(1), IOFailure(1)),
+        (FutureResult.from_result(Success(1)), IOSuccess(1)),
+        (FutureResult.from_ioresult(IOFailure(1)), IOFailure(1)),
+        (FutureResult.from_value(1).map(str), IOSuccess('1')),
+        (FutureResult.from_value(1).alt(str), IOSuccess(1)),
+        (FutureResult.from_failure(1).alt(str), IOFailure('1')),
+        (
+            FutureResult.from_value(1).bind(FutureResult.from_failure),
+            IOFailure(1),
+        ),
+        (
+            FutureResult.from_failure(1).bind(FutureResult.from_value),
+            IOFailure(1),
+        ),
+        (
+            FutureResult.from_failure(1).lash(FutureResult.from_value),
+            IOSuccess(1),
+        ),
+        (
+            FutureResult.from_value(1).lash(FutureResult.from_failure),
+            IOSuccess(1),
+        ),
+        (FutureResult.from_value(1).bind_result(Failure), IOFailure(1)),
+    ],
+)
+def test_resolved_future_result(
+    container: FutureResult[object, object],
+    expected: IOResult[object, object],
+):
+    """Ensures that resolved containers are awaited at once."""
+    assert _resolved(container) == expected
+
+
+@pytest.mark.parametrize(
+    ('container', 'expected'),
+    [
+        (Future.from_value(1), IO(1)),
+        (Future.from_io(IO(1)), IO(1)),
+        (Future.from_value(1).map(str), IO('1')),
+        (Future.from_value(1).bind(Future.from_value), IO(1)),
+        (Future.from_value(1).bind_io(IO), IO(1)),
+    ],
+)
+def test_resolved_future(container: Future[object], expected: IO[object]):
+    """Ensures that resolved containers are awaited at once."""
+    assert _resolved(container) == expected
+
+
+def test_resolved_steps_are_called_at_once():
+    """Ensures that steps of resolved containers are not postponed."""
+    calls: list[int] = []
+    FutureResult.from_value(1).map(calls.append)
+    FutureResult.from_failure(2).alt(calls.append)
+
+    assert calls == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_resolved_step_raises():
+    """Ensures that exceptions are raised on ``await``, like before."""
+    container = Future.from_value(1).map(_fail).map(str)
+
+    with pytest.raises(ValueError, match='1'):
+        await container
+
+
+@pytest.mark.anyio
+async def test_resolved_bind_pending():
+    """Ensures that resolved containers can be bound to pending ones."""
+    container = Future.from_value(1).bind(future(_coroutine)).map(str)
+    failed = FutureResult.from_value(1).bind(future_safe(_coroutine))
+
+    assert await container == IO('1')
+    assert await failed == IOSuccess(1)
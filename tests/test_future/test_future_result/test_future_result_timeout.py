@@ -0,0 +1,150 @@
+import anyio
+import pytest
+
+from returns.context import RequiresContextFutureResult
+from returns.future import Deadline, Future, FutureResult
+from returns.io import IOFailure, IOSuccess
+
+
+async def _delayed(number: int, finished: list[int]) -> int:
+    await anyio.sleep(number)
+    finished.append(number)
+    return number
+
+
+def _request(number: int, finished: list[int]) -> FutureResult[int, str]:
+    return FutureResult.from_future(Future(_delayed(number, finished)))
+
+
+async def _delayed_steps(finished: list[int]) -> int:
+    await anyio.sleep(0.05)
+    finished.append(1)
+    return 1
+
+
+async def _remaining() -> float:
+    deadline = Deadline.current()
+    return -1 if deadline is None else deadline.remaining()
+
+
+def _budget(_: object) -> FutureResult[float, str]:
+    return FutureResult.from_future(Future(_remaining()))
+
+
+def _timed_out() -> str:
+    return 'timeout'
+
+
+@pytest.mark.anyio
+async def test_timeout_in_budget():
+    """Ensures that containers finished in time are not changed."""
+    finished: list[int] = []
+
+    assert await _request(0, finished).timeout(
+        10,
+        _timed_out,
+    ) == IOSuccess(0)
+    assert await FutureResult.from_failure('a').timeout(
+        10,
+        _timed_out,
+    ) == IOFailure('a')
+
+
+@pytest.mark.anyio
+async def test_timeout_stops_waiting():
+    """Ensures that we stop waiting for all pending steps on timeout."""
+    finished: list[int] = []
+    container = _request(0, finished).bind(
+        lambda number: _request(number + 10, finished),
+    )
+
+    with anyio.fail_after(5):
+        assert await container.timeout(0.01, _timed_out) == IOFailure(
+            'timeout',
+        )
+    assert finished == [0]
+
+
+@pytest.mark.anyio
+async def test_timeout_reawait():
+    """Ensures that timed out containers can be awaited again."""
+    finished: list[int] = []
+    container = _request(0, finished).bind(
+        lambda _: FutureResult.from_future(Future(_delayed_steps(finished))),
+    )
+
+    with anyio.fail_after(5):
+        assert await container.timeout(0.01, _timed_out) == IOFailure(
+            'timeout',
+        )
+        assert await container == IOSuccess(1)
+        assert await container.timeout(0.01, _timed_out) == IOSuccess(1)
+    assert finished == [0, 1]
+
+
+@pytest.mark.anyio
+async def test_timeout_deadline():
+    """Ensures that only the remaining time of a deadline is used."""
+    finished: list[int] = []
+
+    with anyio.fail_after(5):
+        assert await _request(10, finished).timeout(
+            Deadline.after(-1),
+            _timed_out,
+        ) == IOFailure('timeout')
+    assert await _request(0, finished).timeout(
+        Deadline.after(10),
+        _timed_out,
+    ) == IOSuccess(0)
+
+
+@pytest.mark.anyio
+async def test_deadline_current():
+    """Ensures that steps can check the remaining budget."""
+    assert await FutureResult.from_value(1).bind(_budget) == IOSuccess(-1)
+
+    budget = (
+        await FutureResult
+        .from_value(1)
+        .bind(_budget)
+        .timeout(
+            10,
+            _timed_out,
+        )
+    )
+    assert budget.map(lambda remaining: 0 < remaining <= 10) == IOSuccess(
+        True,  # noqa: FBT003
+    )
+
+
+@pytest.mark.anyio
+async def test_deadline_cancel_scope():
+    """Ensures that deadlines of ``anyio`` cancel scopes are respected."""
+    with anyio.move_on_after(10):
+        budget = await FutureResult.from_value(1).bind(_budget)
+    assert budget.map(lambda remaining: 0 < remaining <= 10) == IOSuccess(
+        True,  # noqa: FBT003
+    )
+
+
+def test_deadline_repr():
+    """Ensures that deadline shows the remaining time."""
+    assert repr(Deadline.after(-1)) == '<Deadline: 0.000s remaining>'
+
+
+@pytest.mark.anyio
+async def test_reader_timeout():
+    """Ensures that deadlines can be passed with dependencies."""
+    finished: list[int] = []
+
+    def factory(deadline: Deadline) -> FutureResult[int, str]:
+        return _request(10, finished).timeout(deadline, _timed_out)
+
+    container = RequiresContextFutureResult(factory)
+
+    with anyio.fail_after(5):
+        assert await container(Deadline.after(0.01)) == IOFailure('timeout')
+        assert await container.timeout(0.01, lambda: 'reader')(
+            Deadline.after(10),
+        ) == IOFailure('reader')
+    assert not finished
@@ -0,0 +1,34 @@
+import pytest
+
+from returns.io import IO, IOFailure, IOResult, IOSuccess
+from returns.primitives.exceptions import UnwrapFailedError
+from returns.result import Failure
+
+
+@pytest.mark.parametrize(
+    ('first', 'second', 'expected'),
+    [
+        (IOSuccess(1), IOSuccess(2), IOSuccess(3)),
+        (IOFailure('a'), IOSuccess(2), IOFailure('a')),
+        (IOSuccess(1), IOFailure('b'), IOFailure('b')),
+        (IOSuccess(1), Failure('b'), IOFailure('b')),
+    ],
+)
+def test_do(first: IOResult[int, str], second: IOResult[int, str], expected):
+    """Ensures that do-notation works for ``IOResult``."""
+    assert IOResult.do(one + two for one in first for two in second) == expected
+
+
+def test_io_do():
+    """Ensures that do-notation works for ``IO``."""
+    first_io, second_io = IO(1), IO(2)
+    assert IO.do(
+        first + second for first in first_io for second in second_io
+    ) == IO(3)
+
+
+def test_iterate_outside_do():
+    """Ensures that ``IOFailure`` can not be iterated outside of do."""
+    assert list(IOSuccess(1)) == [1]
+    with pytest.raises(UnwrapFailedError):
+        list(IOFailure(1))
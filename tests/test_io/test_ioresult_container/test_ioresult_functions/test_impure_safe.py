@@ -1,6 +1,7 @@
 import pytest
 
-from returns.io import IOSuccess, impure_safe
+from returns.cache import LFU, LRU
+from returns.io import IOFailure, IOSuccess, impure_safe
 
 
 @impure_safe
@@ -53,3 +54,31 @@ def test_safe_failure_with_non_expected_error():
     """Ensures that safe decorator works correctly for Failure case."""
     with pytest.raises(AssertionError):
         _function_two('0')
+
+
+def test_safe_cache():
+    """Ensures that impure_safe decorator caches produced containers."""
+    calls: list[int] = []
+    cache = LFU(skip_failures=True)
+
+    @impure_safe(exceptions=(ZeroDivisionError,), cache=cache)
+    def factory(number: int) -> float:
+        calls.append(number)
+        return 1 / number
+
+    assert factory(1) == factory(1) == IOSuccess(1.0)
+    assert isinstance(factory(0), IOFailure)
+    assert isinstance(factory(0), IOFailure)
+    assert calls == [1, 0, 0]
+
+
+def test_safe_cache_default_exceptions():
+    """Ensures that cache can be used without exception types."""
+    cache = LRU()
+
+    @impure_safe(cache=cache)
+    def factory(number: int) -> float:
+        return 1 / number
+
+    assert factory(0) is factory(0)
+    assert (cache.hits, cache.misses) == (1, 1)
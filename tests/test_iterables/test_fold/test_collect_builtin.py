@@ -0,0 +1,98 @@
+import sys
+from functools import partial
+
+import pytest
+
+from returns.context import Reader, ReaderIOResult, ReaderResult
+from returns.io import IO, IOFailure, IOSuccess
+from returns.iterables import Fold
+from returns.maybe import Nothing, Some
+from returns.result import Failure, Success
+
+
+@pytest.mark.parametrize(
+    ('iterable', 'acc', 'sequence'),
+    [
+        ([IO(2)], IO((1,)), IO((1, 2))),
+        ([Success(2)], Success([1]), Success((1, 2))),
+        ([Some(2)], Some((1,)), Some((1, 2))),
+        ([IOSuccess(2)], IOSuccess((1,)), IOSuccess((1, 2))),
+    ],
+)
+def test_collect_non_empty_acc(iterable, acc, sequence):
+    """Ensures that existing ``acc`` values are kept in front."""
+    assert Fold.collect(iterable, acc) == sequence
+    assert Fold.collect(iter(iterable), acc) == sequence
+
+
+@pytest.mark.parametrize(
+    'acc',
+    [
+        Failure('acc'),
+        Nothing,
+        IOFailure('acc'),
+    ],
+)
+@pytest.mark.parametrize('method', [Fold.collect, Fold.collect_all])
+def test_collect_failed_acc(acc, method):
+    """Ensures that failed ``acc`` is returned and iterable is consumed."""
+    iterable = iter([acc.from_value(1), acc.from_value(2)])
+    assert method(iterable, acc) is acc
+    assert not list(iterable)
+
+
+@pytest.mark.parametrize(
+    ('first', 'second'),
+    [
+        (Failure('a'), Failure('b')),
+        (IOFailure('a'), IOFailure('b')),
+    ],
+)
+def test_collect_returns_first_failure(first, second):
+    """Ensures that the first failed item is returned as is."""
+    success = first.from_value(1)
+    iterable = iter([success, first, second, success])
+    assert Fold.collect(iterable, first.from_value(())) is first
+    assert not list(iterable)
+
+
+def _tracked(calls: list[tuple[int, str]], number: int, deps: str):
+    calls.append((number, deps))
+    return Success(number)
+
+
+def test_collect_readers_call_order():
+    """Ensures that lazy containers are evaluated in order once per call."""
+    calls: list[tuple[int, str]] = []
+    collected = Fold.collect(
+        (ReaderResult(partial(_tracked, calls, number)) for number in range(3)),
+        ReaderResult.from_value(()),
+    )
+    assert not calls
+    assert collected('deps') == Success((0, 1, 2))
+    assert calls == [(0, 'deps'), (1, 'deps'), (2, 'deps')]
+
+
+def test_collect_readers_snapshot():
+    """Ensures that changes of the passed list do not change containers."""
+    containers = [ReaderResult.from_value(1)]
+    collected = Fold.collect(containers, ReaderResult.from_value(()))
+    containers.append(ReaderResult.from_value(2))
+
+    assert collected(...) == Success((1,))
+
+
+@pytest.mark.parametrize(
+    ('container_type', 'expected_type'),
+    [
+        (Reader, tuple),
+        (ReaderResult, Success),
+        (ReaderIOResult, IOSuccess),
+    ],
+)
+def test_collect_readers_recursion_limit(container_type, expected_type):
+    """Ensures that collecting lazy containers is recursion safe."""
+    limit = sys.getrecursionlimit() + 1
+    iterable = (container_type.from_value(1) for _ in range(limit))
+    collected = Fold.collect(iterable, container_type.from_value(()))
+    assert collected(...) == expected_type((1,) * limit)
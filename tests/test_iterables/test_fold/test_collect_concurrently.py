@@ -0,0 +1,231 @@
+import anyio
+import pytest
+
+from returns.context import ReaderFutureResult
+from returns.future import Future, FutureFailure, FutureResult, FutureSuccess
+from returns.io import IO, IOFailure, IOSuccess
+from returns.iterables import Fold
+
+
+async def _delayed(number: int, delay: float) -> int:
+    await anyio.sleep(delay)
+    return number
+
+
+def _delayed_success(number: int, delay: float) -> FutureResult[int, int]:
+    return FutureResult.from_future(Future(_delayed(number, delay)))
+
+
+def _delayed_failure(number: int, delay: float) -> FutureResult[int, int]:
+    return _delayed_success(number, delay).bind(FutureFailure)
+
+
+async def _never(number: int, started: list[int]) -> int:
+    started.append(number)
+    await anyio.sleep_forever()
+    raise AssertionError('Must be cancelled')
+
+
+async def _raise(number: int) -> int:
+    raise ValueError(number)
+
+
+class _Running:
+    """Counts how many coroutines are running at the same time."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, number: int) -> int:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await anyio.sleep(0.001)
+        self.running -= 1
+        return number
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_order():
+    """Ensures that values are collected in the order of the iterable."""
+    futures = [
+        Future(_delayed(number, delay))
+        for number, delay in ((1, 0.03), (2, 0.01), (3, 0.02))
+    ]
+
+    assert await Fold.collect_concurrently(
+        futures,
+        Future.from_value((0,)),
+        3,
+    ) == IO((0, 1, 2, 3))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('limit', [1, 3, 100])
+async def test_collect_concurrently_limit(limit: int):
+    """Ensures that no more than ``limit`` containers are awaited at once."""
+    counter = _Running()
+    futures = (
+        FutureResult.from_future(Future(counter(number)))
+        for number in range(20)
+    )
+
+    assert await Fold.collect_concurrently(
+        futures,
+        FutureSuccess(()),
+        limit,
+    ) == IOSuccess(tuple(range(20)))
+    assert counter.max_running <= limit
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_cancels():
+    """Ensures that containers after the failed one are cancelled."""
+    started: list[int] = []
+    futures = iter([
+        _delayed_success(1, 0),
+        _delayed_failure(2, 0.01),
+        FutureResult.from_future(Future(_never(3, started))),
+        FutureResult.from_future(Future(_never(4, started))),
+    ])
+
+    with anyio.fail_after(5):
+        collected = await Fold.collect_concurrently(
+            futures,
+            FutureSuccess(()),
+            2,
+        )
+
+    assert collected == IOFailure(2)
+    assert started == [3]
+    assert len(list(futures)) == 1
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_first_failure():
+    """Ensures that the first failure in the iterable order is returned."""
+    futures = [
+        _delayed_failure(1, 0.02),
+        _delayed_failure(2, 0),
+    ]
+
+    assert await Fold.collect_concurrently(
+        futures,
+        FutureSuccess(()),
+        2,
+    ) == IOFailure(1)
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_failed_acc():
+    """Ensures that failed ``acc`` is returned without running futures."""
+    started: list[int] = []
+    futures = [FutureResult.from_future(Future(_never(1, started)))]
+
+    assert await Fold.collect_concurrently(
+        futures,
+        FutureFailure(0),
+        1,
+    ) == IOFailure(0)
+    assert await Fold.collect_all_concurrently(
+        futures,
+        FutureFailure(0),
+        1,
+    ) == IOFailure(0)
+    assert not started
+
+
+@pytest.mark.anyio
+async def test_collect_all_concurrently():
+    """Ensures that all successful values are collected in order."""
+    futures = [
+        _delayed_success(1, 0.02),
+        _delayed_failure(2, 0),
+        _delayed_success(3, 0),
+    ]
+
+    assert await Fold.collect_all_concurrently(
+        futures,
+        FutureSuccess((0,)),
+        2,
+    ) == IOSuccess((0, 1, 3))
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_reader():
+    """Ensures that ``RequiresContextFutureResult`` can be collected."""
+    futures = [
+        ReaderFutureResult.from_value(1),
+        ReaderFutureResult.from_failure(2),
+        ReaderFutureResult(FutureSuccess),
+    ]
+    acc = ReaderFutureResult.from_value(())
+
+    assert await Fold.collect_concurrently(futures, acc, 2)(3) == IOFailure(2)
+    assert await Fold.collect_all_concurrently(
+        futures,
+        acc,
+        2,
+    )(3) == IOSuccess((1, 3))
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_raises():
+    """Ensures that unexpected exceptions are raised as is."""
+    started: list[int] = []
+    futures = [
+        Future(_never(1, started)),
+        Future(_raise(2)),
+    ]
+
+    with anyio.fail_after(5), pytest.raises(ValueError, match='2'):
+        await Fold.collect_concurrently(futures, Future.from_value(()), 2)
+
+
+def test_collect_concurrently_other_types():
+    """Ensures that other containers are collected one by one."""
+    assert Fold.collect_concurrently(  # type: ignore[type-var]
+        [IOSuccess(1)],
+        IOSuccess(()),
+        1,
+    ) == IOSuccess((1,))
+    assert Fold.collect_all_concurrently(  # type: ignore[type-var]
+        [IOSuccess(1), IOFailure(2)],
+        IOSuccess(()),
+        1,
+    ) == IOSuccess((1,))
+
+
+def test_collect_concurrently_wrong_limit():
+    """Ensures that ``limit`` must be positive."""
+    with pytest.raises(ValueError, match='must be positive'):
+        Fold.collect_concurrently([], FutureSuccess(()), 0)
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_long():
+    """Ensures that long iterables do not create deep coroutines."""
+    futures = [FutureSuccess(number) for number in range(5_000)]
+
+    assert await Fold.collect_concurrently(
+        futures,
+        FutureSuccess(()),
+        100,
+    ) == IOSuccess(tuple(range(5_000)))
+
+
+@pytest.mark.anyio
+async def test_collect_concurrently_resolved_failure():
+    """Ensures that scheduled containers are skipped after a failure."""
+    started: list[int] = []
+    futures = [
+        FutureFailure(1),
+        FutureResult.from_future(Future(_never(2, started))),
+    ]
+
+    with anyio.fail_after(5):
+        assert await Fold.collect_concurrently(
+            futures,
+            FutureSuccess(()),
+            2,
+        ) == IOFailure(1)
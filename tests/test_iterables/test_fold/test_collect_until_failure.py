@@ -0,0 +1,119 @@
+import pytest
+
+from returns.context import ReaderIOResult, ReaderResult
+from returns.future import FutureFailure, FutureSuccess
+from returns.io import IOFailure, IOSuccess
+from returns.iterables import AbstractFold, Fold
+from returns.maybe import Nothing, Some
+from returns.result import Failure, Success
+
+
+class _GenericFold(AbstractFold):
+    """Uses only the ``.apply`` based implementation."""
+
+    __slots__ = ()
+
+
+@pytest.mark.parametrize('fold', [Fold, _GenericFold])
+@pytest.mark.parametrize(
+    ('iterable', 'acc', 'expected', 'rest'),
+    [
+        (
+            [],
+            Success(()),
+            (Success(()), 0),
+            [],
+        ),
+        (
+            [Success(1), Success(2)],
+            Success(()),
+            (Success((1, 2)), 2),
+            [],
+        ),
+        (
+            [Success(2)],
+            Success((1,)),
+            (Success((1, 2)), 1),
+            [],
+        ),
+        (
+            [Success(1), Failure('a'), Success(2), Failure('b')],
+            Success(()),
+            (Failure('a'), 2),
+            [Success(2), Failure('b')],
+        ),
+        (
+            [Success(1)],
+            Failure('a'),
+            (Failure('a'), 0),
+            [Success(1)],
+        ),
+        (
+            [Some(1), Nothing, Some(2)],
+            Some(()),
+            (Nothing, 2),
+            [Some(2)],
+        ),
+        (
+            [Some(1), Some(2)],
+            Some(()),
+            (Some((1, 2)), 2),
+            [],
+        ),
+        (
+            [IOSuccess(1), IOFailure('a'), IOSuccess(2)],
+            IOSuccess(()),
+            (IOFailure('a'), 2),
+            [IOSuccess(2)],
+        ),
+        (
+            [IOSuccess(1)],
+            IOSuccess(()),
+            (IOSuccess((1,)), 1),
+            [],
+        ),
+    ],
+)
+def test_collect_until_failure(fold, iterable, acc, expected, rest):
+    """Ensures that the iterable is not consumed after the first failure."""
+    iterator = iter(iterable)
+    assert fold.collect_until_failure(iterator, acc) == expected
+    assert list(iterator) == rest
+
+
+@pytest.mark.parametrize('fold', [Fold, _GenericFold])
+@pytest.mark.parametrize(
+    ('iterable', 'acc', 'expected', 'consumed'),
+    [
+        (
+            [ReaderResult.from_failure('a'), ReaderResult.from_value(1)],
+            ReaderResult.from_value(()),
+            Failure('a'),
+            2,
+        ),
+        (
+            [ReaderIOResult.from_value(1), ReaderIOResult.from_value(2)],
+            ReaderIOResult.from_value(()),
+            IOSuccess((1, 2)),
+            2,
+        ),
+    ],
+)
+def test_collect_until_failure_lazy(fold, iterable, acc, expected, consumed):
+    """Ensures that lazy containers consume the whole iterable."""
+    iterator = iter(iterable)
+    collected, count = fold.collect_until_failure(iterator, acc)
+    assert collected(...) == expected
+    assert count == consumed
+    assert not list(iterator)
+
+
+@pytest.mark.anyio
+async def test_collect_until_failure_future_result():
+    """Ensures that ``FutureResult`` consumes the whole iterable."""
+    collected, consumed = Fold.collect_until_failure(
+        [FutureSuccess(1), FutureFailure('a'), FutureSuccess(2)],
+        FutureSuccess(()),
+    )
+    assert await collected == await FutureFailure('a')
+    assert consumed == 3
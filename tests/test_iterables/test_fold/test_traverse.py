@@ -0,0 +1,177 @@
+import pytest
+
+from returns.context import ReaderResult
+from returns.future import FutureFailure, FutureResult, FutureSuccess
+from returns.io import IO, IOFailure, IOResult, IOSuccess
+from returns.iterables import AbstractFold, Fold
+from returns.maybe import Maybe, Nothing, Some
+from returns.result import Failure, Result, Success
+
+
+class _GenericFold(AbstractFold):
+    """Uses only the ``.apply`` based implementation."""
+
+    __slots__ = ()
+
+    @classmethod
+    def _loop(cls, iterable, acc, function, concat):
+        return Fold._loop(iterable, acc, function, concat)  # noqa: SLF001
+
+
+def _positive(number: int) -> Result[int, int]:
+    return Success(number) if number > 0 else Failure(number)
+
+
+def _io_positive(number: int) -> IOResult[int, int]:
+    return IOResult.from_result(_positive(number))
+
+
+def _reader_positive(number: int) -> ReaderResult[int, int, object]:
+    return ReaderResult.from_result(_positive(number))
+
+
+def _future_positive(number: int) -> FutureResult[int, int]:
+    return FutureResult.from_result(_positive(number))
+
+
+@pytest.mark.parametrize('fold', [Fold, _GenericFold])
+@pytest.mark.parametrize(
+    ('iterable', 'function', 'acc', 'expected', 'rest'),
+    [
+        ([1, 2], _positive, Success(()), Success((1, 2)), []),
+        (
+            [1, -2, 3, -4],
+            _positive,
+            Success(()),
+            Failure(-2),
+            [3, -4],
+        ),
+        ([1], _positive, Failure(0), Failure(0), [1]),
+        ([1, 2], Some, Some(()), Some((1, 2)), []),
+        ([1, None, 3], Maybe.from_optional, Some(()), Nothing, [3]),
+        ([1, 2], IO, IO(()), IO((1, 2)), []),
+        ([1, 2], _io_positive, IOSuccess(()), IOSuccess((1, 2)), []),
+        (
+            [1, -2, 3],
+            _io_positive,
+            IOSuccess(()),
+            IOFailure(-2),
+            [3],
+        ),
+    ],
+)
+def test_traverse(  # noqa: WPS211
+    fold,
+    iterable,
+    function,
+    acc,
+    expected,
+    rest,
+):
+    """Ensures that ``function`` is not called after the first failure."""
+    iterator = iter(iterable)
+    assert fold.traverse(iterator, function, acc) == expected
+    assert list(iterator) == rest
+
+
+@pytest.mark.parametrize('fold', [Fold, _GenericFold])
+@pytest.mark.parametrize(
+    ('iterable', 'function', 'acc', 'expected'),
+    [
+        (
+            [1, -2, 3],
+            _positive,
+            Success(()),
+            Success((1, 3)),
+        ),
+        ([1], _positive, Failure(0), Failure(0)),
+        (
+            [1, None, 3],
+            Maybe.from_optional,
+            Some(()),
+            Some((1, 3)),
+        ),
+        ([-1, 2], _io_positive, IOSuccess(()), IOSuccess((2,))),
+    ],
+)
+def test_traverse_all(fold, iterable, function, acc, expected):
+    """Ensures that failed containers are skipped."""
+    assert fold.traverse_all(iterable, function, acc) == expected
+
+
+@pytest.mark.parametrize('fold', [Fold, _GenericFold])
+@pytest.mark.parametrize(
+    ('iterable', 'expected', 'expected_all'),
+    [
+        ([1, 2], Success((1, 2)), Success((1, 2))),
+        (
+            [1, -2, 3],
+            Failure(-2),
+            Success((1, 3)),
+        ),
+    ],
+)
+def test_traverse_reader(fold, iterable, expected, expected_all):
+    """Ensures that lazy containers can be traversed."""
+    acc = ReaderResult.from_value(())
+    traversed = fold.traverse(iterable, _reader_positive, acc)
+    traversed_all = fold.traverse_all(iterable, _reader_positive, acc)
+    assert traversed(...) == expected
+    assert traversed_all(...) == expected_all
+
+
+@pytest.mark.parametrize('method', [Fold.traverse, Fold.traverse_all])
+def test_traverse_reader_once(method):
+    """Ensures that lazy containers map items only once."""
+    calls: list[int] = []
+
+    def factory(number: int) -> ReaderResult[int, int, object]:
+        calls.append(number)
+        return _reader_positive(number)
+
+    traversed = method([1, 2], factory, ReaderResult.from_value(()))
+
+    assert calls == [1, 2]
+    assert traversed(...) == Success((1, 2))
+    assert traversed(...) == Success((1, 2))
+    assert calls == [1, 2]
+
+
+def test_traverse_reader_snapshot():
+    """Ensures that changes of the passed list do not change containers."""
+    numbers = [1, 2]
+    traversed = Fold.traverse(
+        numbers,
+        _reader_positive,
+        ReaderResult.from_value(()),
+    )
+    numbers.append(3)
+
+    assert traversed(...) == Success((1, 2))
+
+
+def test_traverse_reader_iterator():
+    """Ensures that one-shot iterators can be used many times."""
+    traversed = Fold.traverse(
+        iter([1, 2]),
+        _reader_positive,
+        ReaderResult.from_value(()),
+    )
+
+    assert traversed(...) == Success((1, 2))
+    assert traversed(...) == Success((1, 2))
+
+
+@pytest.mark.anyio
+async def test_traverse_future_result():
+    """Ensures that ``FutureResult`` can be traversed."""
+    assert await Fold.traverse(
+        [1, -2, 3],
+        _future_positive,
+        FutureSuccess(()),
+    ) == await FutureFailure(-2)
+    assert await Fold.traverse_all(
+        [1, -2, 3],
+        _future_positive,
+        FutureSuccess(()),
+    ) == await FutureSuccess((1, 3))
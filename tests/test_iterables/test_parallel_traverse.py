@@ -0,0 +1,189 @@
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+
+from returns.iterables import Fold, parallel_traverse
+from returns.result import Success
+
+
+def _inverse(number: int) -> float:
+    return 1 / number
+
+
+class _BrokenExecutor(Executor):
+    """Executor that loses all submitted chunks."""
+
+    def submit(
+        self,
+        function: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        future.set_exception(RuntimeError('broken'))
+        return future
+
+
+class _CrashedExecutor(Executor):
+    """Executor that does not accept chunks after its workers crashed."""
+
+    def submit(
+        self,
+        function: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future[Any]:
+        raise BrokenProcessPool('crashed')
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 10])
+def test_parallel_traverse_threads(chunksize: int):
+    """Ensures that each item gets its own ``Result`` in order."""
+    outcomes = list(
+        parallel_traverse(
+            _inverse,
+            [1, 0, 2, 4, 0],
+            executor='thread',
+            chunksize=chunksize,
+        )
+    )
+
+    assert outcomes[0] == Success(1.0)
+    assert outcomes[2:4] == [Success(0.5), Success(0.25)]
+    assert isinstance(outcomes[1].failure(), ZeroDivisionError)
+    assert isinstance(outcomes[4].failure(), ZeroDivisionError)
+
+
+def test_parallel_traverse_processes():
+    """Ensures that worker processes are used by default."""
+    outcomes = parallel_traverse(abs, range(-5, 0), chunksize=2)
+    collected = Fold.collect(outcomes, Success(()))
+
+    assert collected == Success((5, 4, 3, 2, 1))
+
+
+@pytest.mark.parametrize('buffersize', [None, 1, 3])
+def test_parallel_traverse_unordered(buffersize: int | None):
+    """Ensures that unordered outcomes contain all items."""
+    outcomes = parallel_traverse(
+        abs,
+        range(-10, 0),
+        executor='thread',
+        ordered=False,
+        buffersize=buffersize,
+    )
+
+    assert sorted(outcome.unwrap() for outcome in outcomes) == list(
+        range(1, 11),
+    )
+
+
+def test_parallel_traverse_executor():
+    """Ensures that passed executors are used and not shut down."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        outcomes = parallel_traverse(abs, [-1, -2], executor=executor)
+
+        assert list(outcomes) == [Success(1), Success(2)]
+        assert executor.submit(abs, -3).result() == 3
+
+
+def test_parallel_traverse_lazy():
+    """Ensures that ``buffersize`` limits consumed items."""
+    consumed: list[int] = []
+
+    def factory() -> Iterator[int]:
+        for number in range(100):
+            consumed.append(number)
+            yield number
+
+    outcomes = parallel_traverse(
+        abs,
+        factory(),
+        executor='thread',
+        buffersize=2,
+    )
+
+    assert next(outcomes) == Success(0)
+    assert len(consumed) == 2
+    outcomes.close()
+
+
+def test_parallel_traverse_cancel():
+    """Ensures that pending chunks are cancelled when we stop early."""
+    calls: list[int] = []
+    event = threading.Event()
+
+    def factory(number: int) -> int:
+        calls.append(number)
+        event.wait(1)
+        return number
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        outcomes = parallel_traverse(factory, range(10), executor=executor)
+        event.set()
+        assert next(outcomes) == Success(0)
+        outcomes.close()
+
+    assert len(calls) < 10
+
+
+def test_parallel_traverse_broken():
+    """Ensures that lost chunks become failures of all their items."""
+    outcomes = list(
+        parallel_traverse(
+            abs,
+            range(3),
+            executor=_BrokenExecutor(),
+            chunksize=2,
+        )
+    )
+
+    assert len(outcomes) == 3
+    assert all(
+        isinstance(outcome.failure(), RuntimeError) for outcome in outcomes
+    )
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_parallel_traverse_crashed(ordered: bool):  # noqa: FBT001
+    """Ensures that chunks rejected by a broken pool become failures."""
+    outcomes = list(
+        parallel_traverse(
+            abs,
+            range(3),
+            executor=_CrashedExecutor(),
+            chunksize=2,
+            ordered=ordered,
+        ),
+    )
+
+    assert len(outcomes) == 3
+    assert all(
+        isinstance(outcome.failure(), BrokenProcessPool) for outcome in outcomes
+    )
+
+
+def test_parallel_traverse_empty():
+    """Ensures that empty iterables do not start anything."""
+    assert not list(parallel_traverse(abs, [], executor=_BrokenExecutor()))
+
+
+@pytest.mark.parametrize(
+    ('chunksize', 'buffersize'),
+    [(0, None), (1, 0)],
+)
+def test_parallel_traverse_wrong_sizes(chunksize: int, buffersize: int | None):
+    """Ensures that sizes must be positive."""
+    with pytest.raises(ValueError, match='must be positive'):
+        parallel_traverse(
+            abs,
+            [],
+            chunksize=chunksize,
+            buffersize=buffersize,
+        )
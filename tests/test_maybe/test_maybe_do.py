@@ -0,0 +1,36 @@
+import pytest
+
+from returns.maybe import Maybe, Nothing, Some
+from returns.primitives.exceptions import UnwrapFailedError
+
+
+@pytest.mark.parametrize(
+    ('first', 'second', 'expected'),
+    [
+        (Some(1), Some(2), Some(3)),
+        (Nothing, Some(2), Nothing),
+        (Some(1), Nothing, Nothing),
+    ],
+)
+def test_do(first: Maybe[int], second: Maybe[int], expected):
+    """Ensures that do-notation works for ``Maybe``."""
+    assert Maybe.do(one + two for one in first for two in second) == expected
+
+
+def test_do_nested_iterables():
+    """Ensures that ``Nothing`` halts the whole expression."""
+    assert (
+        Maybe.do(
+            number
+            for container in (Nothing, Some(2))  # type: ignore[misc]
+            for number in container
+        )
+        == Nothing
+    )
+
+
+def test_iterate_outside_do():
+    """Ensures that ``Nothing`` can not be iterated outside of do."""
+    assert list(Some(1)) == [1]
+    with pytest.raises(UnwrapFailedError):
+        list(Nothing)
@@ -0,0 +1,125 @@
+from functools import partial
+from operator import add
+
+import pytest
+
+from returns.context import RequiresContext
+from returns.future import Future
+from returns.io import IO, IOFailure, IOSuccess
+from returns.maybe import Maybe, Nothing, Some
+from returns.pipeline import compile_pipe, pipe
+from returns.pointfree import bind, map_
+from returns.result import Failure, Result, Success
+
+
+def _double(number: int) -> int:
+    return number * 2
+
+
+def _positive(number: int) -> Result[int, int]:
+    return Success(number) if number > 0 else Failure(number)
+
+
+def _io_positive(number: int) -> IOSuccess[int] | IOFailure[int]:
+    return IOSuccess(number) if number > 0 else IOFailure(number)
+
+
+def _some_positive(number: int) -> Maybe[int]:
+    return Some(number) if number > 0 else Nothing
+
+
+def _io_value(number: int) -> IO[int]:
+    return IO(number)
+
+
+def _swap(container: Result[int, int]) -> Result[int, int]:
+    return container.swap()
+
+
+def _tracked(calls: list[int], number: int) -> int:
+    calls.append(number)
+    return number
+
+
+def _reader_add(number: int) -> RequiresContext[int, int]:
+    return RequiresContext(partial(add, number))
+
+
+@pytest.mark.parametrize(
+    ('functions', 'instance'),
+    [
+        ((str, int, _double), 1),
+        ((map_(_double), map_(str)), Success(1)),
+        ((map_(_double), map_(str)), Failure(1)),
+        ((map_(_double), map_(_double), map_(str)), Some(1)),
+        ((bind(_positive), map_(_double), bind(_positive)), Success(1)),
+        (
+            (bind(_positive), map_(_double), bind(_positive)),
+            Success(-1),
+        ),
+        ((map_(_double), bind(_positive), str), Success(-1)),
+        ((bind(_some_positive), map_(_double)), Some(1)),
+        ((bind(_some_positive), map_(_double)), Some(-1)),
+        ((map_(_double), bind(_some_positive)), Nothing),
+        ((bind(_io_positive), map_(_double)), IOSuccess(1)),
+        ((bind(_io_positive), map_(_double)), IOSuccess(-1)),
+        ((map_(_double), bind(_io_value), map_(str)), IO(1)),
+        ((bind(_positive), _swap, map_(_double)), Success(-1)),
+        ((bind(_positive), map_(str)), Some(1)),
+        ((bind(_some_positive), bind(_positive)), Some(1)),
+    ],
+)
+def test_compile_pipe(functions, instance):
+    """Ensures that compiled pipelines work exactly like ``pipe``."""
+    assert compile_pipe(*functions)(instance) == pipe(*functions)(instance)
+
+
+def test_compile_pipe_skips_after_failure():
+    """Ensures that steps are skipped after the first failure."""
+    calls: list[int] = []
+
+    pipeline = compile_pipe(
+        bind(_positive),
+        map_(partial(_tracked, calls)),
+        bind(_positive),
+    )
+
+    assert pipeline(Success(-1)) == Failure(-1)
+    assert not calls
+
+
+def test_compile_pipe_reader():
+    """Ensures that other containers use their methods."""
+    pipeline = compile_pipe(
+        map_(_double),
+        bind(_reader_add),
+        map_(str),
+    )
+
+    assert pipeline(RequiresContext.from_value(1))(2) == '4'
+
+
+@pytest.mark.anyio
+async def test_compile_pipe_future():
+    """Ensures that ``Future`` steps are composed lazily."""
+    pipeline = compile_pipe(
+        bind(Future.from_value),
+        map_(_double),
+    )
+
+    assert await pipeline(Future.from_value(1)) == IO(2)
+
+
+def test_compile_pipe_reusable():
+    """Ensures that compiled pipelines can be called many times."""
+    pipeline = compile_pipe(bind(_positive), map_(_double))
+
+    assert pipeline(Success(1)) == Success(2)
+    assert pipeline(Success(-1)) == Failure(-1)
+    assert pipeline(Success(2)) == Success(4)
+
+
+def test_compile_pipe_not_callable():
+    """Ensures that all steps are checked on compilation."""
+    with pytest.raises(TypeError, match='must be callable'):
+        compile_pipe(str, 1)  # type: ignore[operator]
@@ -0,0 +1,134 @@
+from functools import partial
+
+import anyio
+import pytest
+
+from returns.primitives.reawaitable import ReAwaitable
+
+
+class _Counter:
+    """Counts calls of each step."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def __call__(self, step: int, number: int) -> int:
+        self.calls.append(step)
+        return number + 1
+
+
+async def _delayed(number: int, delay: float = 0) -> int:
+    await anyio.sleep(delay)
+    return number
+
+
+async def _started(event: anyio.Event, number: int) -> int:
+    event.set()
+    return await _delayed(number, delay=0.01)
+
+
+def _fail(number: int) -> int:
+    raise ValueError(number)
+
+
+async def _await_into(awaited: list[int], instance: ReAwaitable[int]) -> None:
+    awaited.append(await instance)
+
+
+@pytest.mark.anyio
+async def test_long_chain():
+    """Ensures that long chains do not hit the recursion limit."""
+    instance = ReAwaitable(_delayed(0))
+    for _ in range(5000):
+        instance = instance.map(abs).bind(_delayed)
+
+    assert await instance == 0
+
+
+@pytest.mark.anyio
+async def test_intermediate_steps_once():
+    """Ensures that each step is called once, even when shared."""
+    counter = _Counter()
+    first = ReAwaitable(_delayed(0)).map(partial(counter, 1))
+    second = first.map(partial(counter, 2))
+    third = second.map(partial(counter, 3))
+    branch = second.map(partial(counter, 4))
+
+    assert await third == 3
+    assert await first == 1
+    assert await branch == 3
+    assert await second == 2
+    assert counter.calls == [1, 2, 3, 4]
+
+
+@pytest.mark.anyio
+async def test_concurrent_chains():
+    """Ensures that concurrent awaiters share running steps."""
+    counter = _Counter()
+    first = ReAwaitable(
+        _delayed(0, delay=0.01),
+    ).map(partial(counter, 1))
+    second = first.map(partial(counter, 2))
+    awaited: list[int] = []
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_await_into, awaited, second)
+        tg.start_soon(_await_into, awaited, first)
+        tg.start_soon(_await_into, awaited, second)
+
+    assert sorted(awaited) == [1, 2, 2]
+    assert counter.calls == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_failed_step():
+    """Ensures that exceptions are shared with all following steps."""
+    first = ReAwaitable(_delayed(1))
+    second = first.map(_fail)
+    third = second.map(abs)
+
+    with pytest.raises(ValueError, match='1'):
+        await third
+    with pytest.raises(ValueError, match='1'):
+        await second
+    assert await first == 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_while_waiting():
+    """Ensures that steps, which were not started, can be awaited later."""
+    counter = _Counter()
+    started = anyio.Event()
+    first = ReAwaitable(_started(started, 0))
+    second = first.map(partial(counter, 1))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_await_into, [], first)
+        await started.wait()
+        with anyio.move_on_after(0):
+            await second
+
+    assert await second == 1
+    assert counter.calls == [1]
+
+
+@pytest.mark.anyio
+async def test_cancelled_step():
+    """Ensures that started steps are cancelled for other awaiters."""
+    first = ReAwaitable(_delayed(0)).bind(partial(_delayed, delay=1))
+    second = first.map(abs)
+
+    with anyio.move_on_after(0.01):
+        await second
+
+    with pytest.raises(RuntimeError, match='cancelled'):
+        await second
+    with pytest.raises(RuntimeError, match='cancelled'):
+        await first
+
+
+def test_chain_repr():
+    """Ensures that pending steps are shown in ``repr``."""
+    assert repr(ReAwaitable(_delayed(0)).map(abs)) == (
+        '<ReAwaitable: pending <built-in function abs>>'
+    )
@@ -0,0 +1,159 @@
+import anyio
+import pytest
+
+from returns.primitives.reawaitable import ReAwaitable
+
+
+class _Computation:
+    """Counts how many times the computation was actually started."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = anyio.Event()
+
+    async def __call__(self, delay: float = 0.01) -> int:
+        self.calls += 1
+        self.started.set()
+        await anyio.sleep(delay)
+        return self.calls
+
+
+async def _fail() -> int:
+    await anyio.sleep(0.01)
+    raise ValueError('failed')
+
+
+async def _await_into(awaited: list[int], instance: ReAwaitable) -> None:
+    awaited.append(await instance)
+
+
+async def _fan_out(instance: ReAwaitable) -> None:
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_await_into, [], instance)
+        tg.start_soon(_await_into, [], instance)
+
+
+async def _traceback_length(instance: ReAwaitable) -> int:
+    with pytest.raises(ValueError, match='failed') as exc_info:
+        await instance
+    return len(exc_info.traceback)  # noqa: WPS441
+
+
+@pytest.mark.anyio
+async def test_concurrent_awaiters():
+    """Ensures that concurrent awaiters share a single computation."""
+    computation = _Computation()
+    instance = ReAwaitable(computation())
+    awaited: list[int] = []
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(_await_into, awaited, instance)
+
+    assert awaited == [1, 1, 1, 1, 1]
+    assert await instance == 1
+    assert computation.calls == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_exception():
+    """Ensures that all awaiters get the same exception."""
+    instance = ReAwaitable(_fail())
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await _fan_out(instance)
+
+    assert len(exc_info.value.exceptions) == 2
+    with pytest.raises(ValueError, match='failed'):
+        await instance
+
+
+@pytest.mark.anyio
+async def test_waiter_cancelled():
+    """Ensures that cancelled waiters do not affect the computation."""
+    computation = _Computation()
+    instance = ReAwaitable(computation())
+    awaited: list[int] = []
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_await_into, awaited, instance)
+        await computation.started.wait()
+        with anyio.move_on_after(0):
+            await instance
+
+    assert awaited == [1]
+    assert await instance == 1
+
+
+@pytest.mark.anyio
+async def test_runner_cancelled():
+    """Ensures that other awaiters fail when the runner is cancelled."""
+    instance = ReAwaitable(_Computation()(delay=1))
+
+    with anyio.move_on_after(0.01) as scope:
+        await instance
+
+    assert scope.cancelled_caught
+    with pytest.raises(RuntimeError, match='cancelled'):
+        await instance
+
+
+@pytest.mark.anyio
+async def test_coroutine_released():
+    """Ensures that the coroutine is not kept after it is finished."""
+    instance = ReAwaitable(_Computation()())
+
+    assert await instance == 1
+    assert repr(instance) == '<ReAwaitable: 1>'
+
+
+@pytest.mark.anyio
+async def test_exception_repr():
+    """Ensures that raised exceptions are shown in ``repr``."""
+    instance = ReAwaitable(_fail())
+
+    with pytest.raises(ValueError, match='failed'):
+        await instance
+    assert repr(instance) == "<ReAwaitable: ValueError('failed')>"
+
+
+@pytest.mark.anyio
+async def test_shared_runner_cancelled():
+    """Ensures that shared computations survive cancelled awaiters."""
+    computation = _Computation()
+    instance = ReAwaitable(computation(delay=0.05), shared=True)
+    awaited: list[int] = []
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_await_into, awaited, instance)
+        with anyio.move_on_after(0.01) as scope:
+            await instance
+        tg.start_soon(_await_into, awaited, instance)
+
+    assert scope.cancelled_caught
+    assert awaited == [1, 1]
+    assert computation.calls == 1
+
+
+@pytest.mark.anyio
+async def test_shared_parent_not_run_inline():
+    """Ensures that steps await shared parents in their own task."""
+    computation = _Computation()
+    parent = ReAwaitable(computation(delay=0.05), shared=True)
+    child = parent.map(abs)
+
+    with anyio.move_on_after(0.01):
+        await child
+
+    assert await child == 1
+    assert await parent == 1
+    assert computation.calls == 1
+
+
+@pytest.mark.anyio
+async def test_exception_traceback():
+    """Ensures that tracebacks do not grow with each ``await``."""
+    instance = ReAwaitable(_fail())
+    tracebacks = [await _traceback_length(instance) for _ in range(3)]
+
+    assert tracebacks[0] == tracebacks[1] == tracebacks[2]
@@ -0,0 +1,187 @@
+from inspect import FrameInfo
+from threading import Thread
+
+import anyio
+import pytest
+
+from returns.io import IOFailure, IOResult
+from returns.primitives.tracing import TraceLine, collect_traces
+from returns.result import Failure, Result
+
+
+def _failure(number: int) -> Result[int, int]:
+    return Failure(number)
+
+
+def _nested_failure(depth: int) -> Result[int, int]:
+    if depth:
+        return _nested_failure(depth - 1)
+    return Failure(depth)
+
+
+async def _traced_task(
+    failures: dict[str, Result[int, int]],
+    event: anyio.Event,
+) -> None:
+    with collect_traces():
+        await event.wait()
+        failures['traced'] = _failure(1)
+
+
+async def _other_task(
+    failures: dict[str, Result[int, int]],
+    event: anyio.Event,
+) -> None:
+    await anyio.sleep(0)
+    failures['other'] = _failure(1)
+    event.set()
+
+
+def test_collect_traces_full():
+    """Ensures that full traces contain frames starting from the caller."""
+    with collect_traces():
+        failure = _failure(1)
+
+    assert isinstance(failure.trace, list)
+    assert isinstance(failure.trace[0], FrameInfo)
+    assert failure.trace[0].function == '_failure'
+    assert failure.trace[0].code_context == ['    return Failure(number)\n']
+    assert failure.trace[1].function == test_collect_traces_full.__name__
+
+
+def test_collect_traces_lightweight():
+    """Ensures that lightweight traces do not keep frames."""
+    with collect_traces(lightweight=True):
+        failure = _failure(1)
+
+    assert isinstance(failure.trace, list)
+    first_line = failure.trace[0]
+    assert isinstance(first_line, TraceLine)
+    assert first_line.function == '_failure'
+    assert first_line.filename == __file__
+    assert first_line.code_context == ['    return Failure(number)\n']
+    assert failure.trace[1].function == test_collect_traces_lightweight.__name__
+
+
+def test_trace_line_without_source():
+    """Ensures that missing source lines are reported as ``None``."""
+    assert TraceLine('<missing>', 1, 'function').code_context is None
+
+
+@pytest.mark.parametrize('lightweight', [True, False])
+def test_collect_traces_depth(lightweight: bool):  # noqa: FBT001
+    """Ensures that ``depth`` limits the number of frames."""
+    with collect_traces(lightweight=lightweight, depth=3):
+        failure = _nested_failure(5)
+
+    assert failure.trace is not None
+    assert [trace_line.function for trace_line in failure.trace] == [
+        '_nested_failure',
+        '_nested_failure',
+        '_nested_failure',
+    ]
+
+
+@pytest.mark.parametrize('lightweight', [True, False])
+def test_collect_traces_sample_rate(lightweight: bool):  # noqa: FBT001
+    """Ensures that only every ``sample_rate``-th failure is traced."""
+    with collect_traces(lightweight=lightweight, sample_rate=3):
+        failures = [_failure(number) for number in range(9)]
+
+    traced = [index for index, failure in enumerate(failures) if failure.trace]
+    first = traced[0]
+    assert traced == [first, first + 3, first + 6]
+
+
+def test_collect_traces_sample_rate_scopes():
+    """Ensures that scopes with the same options share sampling."""
+    failures: list[Result[int, int]] = []
+    for number in range(4):
+        with collect_traces(depth=1, sample_rate=4):
+            failures.append(_failure(number))
+
+    assert sum(failure.trace is not None for failure in failures) == 1
+
+
+@pytest.mark.anyio
+async def test_collect_traces_sample_rate_tasks():
+    """Ensures that concurrent tasks share sampling."""
+    failures: list[Result[int, int]] = []
+
+    async def factory(number: int) -> None:
+        with collect_traces(depth=2, sample_rate=4):
+            await anyio.sleep(0)
+            failures.append(_failure(number))
+
+    async with anyio.create_task_group() as tg:
+        for number in range(8):
+            tg.start_soon(factory, number)
+
+    assert sum(failure.trace is not None for failure in failures) == 2
+
+
+@pytest.mark.parametrize('sample_rate', [0, -1])
+def test_collect_traces_wrong_sample_rate(sample_rate: int):
+    """Ensures that ``sample_rate`` must be positive."""
+    with pytest.raises(ValueError, match='must be positive'):
+        collect_traces(sample_rate=sample_rate)
+
+
+def test_collect_traces_wrong_depth():
+    """Ensures that ``depth`` must not be negative."""
+    with pytest.raises(ValueError, match='must not be negative'):
+        collect_traces(depth=-1)
+
+
+def test_collect_traces_ioresult():
+    """Ensures that lightweight traces work for ``IOResult``."""
+    with collect_traces(lightweight=True, depth=2):
+        failure: IOResult[int, int] = IOFailure(1)
+
+    assert failure.trace is not None
+    assert [trace_line.function for trace_line in failure.trace] == [
+        '__init__',
+        test_collect_traces_ioresult.__name__,
+    ]
+    assert IOFailure(1).trace is None
+
+
+def test_collect_traces_nested():
+    """Ensures that nested contexts restore outer settings."""
+    with collect_traces(lightweight=True):
+        with collect_traces():
+            inner = _failure(1)
+        outer = _failure(1)
+    after = _failure(1)
+
+    assert inner.trace is not None
+    assert isinstance(inner.trace[0], FrameInfo)
+    assert outer.trace is not None
+    assert isinstance(outer.trace[0], TraceLine)
+    assert after.trace is None
+
+
+def test_collect_traces_other_thread():
+    """Ensures that other threads are not traced."""
+    failures: list[Result[int, int]] = []
+
+    with collect_traces():
+        thread = Thread(target=lambda: failures.append(_failure(1)))
+        thread.start()
+        thread.join()
+
+    assert failures[0].trace is None
+
+
+@pytest.mark.anyio
+async def test_collect_traces_other_task():
+    """Ensures that tracing in one task does not affect other tasks."""
+    failures: dict[str, Result[int, int]] = {}
+    event = anyio.Event()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_traced_task, failures, event)
+        tg.start_soon(_other_task, failures, event)
+
+    assert failures['traced'].trace is not None
+    assert failures['other'].trace is None
@@ -0,0 +1,105 @@
+import pytest
+
+from returns.primitives.exceptions import UnwrapFailedError
+from returns.result import Failure, Result, Success
+
+
+def _unexpected_unwrap(container):
+    pytest.fail('Failed containers must not be unwrapped in do-notation')
+
+
+def test_do_success():
+    """Ensures that do-notation works for successful containers."""
+    assert Result.do(
+        first + second for first in Success(1) for second in Success(2)
+    ) == Success(3)
+
+
+@pytest.mark.parametrize(
+    ('first', 'second'),
+    [
+        (Failure('a'), Success(2)),
+        (Success(1), Failure('b')),
+        (Failure('a'), Failure('b')),
+    ],
+)
+def test_do_failure_without_unwrap(
+    monkeypatch, first: Result[int, str], second: Result[int, str]
+):
+    """Ensures that failed containers halt do-notation without unwrapping."""
+    monkeypatch.setattr(Failure, 'unwrap', _unexpected_unwrap)
+    expected = first if isinstance(first, Failure) else second
+
+    assert Result.do(one + two for one in first for two in second) is expected
+
+
+def test_do_failure_skips_expression():
+    """Ensures that nothing is evaluated after the failed container."""
+    calls: list[int] = []
+
+    assert Result.do(
+        calls.append(first)  # type: ignore[func-returns-value]
+        for first in Failure(1)
+    ) == Failure(1)
+    assert not calls
+
+
+def test_do_unwrap_inside_expression():
+    """Ensures that ``.unwrap()`` inside expression still halts it."""
+    assert Result.do(
+        first + Failure(2).unwrap() for first in Success(1)
+    ) == Failure(2)
+
+
+def test_do_nested_iterables():
+    """Ensures that failed containers halt the whole expression."""
+    assert Result.do(
+        number
+        for container in (Failure('e'), Success(2))  # type: ignore[misc]
+        for number in container
+    ) == Failure('e')
+
+
+def test_do_nested():
+    """Ensures that nested do-notation halts only the inner expression."""
+    assert Result.do(
+        Result.do(second for second in Failure(first)) for first in Success(1)
+    ) == Success(Failure(1))
+
+
+def _first_or_none(container: Result[int, str]) -> int | None:
+    try:
+        return next(iter(container))
+    except UnwrapFailedError:
+        return None
+
+
+def test_do_nested_generator():
+    """Ensures that nested generators are not halted by the expression."""
+    assert Result.do(
+        first + sum(second for second in Failure(2)) for first in Success(1)
+    ) == Failure(2)
+
+
+def test_do_nested_iteration():
+    """Ensures that code inside expression unwraps failed containers."""
+    assert Result.do(
+        (first, _first_or_none(Failure('a'))) for first in Success(1)
+    ) == Success((1, None))
+
+
+def test_do_without_values():
+    """Ensures that empty expressions raise ``StopIteration`` as before."""
+    with pytest.raises(StopIteration):
+        Result.do(
+            first
+            for first in Success(1)  # type: ignore[misc]
+            if first > 1
+        )
+
+
+def test_iterate_outside_do():
+    """Ensures that failed containers can not be iterated outside of do."""
+    assert list(Success(1)) == [1]
+    with pytest.raises(UnwrapFailedError):
+        list(Failure(1))
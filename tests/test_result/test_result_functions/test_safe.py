@@ -1,5 +1,6 @@
 import pytest
 
+from returns.cache import LRU
 from returns.result import Success, safe
 
 
@@ -44,3 +45,31 @@ def test_safe_failure_with_non_expected_error():
     """Ensures that safe decorator works correctly for Failure case."""
     with pytest.raises(AssertionError):
         _function_two('0')
+
+
+def test_safe_cache():
+    """Ensures that safe decorator caches produced containers."""
+    calls: list[int] = []
+    cache = LRU()
+
+    @safe(cache=cache)
+    def factory(number: int) -> float:
+        calls.append(number)
+        return 1 / number
+
+    assert factory(1) == factory(1) == Success(1.0)
+    assert factory(0).failure() is factory(0).failure()
+    assert calls == [1, 0]
+
+
+def test_safe_cache_exceptions():
+    """Ensures that cache can be used with explicit exception types."""
+    cache = LRU(skip_failures=True)
+
+    @safe((ZeroDivisionError,), cache=cache)
+    def factory(number: int) -> float:
+        return 1 / number
+
+    factory(0)
+    factory(0)
+    assert (cache.hits, cache.misses) == (0, 2)
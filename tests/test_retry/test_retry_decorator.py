@@ -0,0 +1,170 @@
+import time
+
+import anyio
+import pytest
+
+from returns.future import FutureResult
+from returns.io import IOFailure, IOResult, IOSuccess
+from returns.result import Failure, Result, Success
+from returns.retry import Backoff, RetryBudget, retry
+
+_NO_DELAY = Backoff(initial=0, jitter=False)
+
+
+class _Unstable:
+    """Fails given number of times, then succeeds."""
+
+    def __init__(self, failures: int, error: str = 'error') -> None:
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, number: int) -> Result[int, str]:
+        self.calls += 1
+        if self.calls > self.failures:
+            return Success(number)
+        return Failure(self.error)
+
+
+@pytest.mark.parametrize(
+    ('failures', 'max_attempts', 'expected', 'calls'),
+    [
+        (0, 3, Success(1), 1),
+        (2, 3, Success(1), 3),
+        (3, 3, Failure('error'), 3),
+        (3, 1, Failure('error'), 1),
+    ],
+)
+def test_retry_result(failures, max_attempts, expected, calls):
+    """Ensures that ``Result`` functions are retried."""
+    function = _Unstable(failures)
+
+    retried = retry(max_attempts=max_attempts, backoff=_NO_DELAY)(function)
+
+    assert retried(1) == expected
+    assert function.calls == calls
+
+
+def test_retry_ioresult():
+    """Ensures that ``IOResult`` functions are retried."""
+    function = _Unstable(2)
+
+    @retry(backoff=_NO_DELAY, when=lambda error: error == 'error')
+    def factory(number: int) -> IOResult[int, str]:
+        return IOResult.from_result(function(number))
+
+    assert factory(1) == IOSuccess(1)
+    assert function.calls == 3
+
+
+def test_retry_predicate():
+    """Ensures that only matching failures are retried."""
+    function = _Unstable(2, error='fatal')
+
+    retried = retry(
+        backoff=_NO_DELAY,
+        when=lambda error: error != 'fatal',
+    )(function)
+
+    assert retried(1) == Failure('fatal')
+    assert function.calls == 1
+
+
+def test_retry_max_elapsed():
+    """Ensures that we do not retry after ``max_elapsed`` seconds."""
+    function = _Unstable(5)
+
+    retried = retry(
+        max_attempts=10,
+        max_elapsed=0.12,
+        backoff=Backoff(initial=0.05, multiplier=1, jitter=False),
+    )(function)
+
+    assert retried(1) == Failure('error')
+    assert function.calls == 3
+
+
+def test_retry_max_elapsed_first_attempt():
+    """Ensures that ``max_elapsed`` counts the first attempt."""
+    function = _Unstable(5)
+
+    @retry(
+        max_elapsed=0.15,
+        backoff=Backoff(initial=0.1, jitter=False),
+    )
+    def factory(number: int) -> Result[int, str]:
+        time.sleep(0.1)
+        return function(number)
+
+    assert factory(1) == Failure('error')
+    assert function.calls == 1
+
+
+def test_retry_budget():
+    """Ensures that retries are limited by a shared budget."""
+    budget = RetryBudget(capacity=3, refill_rate=0)
+    first = _Unstable(2)
+    second = _Unstable(2)
+
+    retried = retry(backoff=_NO_DELAY, budget=budget)
+
+    assert retried(first)(1) == Success(1)
+    assert retried(second)(1) == Failure('error')
+    assert first.calls == 3
+    assert second.calls == 2
+
+
+def test_retry_budget_refill():
+    """Ensures that budget tokens are refilled over time."""
+    budget = RetryBudget(capacity=1, refill_rate=1_000)
+
+    assert budget.acquire()
+    anyio.run(anyio.sleep, 0.01)
+    assert budget.acquire()
+
+
+def test_backoff_delay():
+    """Ensures that delays grow exponentially and are capped."""
+    backoff = Backoff(initial=1, multiplier=3, maximum=10, jitter=False)
+    jitter = Backoff(initial=1, multiplier=3, maximum=10)
+
+    delays = [backoff.delay(attempt) for attempt in range(1, 5)]
+    jittered = [jitter.delay(attempt) for attempt in range(1, 5)]
+
+    assert delays == [1, 3, 9, 10]
+    assert all(0 <= delay <= 10 for delay in jittered)
+
+
+def test_retry_wrong_attempts():
+    """Ensures that at least one attempt is required."""
+    with pytest.raises(ValueError, match='at least one attempt'):
+        retry(max_attempts=0)
+
+
+@pytest.mark.anyio
+async def test_retry_future_result():
+    """Ensures that ``FutureResult`` functions are retried lazily."""
+    function = _Unstable(2)
+
+    @retry(backoff=Backoff(initial=0.001))
+    def factory(number: int) -> FutureResult[int, str]:
+        return FutureResult.from_result(function(number))
+
+    container = factory(1)
+
+    assert function.calls == 1
+    assert await container == IOSuccess(1)
+    assert function.calls == 3
+
+
+@pytest.mark.anyio
+async def test_retry_future_result_failure():
+    """Ensures that the last ``FutureResult`` failure is returned."""
+    function = _Unstable(5)
+
+    @retry(max_attempts=2, backoff=_NO_DELAY)
+    def factory(number: int) -> FutureResult[int, str]:
+        return FutureResult.from_result(function(number))
+
+    assert await factory(1) == IOFailure('error')
+    assert function.calls == 2